@@ -1,25 +1,490 @@
 """
 Disk Scheduling Algorithms Implementation
-Contains: FCFS, SCAN, C-SCAN, LOOK, C-LOOK
+Contains: FCFS, SSTF, SCAN, C-SCAN, LOOK, C-LOOK, DEADLINE, ANTICIPATORY
 """
 
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import chain, islice
+
+from profiling import instrument
+from sequences import RunLengthSequence
+from sorted_buckets import SortedBuckets
+
+# Seek-ordering algorithms with closed forms or a single greedy walk; the
+# default set of the batch evaluators
+CLASSIC_ALGORITHMS = ('FCFS', 'SSTF', 'SCAN', 'C-SCAN', 'LOOK', 'C-LOOK')
+
+# Algorithms driven by deadline_order()
+DEADLINE_ALGORITHMS = ('DEADLINE', 'ANTICIPATORY')
+
+ALGORITHM_NAMES = CLASSIC_ALGORITHMS + DEADLINE_ALGORITHMS
+
+# Bump whenever a change alters any algorithm's sequence or seek count;
+# persistent result caches treat entries from other versions as stale
+ALGORITHM_VERSION = 2
+
+SORT_BACKENDS = ('auto', 'comparison', 'counting')
+
+# Requests per cylinder from which 'auto' switches to counting sort, or None
+# to always sort by comparison. The list engine's counting pass breaks even
+# with sorted() at about 1 request per cylinder (1M on 1M: 0.86s counting vs
+# 1.11s sorting) and wins clearly from 2 (2M on 1M: 1.39s vs 2.12s)
+COUNTING_SORT_MIN_RATIO = 2
+
+# update_requests() rebuilds instead of editing beyond this many changes
+MAX_INCREMENTAL_EDITS = 1000
+
+# Deadline scheduling: every request is queued at time 0 and expires after
+# this many full-stroke sweeps of head travel
+DEADLINE_EXPIRE_SWEEPS = 2
+
+# Requests dispatched in elevator order between two expiry checks
+DEADLINE_FIFO_BATCH = 16
+
+# Anticipatory variant: backward seeks up to this fraction of the disk are
+# taken when shorter than the forward seek divided by the penalty
+BACK_SEEK_MAX_FRACTION = 1 / 32
+BACK_SEEK_PENALTY = 2
+
+# Wait-time percentiles reported by wait_metrics()
+WAIT_PERCENTILES = (50, 95, 99)
+
+
+def closed_form_seek(algo_name, head_start, disk_size, is_right,
+                     has_left, left_min, left_max, has_right, right_min, right_max):
+    """
+    Total seek distance of a SCAN-family algorithm from request extremes
+
+    The total only depends on the head, the disk end and the smallest and
+    largest request on each side of the head. Flags are 0/1 integers so the
+    same expression works for scalars and for NumPy arrays of scenarios.
+
+    Args:
+        algo_name (str): 'SCAN', 'C-SCAN', 'LOOK' or 'C-LOOK'
+        head_start (int): Initial head position
+        disk_size (int): Total number of cylinders
+        is_right (int): 1 if the head starts moving right, else 0
+        has_left (int): 1 if any request lies below the head, else 0
+        left_min (int): Smallest request below the head (any value if none)
+        left_max (int): Largest request below the head (any value if none)
+        has_right (int): 1 if any request lies at or above the head, else 0
+        right_min (int): Smallest request at or above the head (any value if none)
+        right_max (int): Largest request at or above the head (any value if none)
+
+    Returns:
+        int: Total seek count, identical to the matching DiskScheduler method
+    """
+    h = head_start
+    end = disk_size - 1
+    no_left = 1 - has_left
+    no_right = 1 - has_right
+
+    if algo_name == 'SCAN':
+        going_right = (end - h) + has_left * (end - left_min)
+        going_left = h + has_right * right_max
+    elif algo_name == 'C-SCAN':
+        going_right = (end - h) + end + has_left * left_max
+        going_left = h + end + has_right * (end - right_min)
+    elif algo_name == 'LOOK':
+        going_right = (has_right * ((right_max - h) + has_left * (right_max - left_min))
+                       + no_right * has_left * (h - left_min))
+        going_left = (has_left * ((h - left_min) + has_right * (right_max - left_min))
+                      + no_left * has_right * (right_max - h))
+    elif algo_name == 'C-LOOK':
+        going_right = (has_right * ((right_max - h)
+                                    + has_left * ((right_max - left_min) + (left_max - left_min)))
+                       + no_right * has_left * (left_max - left_min))
+        going_left = (has_left * ((h - left_max)
+                                  + has_right * ((right_max - left_max) + (right_max - right_min)))
+                      + no_left * has_right * (right_max - right_min))
+    else:
+        raise ValueError(f"No closed form for algorithm '{algo_name}'")
+
+    return is_right * going_right + (1 - is_right) * going_left
+
+
+def sstf_order(left, right, head_start, moving_right):
+    """
+    Yield cylinders in Shortest Seek Time First service order
+
+    Serviced requests always form a contiguous run of the sorted index
+    around the head's bisect position, so the closest pending request is
+    one of the two neighbours just outside that run. Each step compares
+    those two pointers and moves one outward, giving O(n log n) overall
+    (the sort) instead of O(n^2). Ties go to the current travel direction.
+
+    Args:
+        left (list): Ascending requests below the head
+        right (list): Ascending requests at or above the head
+        head_start (int): Initial head position
+        moving_right (bool): Initial travel direction, used to break ties
+
+    Yields:
+        int: Serviced cylinders in order (head position excluded)
+    """
+    i = len(left) - 1
+    j = 0
+    position = head_start
+
+    while i >= 0 or j < len(right):
+        if i < 0:
+            go_right = True
+        elif j >= len(right):
+            go_right = False
+        else:
+            left_distance = position - left[i]
+            right_distance = right[j] - position
+            go_right = (right_distance < left_distance or
+                        (right_distance == left_distance and moving_right))
+
+        target = right[j] if go_right else left[i]
+        if target != position:
+            moving_right = go_right
+        position = target
+        if go_right:
+            j += 1
+        else:
+            i -= 1
+        yield position
+
+
+def _find(links, i):
+    """Follow skip links to the first live slot (path halving)"""
+    while links[i] != i:
+        links[i] = links[links[i]]
+        i = links[i]
+    return i
+
+
+def deadline_order(requests, order, head_start, moving_right, expire,
+                   fifo_batch=DEADLINE_FIFO_BATCH, back_seek_max=None,
+                   back_seek_penalty=BACK_SEEK_PENALTY):
+    """
+    Yield cylinders in deadline (or anticipatory) service order
+
+    Pending requests are kept in two structures: the sorted index, where
+    serviced slots are skipped with union-find links in both directions,
+    and a heap of (deadline, arrival) expiry entries with lazy deletion.
+    Requests are dispatched in one-way elevator order (wrapping around
+    like C-LOOK) in batches of fifo_batch. Before each batch the oldest
+    pending request is checked; once its deadline has passed the head
+    jumps to it and the batch continues from there. Time is the distance
+    the head has travelled, so every request is guaranteed service soon
+    after expire cylinders of movement instead of starving.
+
+    With back_seek_max set (the anticipatory variant) the head also looks
+    at the nearest request behind it and takes it when it lies within
+    back_seek_max and is closer than the forward candidate by
+    back_seek_penalty, keeping the head near recently serviced cylinders.
+    When nothing lies ahead it works backwards instead of wrapping.
+
+    Args:
+        requests (list): Cylinders in arrival order
+        order (list): Request indices sorted by (cylinder, arrival)
+        head_start (int): Initial head position
+        moving_right (bool): Elevator direction
+        expire (int): Head travel after which a request is overdue
+        fifo_batch (int): Requests dispatched between expiry checks
+        back_seek_max (int): Longest backward seek taken, or None for plain
+            deadline scheduling
+        back_seek_penalty (float): Weight of backward seek distances
+
+    Yields:
+        int: Serviced cylinders in order (head position excluded)
+    """
+    n = len(order)
+    cylinders = [requests[i] for i in order]
+    slot_of = [0] * n
+    for slot, index in enumerate(order):
+        slot_of[index] = slot
+
+    # next_free[i]: first live slot >= i (n when none); prev_free[i + 1]:
+    # last live slot <= i, stored shifted by one (0 when none)
+    next_free = list(range(n + 1))
+    prev_free = list(range(n + 1))
+    expiry = [(expire, index) for index in range(n)]
+    serviced = [False] * n
+
+    position = head_start
+    now = 0
+    batch = 0
+    for _ in range(n):
+        slot = None
+        if batch == 0:
+            batch = fifo_batch
+            while serviced[expiry[0][1]]:
+                heapq.heappop(expiry)
+            deadline, index = expiry[0]
+            if deadline <= now:
+                slot = slot_of[index]
+
+        if slot is None:
+            if moving_right:
+                split = bisect_left(cylinders, position)
+                ahead = _find(next_free, split)
+                has_ahead = ahead < n
+            else:
+                split = bisect_right(cylinders, position)
+                ahead = _find(prev_free, split) - 1
+                has_ahead = ahead >= 0
+
+            if back_seek_max is None:
+                if has_ahead:
+                    slot = ahead
+                else:
+                    # Wrap around to the far end
+                    slot = _find(next_free, 0) if moving_right else _find(prev_free, n) - 1
+            else:
+                if moving_right:
+                    behind = _find(prev_free, split) - 1
+                    has_behind = behind >= 0
+                else:
+                    behind = _find(next_free, split)
+                    has_behind = behind < n
+
+                if not has_ahead:
+                    slot = behind
+                elif has_behind:
+                    back = abs(position - cylinders[behind])
+                    forward = abs(cylinders[ahead] - position)
+                    take_back = back <= back_seek_max and back * back_seek_penalty < forward
+                    slot = behind if take_back else ahead
+                else:
+                    slot = ahead
+
+        cylinder = cylinders[slot]
+        serviced[order[slot]] = True
+        next_free[slot] = slot + 1
+        prev_free[slot + 1] = slot
+        now += abs(cylinder - position)
+        position = cylinder
+        batch -= 1
+        yield cylinder
+
+
+def deadline_parameters(algo_name, disk_size):
+    """
+    Expiry and back-seek limits of a deadline-family algorithm for a disk
+
+    Args:
+        algo_name (str): 'DEADLINE' or 'ANTICIPATORY'
+        disk_size (int): Total number of cylinders
+
+    Returns:
+        tuple: (expire, back_seek_max) for deadline_order(); back_seek_max
+            is None for plain DEADLINE
+    """
+    expire = DEADLINE_EXPIRE_SWEEPS * max(disk_size - 1, 1)
+    if algo_name == 'ANTICIPATORY':
+        return expire, max(1, int(disk_size * BACK_SEEK_MAX_FRACTION))
+    return expire, None
+
+
+def wait_ranks(count):
+    """
+    Nearest-rank positions of WAIT_PERCENTILES among count sorted waits
+
+    Returns:
+        dict: 'wait_p<percentile>' -> index into the sorted waits
+    """
+    return {f'wait_p{p}': max(0, -(-p * count // 100) - 1) for p in WAIT_PERCENTILES}
+
+
+def wait_metrics(chunks, requests):
+    """
+    Tail latency of a schedule, measured in head travel
+
+    A request waits for the distance the head travels before reaching
+    it. Visits are matched to requests per cylinder (Counter-based), so
+    SCAN end points and C-SCAN returns count as travel but not as
+    service. Head travel only grows along the sequence, so the waits come
+    out already sorted and the percentiles are read in one streaming pass.
+
+    Args:
+        chunks (iterable): Consecutive slices of the sequence, starting with
+            the head position
+        requests (iterable): The scheduled requests
+
+    Returns:
+        dict: wait_p50, wait_p95, wait_p99 (nearest rank) and wait_max, in
+            cylinders travelled
+    """
+    remaining = Counter(requests)
+    names_at = {}
+    for name, rank in wait_ranks(sum(remaining.values())).items():
+        names_at.setdefault(rank, []).append(name)
+    waits = {f'wait_p{p}': 0 for p in WAIT_PERCENTILES}
+    waits['wait_max'] = 0
+
+    position = None
+    travelled = 0
+    serviced = 0
+    for chunk in chunks:
+        for cylinder in chunk:
+            cylinder = int(cylinder)
+            if position is None:
+                position = cylinder
+                continue
+            travelled += abs(cylinder - position)
+            position = cylinder
+            if remaining[cylinder]:
+                remaining[cylinder] -= 1
+                for name in names_at.get(serviced, ()):
+                    waits[name] = travelled
+                serviced += 1
+                waits['wait_max'] = travelled
+    return waits
+
+
+def walk_seek(cylinders, head_start):
+    """
+    Total seek distance of a walk over serviced cylinders
+
+    Args:
+        cylinders (iterable): Serviced cylinders in order (head position excluded)
+        head_start (int): Initial head position
+
+    Returns:
+        int: Sum of the distances between consecutive positions
+    """
+    seek_count = 0
+    position = head_start
+    for cylinder in cylinders:
+        seek_count += abs(cylinder - position)
+        position = cylinder
+    return seek_count
+
+
+def _path_length(cylinders):
+    """Total distance along a list of cylinders"""
+    return sum(abs(b - a) for a, b in zip(cylinders, cylinders[1:]))
+
+
 class DiskScheduler:
     """Core implementation of disk scheduling algorithms"""
 
-    def __init__(self, requests, head_start, disk_size, direction='right'):
+    # Requests per cylinder from which sort_backend='auto' counts (None: never)
+    counting_sort_min_ratio = COUNTING_SORT_MIN_RATIO
+
+    def __init__(self, requests, head_start, disk_size, direction='right', sort_backend='auto',
+                 cost_model=None):
         """
         Initialize the disk scheduler
 
         Args:
-            requests (list): List of cylinder requests
+            requests (array-like): Cylinder requests (list or ndarray)
             head_start (int): Initial head position
             disk_size (int): Total number of cylinders
             direction (str): Initial direction ('right' or 'left')
+            sort_backend (str): 'comparison', 'counting', or 'auto' to pick
+                counting sort when requests outnumber cylinders by
+                counting_sort_min_ratio
+            cost_model (CostModel): Optional model (see cost_models) adding
+                service_time_ms, avg_service_time_ms and iops to results
         """
-        self.requests = requests.copy()
+        # Arrays (e.g. parsed or loaded traces) become a list of plain ints,
+        # which the list-based walks and queue edits rely on
+        self.requests = requests.tolist() if hasattr(requests, 'tolist') else list(requests)
         self.head_start = head_start
         self.disk_size = disk_size
         self.direction = direction.lower()
+        self.sort_backend = validate_sort_backend(sort_backend)
+        self.cost_model = cost_model
+        self._sorted_index = None
+        self._sorted_buckets = None
+        self._fcfs_total = None
+        self._walk_orders = {}
+
+    def _use_counting_sort(self):
+        """Whether the sorted index should be built with a counting pass"""
+        if self.sort_backend == 'auto':
+            ratio = self.counting_sort_min_ratio
+            return ratio is not None and len(self.requests) >= self.disk_size * ratio
+        return self.sort_backend == 'counting'
+
+    def _partition(self):
+        """
+        Split requests around the head position using a cached sorted index
+
+        The request set is sorted once per scheduler instance and the two
+        halves are shared by every algorithm, so get_all_results() and
+        get_best_algorithm() do not repeat the O(n log n) work. After
+        incremental edits the halves are read back from the edited index
+        in O(n) instead of sorting again.
+
+        Returns:
+            tuple: (left, right) ascending lists of requests below / at-or-above head
+        """
+        if self._sorted_index is None:
+            if self._sorted_buckets is not None:
+                self._sorted_index = tuple(self._flatten(half) for half in self._sorted_buckets)
+            else:
+                self._sorted_index = self._build_index()
+        return self._sorted_index
+
+    def _build_index(self):
+        """Sort the requests into (left, right) halves"""
+        if self._use_counting_sort():
+            return self._counting_partition()
+        ordered = sorted(self.requests)
+        split = bisect_left(ordered, self.head_start)
+        return ordered[:split], ordered[split:]
+
+    def _flatten(self, half):
+        """Flat sorted half read from a SortedBuckets half"""
+        return list(half)
+
+    def _bucket_values(self, half):
+        """Values of a flat sorted half as Python ints"""
+        return half
+
+    def _edit_index(self):
+        """
+        Sorted halves as SortedBuckets for incremental edits
+
+        The flat halves are split into buckets on the first edit (O(n)).
+        Every later edit changes only the buckets in O(log n); the flat
+        halves are dropped and rebuilt from the buckets when an algorithm
+        needs them again.
+
+        Returns:
+            tuple: (left, right) SortedBuckets, or None while no index is built
+        """
+        if self._sorted_buckets is None:
+            if self._sorted_index is None:
+                return None
+            self._sorted_buckets = tuple(SortedBuckets(self._bucket_values(half))
+                                         for half in self._sorted_index)
+        self._sorted_index = None
+        return self._sorted_buckets
+
+    def _counting_partition(self):
+        """
+        Build the sorted halves with a counting pass instead of a comparison sort
+
+        Requests are counted into one slot per cylinder (O(n)) and the
+        slots are walked in cylinder order, expanding each non-empty one,
+        so the cost is O(n + disk_size) rather than O(n log n).
+
+        Returns:
+            tuple: (left, right) ascending lists of requests below / at-or-above head
+        """
+        counts = [0] * self.disk_size
+        for cylinder in self.requests:
+            counts[cylinder] += 1
+
+        split = min(max(self.head_start, 0), self.disk_size)
+        left = []
+        for cylinder in range(split):
+            if counts[cylinder]:
+                left += [cylinder] * counts[cylinder]
+        right = []
+        for cylinder in range(split, self.disk_size):
+            if counts[cylinder]:
+                right += [cylinder] * counts[cylinder]
+        return left, right
 
     def fcfs(self):
         """
@@ -43,6 +508,97 @@ class DiskScheduler:
             'avg_seek_time': seek_count / len(self.requests) if self.requests else 0
         }
 
+    def _sstf_halves(self):
+        """Sorted halves (left, right) used by the SSTF walk"""
+        return self._partition()
+
+    def _sstf_walk(self):
+        """Yield cylinders in SSTF service order (see sstf_order)"""
+        left, right = self._sstf_halves()
+        return sstf_order(left, right, self.head_start, self.direction == 'right')
+
+    def sstf(self):
+        """
+        Shortest Seek Time First (SSTF) Algorithm
+        Always services the pending request closest to the head
+
+        Returns:
+            dict: Contains sequence, seek_count, and avg_seek_time
+        """
+        return self._walk_result(self._walk_order('SSTF'))
+
+    def _deadline_inputs(self):
+        """Requests in arrival order and their indices sorted by (cylinder, arrival)"""
+        return self.requests, sorted(range(len(self.requests)), key=self.requests.__getitem__)
+
+    def _deadline_walk(self, algo_name):
+        """Yield cylinders in DEADLINE or ANTICIPATORY service order (see deadline_order)"""
+        requests, order = self._deadline_inputs()
+        expire, back_seek_max = deadline_parameters(algo_name, self.disk_size)
+        return deadline_order(requests, order, self.head_start, self.direction == 'right',
+                              expire, DEADLINE_FIFO_BATCH, back_seek_max)
+
+    def _walk_order(self, algo_name):
+        """
+        Service order of SSTF or a deadline-family algorithm
+
+        These walks are sequential, so each one is run once per request
+        queue and the order is kept; results, metrics, cost estimates,
+        sequence streams and latency all read the stored order instead of
+        repeating the walk.
+
+        Args:
+            algo_name (str): 'SSTF', 'DEADLINE' or 'ANTICIPATORY'
+
+        Returns:
+            list: Serviced cylinders in order (head position excluded)
+        """
+        order = self._walk_orders.get(algo_name)
+        if order is None:
+            walk = self._sstf_walk() if algo_name == 'SSTF' else self._deadline_walk(algo_name)
+            order = self._walk_orders[algo_name] = self._materialize(walk)
+        return order
+
+    def _materialize(self, cylinders):
+        """Store an iterable of serviced cylinders"""
+        return list(cylinders)
+
+    def _walk_seek(self, cylinders):
+        """Total seek distance from the head over an iterable of serviced cylinders"""
+        return walk_seek(cylinders, self.head_start)
+
+    def _walk_result(self, cylinders):
+        """Result of a schedule given as an iterable of serviced cylinders"""
+        sequence = [self.head_start]
+        sequence.extend(cylinders)
+        seek_count = self._walk_seek(islice(sequence, 1, None))
+
+        return {
+            'sequence': sequence,
+            'seek_count': seek_count,
+            'avg_seek_time': seek_count / len(self.requests) if self.requests else 0
+        }
+
+    def deadline(self):
+        """
+        Deadline Algorithm
+        One-way elevator in batches; overdue requests are serviced first
+
+        Returns:
+            dict: Contains sequence, seek_count, and avg_seek_time
+        """
+        return self._walk_result(self._walk_order('DEADLINE'))
+
+    def anticipatory(self):
+        """
+        Anticipatory Algorithm
+        Deadline scheduling that also takes short backward seeks
+
+        Returns:
+            dict: Contains sequence, seek_count, and avg_seek_time
+        """
+        return self._walk_result(self._walk_order('ANTICIPATORY'))
+
     def scan(self):
         """
         SCAN (Elevator) Algorithm
@@ -52,8 +608,8 @@ class DiskScheduler:
             dict: Contains sequence, seek_count, and avg_seek_time
         """
         # Separate requests based on head position
-        left = sorted([r for r in self.requests if r < self.head_start], reverse=True)
-        right = sorted([r for r in self.requests if r >= self.head_start])
+        left, right = self._partition()
+        left = left[::-1]
 
         sequence = [self.head_start]
         seek_count = 0
@@ -117,9 +673,8 @@ class DiskScheduler:
         Returns:
             dict: Contains sequence, seek_count, and avg_seek_time
         """
-        # Separate and sort requests
-        left = sorted([r for r in self.requests if r < self.head_start])
-        right = sorted([r for r in self.requests if r >= self.head_start])
+        # Separate requests
+        left, right = self._partition()
 
         sequence = [self.head_start]
         seek_count = 0
@@ -181,9 +736,9 @@ class DiskScheduler:
         Returns:
             dict: Contains sequence, seek_count, and avg_seek_time
         """
-        # Separate and sort requests
-        left = sorted([r for r in self.requests if r < self.head_start], reverse=True)
-        right = sorted([r for r in self.requests if r >= self.head_start])
+        # Separate requests (left in descending order)
+        left, right = self._partition()
+        left = left[::-1]
 
         sequence = [self.head_start]
         seek_count = 0
@@ -233,9 +788,8 @@ class DiskScheduler:
         Returns:
             dict: Contains sequence, seek_count, and avg_seek_time
         """
-        # Separate and sort requests
-        left = sorted([r for r in self.requests if r < self.head_start])
-        right = sorted([r for r in self.requests if r >= self.head_start])
+        # Separate requests
+        left, right = self._partition()
 
         sequence = [self.head_start]
         seek_count = 0
@@ -287,28 +841,531 @@ class DiskScheduler:
             'avg_seek_time': seek_count / len(self.requests) if self.requests else 0
         }
 
-    def get_all_results(self):
+    def _reversed(self, half):
+        """Iterate a sorted half in descending order without copying it"""
+        return reversed(half)
+
+    def _sequence_parts(self, algo_name):
+        """
+        Describe an algorithm's sequence as consecutive parts
+
+        Concatenating the parts gives exactly the sequence returned by the
+        matching algorithm method, but nothing is copied or materialized.
+
+        Args:
+            algo_name (str): Algorithm name (see ALGORITHM_NAMES)
+
+        Returns:
+            list: Iterables of cylinders in service order
+        """
+        head = [self.head_start]
+        end = self.disk_size - 1
+        going_right = self.direction == 'right'
+
+        if algo_name == 'FCFS':
+            return [head, self.requests]
+        if algo_name == 'SSTF' or algo_name in DEADLINE_ALGORITHMS:
+            return [head, self._walk_order(algo_name)]
+
+        left, right = self._partition()
+        if algo_name == 'SCAN':
+            if going_right:
+                return [head, right, [end], self._reversed(left)]
+            return [head, self._reversed(left), [0], right]
+        if algo_name == 'C-SCAN':
+            if going_right:
+                return [head, right, [end, 0], left]
+            return [head, left, [0, end], right]
+        if algo_name == 'LOOK':
+            if going_right:
+                return [head, right, self._reversed(left)]
+            return [head, self._reversed(left), right]
+        if algo_name == 'C-LOOK':
+            if going_right:
+                return [head, right, left]
+            return [head, left, right]
+        raise ValueError(f"Unknown algorithm '{algo_name}'")
+
+    def iter_sequence(self, algo_name):
+        """
+        Lazily yield the seek sequence of one algorithm
+
+        Only the shared sorted index (and the stored service order of SSTF
+        and the deadline family, see _walk_order) is held in memory, so
+        schedules can be consumed (exported, plotted, summed) without
+        building the sequence.
+
+        Args:
+            algo_name (str): Algorithm name (see ALGORITHM_NAMES)
+
+        Returns:
+            iterator: Cylinder numbers, starting with the head position
+        """
+        return chain.from_iterable(self._sequence_parts(algo_name))
+
+    def iter_sequence_chunks(self, algo_name, chunk_size=65536):
+        """
+        Lazily yield the seek sequence of one algorithm in chunks
+
+        Args:
+            algo_name (str): Algorithm name (see ALGORITHM_NAMES)
+            chunk_size (int): Maximum number of cylinders per chunk
+
+        Yields:
+            list: Consecutive slices of the sequence
+        """
+        cylinders = self.iter_sequence(algo_name)
+        while True:
+            chunk = list(islice(cylinders, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    @instrument()
+    def get_result(self, algo_name, compact=False):
+        """
+        Calculate the result of one algorithm selected by name
+
+        Args:
+            algo_name (str): Algorithm name (see ALGORITHM_NAMES)
+            compact (bool): Store the sequence as a RunLengthSequence
+
+        Returns:
+            dict: Contains sequence, seek_count, and avg_seek_time
+        """
+        if compact:
+            return self._compact_result(algo_name)
+
+        methods = {
+            'FCFS': self.fcfs,
+            'SSTF': self.sstf,
+            'SCAN': self.scan,
+            'C-SCAN': self.cscan,
+            'LOOK': self.look,
+            'C-LOOK': self.clook,
+            'DEADLINE': self.deadline,
+            'ANTICIPATORY': self.anticipatory
+        }
+        if algo_name not in methods:
+            raise ValueError(f"Unknown algorithm '{algo_name}'")
+        return self._with_cost(algo_name, methods[algo_name]())
+
+    def _with_cost(self, algo_name, result):
+        """
+        Add the cost model's service time estimate to a result
+
+        The estimate is taken from the sequence actually emitted (the
+        result's own sequence when present, otherwise streamed), so it
+        reflects every movement including SCAN end waypoints and C-SCAN
+        return sweeps.
+        """
+        if self.cost_model is None:
+            return result
+        sequence = result.get('sequence')
+        chunks = self.iter_sequence_chunks(algo_name) if sequence is None else [sequence]
+        result.update(self.cost_model.cost_metrics(chunks, self.disk_size, len(self.requests)))
+        return result
+
+    def _compact_result(self, algo_name):
+        """
+        Result with a run-length encoded sequence
+
+        The sequence is compressed while streaming from iter_sequence_chunks(),
+        so the expanded list is never built.
+        """
+        result = self.get_metrics(algo_name)
+        result['sequence'] = RunLengthSequence.from_chunks(self.iter_sequence_chunks(algo_name))
+        return result
+
+    @instrument()
+    def get_all_results(self, compact=False):
         """
         Calculate results for all algorithms
 
+        Args:
+            compact (bool): Store sequences as RunLengthSequence objects
+
         Returns:
-            dict: Results for all 5 algorithms
+            dict: Results for all algorithms in ALGORITHM_NAMES
         """
-        return {
+        if compact:
+            return {name: self._compact_result(name) for name in ALGORITHM_NAMES}
+
+        results = {
             'FCFS': self.fcfs(),
+            'SSTF': self.sstf(),
             'SCAN': self.scan(),
             'C-SCAN': self.cscan(),
             'LOOK': self.look(),
-            'C-LOOK': self.clook()
+            'C-LOOK': self.clook(),
+            'DEADLINE': self.deadline(),
+            'ANTICIPATORY': self.anticipatory()
         }
+        return {name: self._with_cost(name, result) for name, result in results.items()}
 
-    def get_best_algorithm(self):
+    def _extremes(self):
+        """
+        Find the smallest and largest request on each side of the head
+
+        Uses the sorted index when it has already been built (or edited),
+        otherwise a single O(n) pass without sorting or allocating.
+
+        Returns:
+            tuple: (left_min, left_max, right_min, right_max); None for an empty side
+        """
+        index = self._sorted_index if self._sorted_index is not None else self._sorted_buckets
+        if index is not None:
+            left, right = index
+            return (left[0] if left else None, left[-1] if left else None,
+                    right[0] if right else None, right[-1] if right else None)
+
+        left_min = left_max = right_min = right_max = None
+        for r in self.requests:
+            if r < self.head_start:
+                if left_min is None or r < left_min:
+                    left_min = r
+                if left_max is None or r > left_max:
+                    left_max = r
+            else:
+                if right_min is None or r < right_min:
+                    right_min = r
+                if right_max is None or r > right_max:
+                    right_max = r
+        return left_min, left_max, right_min, right_max
+
+    def _fcfs_seek(self):
+        """Total FCFS seek distance computed without building the sequence"""
+        return self._walk_seek(self.requests)
+
+    def _sstf_seek(self):
+        """Total SSTF seek distance computed without building the sequence"""
+        return self._walk_seek(self._walk_order('SSTF'))
+
+    def _deadline_seek(self, algo_name):
+        """Total DEADLINE/ANTICIPATORY seek distance computed without building the sequence"""
+        return self._walk_seek(self._walk_order(algo_name))
+
+    def get_metrics(self, algo_name):
+        """
+        Calculate seek metrics for one algorithm without building its sequence
+
+        Args:
+            algo_name (str): Algorithm name (see ALGORITHM_NAMES)
+
+        Returns:
+            dict: Contains seek_count and avg_seek_time
+        """
+        if algo_name == 'FCFS':
+            if self._fcfs_total is None:
+                self._fcfs_total = self._fcfs_seek()
+            seek_count = self._fcfs_total
+        elif algo_name == 'SSTF':
+            seek_count = self._sstf_seek()
+        elif algo_name in DEADLINE_ALGORITHMS:
+            seek_count = self._deadline_seek(algo_name)
+        else:
+            left_min, left_max, right_min, right_max = self._extremes()
+            seek_count = closed_form_seek(
+                algo_name,
+                self.head_start,
+                self.disk_size,
+                int(self.direction == 'right'),
+                int(left_min is not None), left_min or 0, left_max or 0,
+                int(right_min is not None), right_min or 0, right_max or 0
+            )
+        n = len(self.requests)
+        return self._with_cost(algo_name, {
+            'seek_count': seek_count,
+            'avg_seek_time': seek_count / n if n else 0
+        })
+
+    def get_all_metrics(self):
+        """
+        Calculate seek metrics for all algorithms without building sequences
+
+        Returns:
+            dict: Metrics for all algorithms (same keys as get_all_results)
+        """
+        return {name: self.get_metrics(name) for name in ALGORITHM_NAMES}
+
+    def get_latency(self, algo_name, result=None):
+        """
+        Tail latency of one algorithm's schedule (see wait_metrics)
+
+        Args:
+            algo_name (str): Algorithm name (see ALGORITHM_NAMES)
+            result (dict): Result whose list or ndarray sequence is used
+                instead of streaming the schedule again
+
+        Returns:
+            dict: wait_p50, wait_p95, wait_p99 and wait_max in cylinders travelled
+        """
+        sequence = None if result is None else result.get('sequence')
+        if not isinstance(sequence, list):
+            return wait_metrics(self.iter_sequence_chunks(algo_name), self.requests)
+        return wait_metrics([sequence], self.requests)
+
+    def get_best_algorithm(self, results=None):
         """
         Determine the best algorithm based on seek count
 
+        Args:
+            results (dict): Precomputed output of get_all_results(); computed
+                when omitted
+
         Returns:
             tuple: (algorithm_name, result_dict)
         """
-        results = self.get_all_results()
+        if results is None:
+            results = self.get_all_results()
         best = min(results.items(), key=lambda x: x[1]['seek_count'])
-        return best
\ No newline at end of file
+        return best
+
+    def add_request(self, cylinder):
+        """
+        Queue one more request without rebuilding the scheduler
+
+        The cylinder is inserted into the bucketed sorted index in
+        O(log n) (see SortedBuckets) and the FCFS total grows by the one
+        new movement, so SCAN-family totals (which depend only on the side
+        extremes) are available immediately and the next results reuse
+        the index instead of re-sorting.
+
+        Args:
+            cylinder (int): Cylinder number to append to the queue
+        """
+        previous = self.requests[-1] if len(self.requests) else self.head_start
+        self._append_request(cylinder)
+        self._walk_orders.clear()
+
+        if self._fcfs_total is not None:
+            self._fcfs_total += abs(cylinder - int(previous))
+        index = self._edit_index()
+        if index is not None:
+            left, right = index
+            (left if cylinder < self.head_start else right).add(cylinder)
+
+    def remove_request(self, cylinder):
+        """
+        Remove the first queued request for a cylinder
+
+        Args:
+            cylinder (int): Cylinder number to remove
+
+        Raises:
+            ValueError: If the cylinder is not queued
+        """
+        self.pop_request(self._request_index(cylinder))
+
+    def pop_request(self, index=-1):
+        """
+        Remove the request at a queue position (see add_request)
+
+        The sorted index is updated in O(log n). Removing the last request
+        is O(1); other positions shift the rest of the arrival queue.
+
+        Args:
+            index (int): Position in the request queue
+
+        Returns:
+            int: Cylinder of the removed request
+
+        Raises:
+            IndexError: If the position is out of range
+        """
+        length = len(self.requests)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Request index out of range")
+
+        cylinder = int(self.requests[index])
+        if self._fcfs_total is not None:
+            previous = int(self.requests[index - 1]) if index else self.head_start
+            delta = -abs(cylinder - previous)
+            if index + 1 < length:
+                following = int(self.requests[index + 1])
+                delta += abs(following - previous) - abs(following - cylinder)
+            self._fcfs_total += delta
+
+        self._delete_request(index)
+        self._walk_orders.clear()
+        sorted_index = self._edit_index()
+        if sorted_index is not None:
+            left, right = sorted_index
+            (left if cylinder < self.head_start else right).remove(cylinder)
+        return cylinder
+
+    def update_requests(self, requests, max_edits=MAX_INCREMENTAL_EDITS):
+        """
+        Switch to an edited request queue, reusing cached state where possible
+
+        Edits that remove one contiguous block of requests, or replace the
+        tail of the queue (e.g. appending a few cylinders), are spliced into
+        the queue in one pass and applied to the sorted index in O(log n)
+        per changed request. Other edits, or more than max_edits changes,
+        reset the scheduler to the new queue.
+
+        Args:
+            requests (list): New request queue
+            max_edits (int): Largest number of single-request edits to apply
+
+        Returns:
+            bool: True if the queue was updated incrementally
+        """
+        self._walk_orders.clear()
+        old_length = len(self.requests)
+        prefix = self._common_prefix_length(requests)
+        removed = old_length - len(requests)
+
+        if removed > 0 and self._same_requests(self.requests[prefix + removed:], requests[prefix:]):
+            deleted = range(prefix, prefix + removed)
+            appended = []
+        else:
+            deleted = range(prefix, old_length)
+            appended = requests[prefix:]
+
+        if len(deleted) + len(appended) > max_edits:
+            self._reset_requests(requests)
+            self._sorted_index = None
+            self._sorted_buckets = None
+            self._fcfs_total = None
+            return False
+
+        self._apply_edits(deleted.start, deleted.stop, appended)
+        return True
+
+    def _apply_edits(self, start, stop, appended):
+        """
+        Replace requests[start:stop] with appended, updating cached state in bulk
+
+        Args:
+            start (int): First replaced queue position
+            stop (int): End of the replaced block (exclusive)
+            appended (list): Requests inserted at start
+        """
+        length = len(self.requests)
+        removed = [int(c) for c in self.requests[start:stop]]
+        added = [int(c) for c in appended]
+
+        if self._fcfs_total is not None:
+            previous = int(self.requests[start - 1]) if start else self.head_start
+            following = [int(self.requests[stop])] if stop < length else []
+            self._fcfs_total += (_path_length([previous] + added + following)
+                                 - _path_length([previous] + removed + following))
+
+        self._splice_requests(start, stop, appended)
+        index = self._edit_index()
+        if index is not None:
+            left, right = index
+            for cylinder in removed:
+                (left if cylinder < self.head_start else right).remove(cylinder)
+            for cylinder in added:
+                (left if cylinder < self.head_start else right).add(cylinder)
+
+    def _append_request(self, cylinder):
+        self.requests.append(cylinder)
+
+    def _delete_request(self, index):
+        del self.requests[index]
+
+    def _reset_requests(self, requests):
+        self.requests = list(requests)
+
+    def _request_index(self, cylinder):
+        return self.requests.index(cylinder)
+
+    def _common_prefix_length(self, requests):
+        """Number of leading requests shared with another queue"""
+        prefix = 0
+        for old, new in zip(self.requests, requests):
+            if old != new:
+                break
+            prefix += 1
+        return prefix
+
+    def _same_requests(self, a, b):
+        return list(a) == list(b)
+
+    def _splice_requests(self, start, stop, values):
+        self.requests[start:stop] = list(values)
+
+
+class SeekAccumulator:
+    """Running seek total over a stream of cylinders
+
+    Wraps any iterable of cylinder numbers (such as iter_sequence()) and
+    passes the cylinders through unchanged while summing the distance
+    between consecutive ones.
+    """
+
+    def __init__(self, cylinders):
+        """
+        Initialize the accumulator
+
+        Args:
+            cylinders (iterable): Cylinder numbers in service order
+        """
+        self._cylinders = iter(cylinders)
+        self._position = None
+        self.seek_count = 0
+        self.movements = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cylinder = next(self._cylinders)
+        if self._position is not None:
+            self.seek_count += abs(cylinder - self._position)
+            self.movements += 1
+        self._position = cylinder
+        return cylinder
+
+    def consume(self):
+        """
+        Exhaust the stream without storing it
+
+        Returns:
+            int: Total seek distance of the stream
+        """
+        for _ in self:
+            pass
+        return self.seek_count
+
+
+ENGINES = ('python', 'numpy')
+
+
+def validate_sort_backend(sort_backend):
+    """Validate a sort backend name"""
+    if sort_backend not in SORT_BACKENDS:
+        raise ValueError(f"Unknown sort backend '{sort_backend}' (expected one of {', '.join(SORT_BACKENDS)})")
+    return sort_backend
+
+
+def create_scheduler(requests, head_start, disk_size, direction='right', engine='python',
+                     sort_backend='auto', cost_model=None):
+    """
+    Create a disk scheduler backed by the selected engine
+
+    Args:
+        requests (array-like): Cylinder requests (list or ndarray)
+        head_start (int): Initial head position
+        disk_size (int): Total number of cylinders
+        direction (str): Initial direction ('right' or 'left')
+        engine (str): 'python' for list-based results, 'numpy' for the
+            vectorized engine returning ndarray sequences
+        sort_backend (str): 'auto', 'comparison' or 'counting'
+        cost_model (CostModel): Optional service time model (see cost_models)
+
+    Returns:
+        DiskScheduler: Scheduler instance for the chosen engine
+    """
+    if engine == 'python':
+        return DiskScheduler(requests, head_start, disk_size, direction, sort_backend, cost_model)
+    if engine == 'numpy':
+        from vectorized import VectorizedDiskScheduler
+        return VectorizedDiskScheduler(requests, head_start, disk_size, direction,
+                                       sort_backend=sort_backend, cost_model=cost_model)
+    raise ValueError(f"Unknown engine '{engine}' (expected one of {', '.join(ENGINES)})")
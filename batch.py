@@ -0,0 +1,200 @@
+"""
+Batch Disk Scheduling
+Scores many (head, direction, disk size) scenarios against one request set
+"""
+
+import numpy as np
+
+from algorithms import (CLASSIC_ALGORITHMS, DEADLINE_ALGORITHMS, DEADLINE_FIFO_BATCH, closed_form_seek,
+                        deadline_order, deadline_parameters, sstf_order, walk_seek)
+
+# Column layout of a scenario array
+HEAD_COLUMN = 0
+DIRECTION_COLUMN = 1
+DISK_SIZE_COLUMN = 2
+
+RIGHT = 1
+LEFT = 0
+
+
+def _direction_flag(direction):
+    """RIGHT/LEFT flag of a 'right'/'left' string (any case) or a flag"""
+    if isinstance(direction, str):
+        name = direction.lower()
+        if name in ('right', 'left'):
+            return RIGHT if name == 'right' else LEFT
+    elif direction in (RIGHT, LEFT):
+        return int(direction)
+    raise ValueError(f"Direction must be 'left' or 'right' (got {direction!r})")
+
+
+def make_scenarios(head_positions, directions, disk_sizes):
+    """
+    Build the full grid of scenarios from per-parameter values
+
+    Args:
+        head_positions (iterable): Initial head positions
+        directions (iterable): 'right'/'left' strings (any case) or
+            RIGHT/LEFT flags
+        disk_sizes (iterable): Disk sizes in cylinders
+
+    Returns:
+        ndarray: int64 array of shape (m, 3) with columns head, direction, disk size
+
+    Raises:
+        ValueError: If a direction is not recognized
+    """
+    flags = [_direction_flag(d) for d in directions]
+    heads, dirs, sizes = np.meshgrid(
+        np.asarray(list(head_positions), dtype=np.int64),
+        np.asarray(flags, dtype=np.int64),
+        np.asarray(list(disk_sizes), dtype=np.int64),
+        indexing='ij'
+    )
+    return np.column_stack([heads.ravel(), dirs.ravel(), sizes.ravel()])
+
+
+class BatchScheduler:
+    """Evaluate seek counts for a grid of scenarios in one call
+
+    The request set is sorted once. SCAN-family totals for all scenarios
+    are computed with the closed form on whole arrays (one searchsorted to
+    split every head position), and FCFS reuses a precomputed body sum.
+    """
+
+    def __init__(self, requests, sorted_requests=None):
+        """
+        Initialize the batch scheduler
+
+        Args:
+            requests (array-like): Cylinder requests in arrival order
+            sorted_requests (array-like): The same requests already sorted;
+                lets callers share one sort across several schedulers
+        """
+        self.requests = np.asarray(requests, dtype=np.int64)
+        if sorted_requests is None:
+            sorted_requests = np.sort(self.requests)
+        self.sorted_requests = np.asarray(sorted_requests, dtype=np.int64)
+        self._fcfs_body = int(np.abs(np.diff(self.requests)).sum()) if self.requests.size else 0
+
+    def evaluate(self, scenarios, algorithms=CLASSIC_ALGORITHMS):
+        """
+        Compute seek counts for every algorithm and scenario
+
+        Args:
+            scenarios (array-like): Shape (m, 3) array of head position,
+                direction (RIGHT=1 / LEFT=0) and disk size per row
+            algorithms (iterable): Algorithm names to evaluate. DEADLINE and
+                ANTICIPATORY are accepted but run one sequential O(n log n)
+                walk per distinct scenario (about 15ms per scenario at 10k
+                requests), so they are not part of the default set
+
+        Returns:
+            dict: Algorithm name -> int64 array of m seek counts
+        """
+        scenarios = np.atleast_2d(np.asarray(scenarios, dtype=np.int64))
+        if scenarios.ndim != 2 or scenarios.shape[1] != 3:
+            raise ValueError("Scenarios must be an (m, 3) array of head, direction, disk size")
+
+        heads = scenarios[:, HEAD_COLUMN]
+        is_right = (scenarios[:, DIRECTION_COLUMN] == RIGHT).astype(np.int64)
+        disk_sizes = scenarios[:, DISK_SIZE_COLUMN]
+        self._validate(heads, disk_sizes)
+
+        results = {}
+        for algo_name in algorithms:
+            if algo_name == 'FCFS':
+                results[algo_name] = self._fcfs(heads)
+            elif algo_name == 'SSTF':
+                results[algo_name] = self._sstf(heads, is_right)
+            elif algo_name in DEADLINE_ALGORITHMS:
+                results[algo_name] = self._deadline(algo_name, heads, is_right, disk_sizes)
+            else:
+                results[algo_name] = self._closed_form(algo_name, heads, is_right, disk_sizes)
+        return results
+
+    def best_algorithms(self, results):
+        """
+        Pick the algorithm with the lowest seek count for every scenario
+
+        Args:
+            results (dict): Output of evaluate()
+
+        Returns:
+            list: Best algorithm name per scenario
+        """
+        names = list(results.keys())
+        table = np.vstack([results[name] for name in names])
+        return [names[i] for i in table.argmin(axis=0)]
+
+    def _validate(self, heads, disk_sizes):
+        """Reject scenarios whose head or requests fall outside the disk"""
+        errors = []
+        if np.any(disk_sizes <= 0):
+            errors.append("Disk size must be positive")
+        bad_heads = np.flatnonzero((heads < 0) | (heads >= disk_sizes))
+        if bad_heads.size:
+            errors.append(f"Head position out of range in scenarios {bad_heads.tolist()}")
+        if self.requests.size:
+            bad_sizes = np.flatnonzero(
+                (self.sorted_requests[0] < 0) | (self.sorted_requests[-1] >= disk_sizes)
+            )
+            if bad_sizes.size:
+                errors.append(f"Requests exceed disk size in scenarios {bad_sizes.tolist()}")
+        if errors:
+            raise ValueError("\n".join(errors))
+
+    def _fcfs(self, heads):
+        """FCFS totals: first hop from each head plus the shared body sum"""
+        if not self.requests.size:
+            return np.zeros(heads.shape, dtype=np.int64)
+        return np.abs(self.requests[0] - heads) + self._fcfs_body
+
+    def _closed_form(self, algo_name, heads, is_right, disk_sizes):
+        """SCAN-family totals for all scenarios from request extremes"""
+        ordered = self.sorted_requests
+        n = ordered.size
+        if not n:
+            zeros = np.zeros(heads.shape, dtype=np.int64)
+            return closed_form_seek(algo_name, heads, disk_sizes, is_right,
+                                    zeros, zeros, zeros, zeros, zeros, zeros)
+
+        split = np.searchsorted(ordered, heads, side='left')
+        has_left = (split > 0).astype(np.int64)
+        has_right = (split < n).astype(np.int64)
+        left_max = ordered[np.maximum(split - 1, 0)]
+        right_min = ordered[np.minimum(split, n - 1)]
+
+        return closed_form_seek(
+            algo_name, heads, disk_sizes, is_right,
+            has_left, ordered[0], left_max,
+            has_right, right_min, ordered[-1]
+        )
+
+    def _sstf(self, heads, is_right):
+        """SSTF totals; the greedy walk is sequential, so run it once per distinct head/direction"""
+        ordered = self.sorted_requests.tolist()
+        keys = np.column_stack([heads, is_right])
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        unique_totals = np.zeros(len(unique_keys), dtype=np.int64)
+
+        for row, (head, right) in enumerate(unique_keys.tolist()):
+            split = int(np.searchsorted(self.sorted_requests, head, side='left'))
+            walk = sstf_order(ordered[:split], ordered[split:], head, bool(right))
+            unique_totals[row] = walk_seek(walk, head)
+        return unique_totals[inverse.reshape(-1)]
+
+    def _deadline(self, algo_name, heads, is_right, disk_sizes):
+        """DEADLINE/ANTICIPATORY totals; one sequential walk per distinct scenario (not vectorized)"""
+        requests = self.requests.tolist()
+        order = np.argsort(self.requests, kind='stable').tolist()
+        keys = np.column_stack([heads, is_right, disk_sizes])
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        unique_totals = np.zeros(len(unique_keys), dtype=np.int64)
+
+        for row, (head, right, disk_size) in enumerate(unique_keys.tolist()):
+            expire, back_seek_max = deadline_parameters(algo_name, disk_size)
+            walk = deadline_order(requests, order, head, bool(right), expire,
+                                  DEADLINE_FIFO_BATCH, back_seek_max)
+            unique_totals[row] = walk_seek(walk, head)
+        return unique_totals[inverse.reshape(-1)]
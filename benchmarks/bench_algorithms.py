@@ -0,0 +1,273 @@
+"""
+Algorithm Benchmark for Disk Scheduler
+Times the scheduling algorithms on generated workloads across input scales
+
+Workloads:
+- uniform: requests spread evenly over the disk
+- zipf: a few hot cylinders receive most requests
+- sequential: runs of consecutive cylinders (streaming reads)
+- clustered: requests grouped around a handful of centres
+
+Every (workload, size, disk size, engine, target) combination reports
+the best wall time over several runs, throughput in requests per second
+and peak traced memory. Results can be saved as a JSON baseline and
+compared against a previous one:
+
+    python benchmarks/bench_algorithms.py --save baseline.json
+    python benchmarks/bench_algorithms.py --compare baseline.json --tolerance 0.2
+
+benchmarks/baseline.json holds a reference run of every target for sizes
+10^2..10^5 (--sizes 100,1000,10000,100000); regenerate it when targets
+change. Timings are machine-specific, so compare on the same machine.
+
+Sizes default to 10^2..10^6; pass --sizes up to 10000000 for the full
+range (the python engine then needs several GB for get_all_results).
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms import create_scheduler  # noqa: E402
+
+WORKLOADS = ('uniform', 'zipf', 'sequential', 'clustered')
+TARGETS = ('fcfs', 'sstf', 'scan', 'cscan', 'look', 'clook', 'deadline', 'anticipatory', 'get_all_results')
+
+DEFAULT_SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+DEFAULT_DISK_SIZES = (200, 5000, 100000)
+DEFAULT_ENGINES = ('python', 'numpy')
+
+# Timing stops after this many seconds or MAX_REPEATS runs, whichever is first
+MIN_TIME_SECONDS = 0.2
+MAX_REPEATS = 5
+
+SEED = 1234
+
+
+def generate_workload(kind, size, disk_size, seed=SEED):
+    """
+    Generate a request queue
+
+    Args:
+        kind (str): One of WORKLOADS
+        size (int): Number of requests
+        disk_size (int): Total number of cylinders
+        seed (int): Random seed (workloads are reproducible)
+
+    Returns:
+        ndarray: int64 requests in 0..disk_size-1
+    """
+    rng = np.random.default_rng(seed)
+    if kind == 'uniform':
+        return rng.integers(0, disk_size, size, dtype=np.int64)
+    if kind == 'zipf':
+        # Rank r is requested with probability ~ 1/r^1.2; ranks map to random cylinders
+        ranks = np.minimum(rng.zipf(1.2, size), disk_size) - 1
+        return rng.permutation(disk_size)[ranks].astype(np.int64)
+    if kind == 'sequential':
+        run_length = 64
+        starts = rng.integers(0, disk_size, -(-size // run_length), dtype=np.int64)
+        offsets = np.arange(run_length, dtype=np.int64)
+        return ((starts[:, None] + offsets) % disk_size).reshape(-1)[:size]
+    if kind == 'clustered':
+        centres = rng.integers(0, disk_size, 8)
+        spread = max(disk_size / 100, 1)
+        picks = centres[rng.integers(0, centres.size, size)]
+        values = np.rint(rng.normal(picks, spread)).astype(np.int64)
+        return np.clip(values, 0, disk_size - 1)
+    raise ValueError(f"Unknown workload '{kind}' (expected one of {', '.join(WORKLOADS)})")
+
+
+def _run_target(requests, head_start, disk_size, engine, target):
+    """Build a fresh scheduler (so sorting is included) and run one target"""
+    scheduler = create_scheduler(requests, head_start, disk_size, 'right', engine=engine)
+    return getattr(scheduler, target)()
+
+
+def measure(requests, disk_size, engine, target):
+    """
+    Time one target and trace its peak memory
+
+    Args:
+        requests (list or ndarray): Requests in the engine's input type
+        disk_size (int): Total number of cylinders
+        engine (str): 'python' or 'numpy'
+        target (str): Scheduler method name (see TARGETS)
+
+    Returns:
+        dict: seconds (best run), requests_per_s and peak_bytes
+    """
+    head_start = disk_size // 2
+    best = None
+    elapsed = 0.0
+    for _ in range(MAX_REPEATS):
+        start = time.perf_counter()
+        _run_target(requests, head_start, disk_size, engine, target)
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+        elapsed += duration
+        if elapsed >= MIN_TIME_SECONDS:
+            break
+
+    # Separate run: tracing slows allocation-heavy code down
+    tracemalloc.start()
+    try:
+        _run_target(requests, head_start, disk_size, engine, target)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'seconds': best,
+        'requests_per_s': len(requests) / best if best else None,
+        'peak_bytes': peak
+    }
+
+
+def run_suite(workloads, sizes, disk_sizes, engines, targets, progress=None):
+    """
+    Run every benchmark combination
+
+    Args:
+        workloads, sizes, disk_sizes, engines, targets (iterable): Axes of the grid
+        progress (callable): Called with each finished record
+
+    Returns:
+        list: One record per combination
+    """
+    records = []
+    for workload in workloads:
+        for disk_size in disk_sizes:
+            for size in sizes:
+                generated = generate_workload(workload, size, disk_size)
+                for engine in engines:
+                    requests = generated.tolist() if engine == 'python' else generated
+                    for target in targets:
+                        record = {
+                            'workload': workload,
+                            'size': size,
+                            'disk_size': disk_size,
+                            'engine': engine,
+                            'target': target
+                        }
+                        record.update(measure(requests, disk_size, engine, target))
+                        records.append(record)
+                        if progress:
+                            progress(record)
+    return records
+
+
+def _record_key(record):
+    return (record['workload'], record['size'], record['disk_size'], record['engine'], record['target'])
+
+
+def compare(records, baseline, tolerance):
+    """
+    Find combinations that got slower than the baseline
+
+    Args:
+        records (list): Current results
+        baseline (list): Results loaded from a saved baseline
+        tolerance (float): Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        list: (record, baseline_record, slowdown) for each regression
+    """
+    previous = {_record_key(record): record for record in baseline}
+    regressions = []
+    for record in records:
+        old = previous.get(_record_key(record))
+        if old is None or not old['seconds']:
+            continue
+        slowdown = record['seconds'] / old['seconds'] - 1
+        if slowdown > tolerance:
+            regressions.append((record, old, slowdown))
+    return regressions
+
+
+def environment():
+    """Machine and library versions stored with a baseline"""
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds')
+    }
+
+
+def _format_record(record):
+    rate = record['requests_per_s']
+    return (f"{record['workload']:<11}{record['size']:>10}{record['disk_size']:>9}  "
+            f"{record['engine']:<7}{record['target']:<16}"
+            f"{record['seconds'] * 1000:>11.3f}ms{rate or 0:>15,.0f}/s"
+            f"{record['peak_bytes'] / 2 ** 20:>10.2f}MB")
+
+
+def _parse_list(value, cast=str):
+    return tuple(cast(item) for item in value.split(',') if item)
+
+
+def main(argv=None):
+    """
+    Run the benchmark
+
+    Returns:
+        int: 1 if --compare found regressions, else 0
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the disk scheduling algorithms")
+    parser.add_argument('--workloads', type=_parse_list, default=WORKLOADS,
+                        help="comma-separated workloads")
+    parser.add_argument('--sizes', type=lambda v: _parse_list(v, int), default=DEFAULT_SIZES,
+                        help="comma-separated request counts")
+    parser.add_argument('--disk-sizes', type=lambda v: _parse_list(v, int), default=DEFAULT_DISK_SIZES,
+                        help="comma-separated disk sizes")
+    parser.add_argument('--engines', type=_parse_list, default=DEFAULT_ENGINES,
+                        help="comma-separated engines")
+    parser.add_argument('--targets', type=_parse_list, default=TARGETS,
+                        help="comma-separated scheduler methods")
+    parser.add_argument('--save', metavar='FILE', help="write results as a JSON baseline")
+    parser.add_argument('--compare', metavar='FILE', help="compare against a saved baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed relative slowdown when comparing (default 0.2)")
+    args = parser.parse_args(argv)
+
+    for target in args.targets:
+        if target not in TARGETS:
+            parser.error(f"unknown target '{target}' (choose from {', '.join(TARGETS)})")
+
+    print(f"{'workload':<11}{'size':>10}{'disk':>9}  {'engine':<7}{'target':<16}"
+          f"{'best':>13}{'throughput':>17}{'peak':>12}")
+    records = run_suite(args.workloads, args.sizes, args.disk_sizes, args.engines, args.targets,
+                        progress=lambda record: print(_format_record(record), flush=True))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'environment': environment(), 'results': records}, f, indent=2)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(records, baseline['results'], args.tolerance)
+        if not regressions:
+            print(f"\nNo regressions beyond {args.tolerance:.0%} against {args.compare}")
+            return 0
+        print(f"\n{len(regressions)} regressions beyond {args.tolerance:.0%}:")
+        for record, old, slowdown in regressions:
+            print(f"  {_format_record(record)}  (was {old['seconds'] * 1000:.3f}ms, +{slowdown:.0%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Startup Benchmark for Disk Scheduler
+Measures cold-start time of the GUI in fresh interpreters
+
+Each run starts a new Python process and records:
+- import_s: importing disk_scheduler_gui
+- window_s: creating the main window until it is drawn (needs a display)
+- plotting_s: importing Matplotlib on first chart use
+- matplotlib_at_startup: whether Matplotlib was loaded before the first chart
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--json] [--max-window-seconds 1.0]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter and prints one JSON object
+PROBE = r'''
+import json, sys, time
+start = time.perf_counter()
+import disk_scheduler_gui
+import gui_components
+imported = time.perf_counter()
+
+timings = {'import_s': imported - start, 'window_s': None}
+try:
+    import tkinter as tk
+    root = tk.Tk()
+    app = disk_scheduler_gui.DiskSchedulerApp(root)
+    root.update()
+    timings['window_s'] = time.perf_counter() - start
+    root.destroy()
+except tk.TclError:
+    pass  # no display available
+
+timings['matplotlib_at_startup'] = 'matplotlib' in sys.modules
+before = time.perf_counter()
+gui_components.load_plotting()
+timings['plotting_s'] = time.perf_counter() - before
+print(json.dumps(timings))
+'''
+
+
+def run_probe():
+    """
+    Measure one cold start
+
+    Returns:
+        dict: Timings reported by the probe process
+    """
+    completed = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    """
+    Reduce repeated runs to min/median per timing
+
+    Args:
+        samples (list): Probe outputs
+
+    Returns:
+        dict: {timing: {'min': s, 'median': s}} plus matplotlib_at_startup
+    """
+    summary = {'runs': len(samples)}
+    for name in ('import_s', 'window_s', 'plotting_s'):
+        values = [sample[name] for sample in samples if sample[name] is not None]
+        if values:
+            summary[name] = {'min': min(values), 'median': statistics.median(values)}
+    summary['matplotlib_at_startup'] = any(sample['matplotlib_at_startup'] for sample in samples)
+    return summary
+
+
+def main(argv=None):
+    """
+    Run the benchmark
+
+    Returns:
+        int: 1 if the window took longer than --max-window-seconds, else 0
+    """
+    parser = argparse.ArgumentParser(description="Measure GUI cold-start time")
+    parser.add_argument('--runs', type=int, default=5, help="fresh interpreters to start")
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    parser.add_argument('--max-window-seconds', type=float, default=None,
+                        help="fail when the median time to a drawn window exceeds this")
+    args = parser.parse_args(argv)
+
+    summary = summarize([run_probe() for _ in range(args.runs)])
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"Cold start over {summary['runs']} runs (min / median):")
+        for name, label in (('import_s', 'Import'), ('window_s', 'Window drawn'),
+                            ('plotting_s', 'Matplotlib load')):
+            if name in summary:
+                print(f"  {label:<16} {summary[name]['min']:.3f}s / {summary[name]['median']:.3f}s")
+            else:
+                print(f"  {label:<16} n/a (no display)")
+        print(f"  Matplotlib loaded at startup: {'yes' if summary['matplotlib_at_startup'] else 'no'}")
+
+    window = summary.get('window_s')
+    if args.max_window_seconds is not None and window and window['median'] > args.max_window_seconds:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+"""
+Result Cache for Disk Scheduler
+Memoizes get_all_results() by scenario fingerprint, in memory or on disk
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from algorithms import ALGORITHM_VERSION, create_scheduler
+from sequences import RunLengthSequence
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Requests hashed per step when fingerprinting large request arrays
+HASH_BLOCK_ELEMENTS = 1 << 19
+
+# Approximate cost of one list entry (pointer plus int object)
+LIST_ENTRY_BYTES = 36
+
+# Files making up one on-disk cache entry
+CACHE_META_FILE = 'meta.json'
+CACHE_CYLINDERS_FILE = 'cylinders.npy'
+CACHE_COUNTS_FILE = 'counts.npy'
+
+
+def scenario_key(requests, head_start, disk_size, direction='right', compact=False,
+                 engine='python', cost_model=None, sectors=None):
+    """
+    Fingerprint a scenario by content hash of its requests and parameters
+
+    Args:
+        requests (array-like): Cylinder requests in arrival order
+        head_start (int): Initial head position
+        disk_size (int): Total number of cylinders
+        direction (str): Initial direction ('right' or 'left')
+        compact (bool): Whether results hold run-length encoded sequences
+        engine (str): Engine that produced the results (sequence type)
+        cost_model (CostModel): Cost model of the results (identified by repr)
+        sectors (list): Per-request sectors of rotation-aware results
+
+    Returns:
+        str: Hex digest identifying the scenario
+    """
+    values = np.asarray(requests)
+    digest = hashlib.blake2b(digest_size=20)
+    # Widen block by block so memory-mapped traces are never copied whole
+    for start in range(0, values.size, HASH_BLOCK_ELEMENTS):
+        block = np.ascontiguousarray(values[start:start + HASH_BLOCK_ELEMENTS], dtype=np.int64)
+        digest.update(memoryview(block).cast('B'))
+    digest.update(f"|{values.size}|{head_start}|{disk_size}|{direction.lower()}|{compact}|{engine}|{cost_model!r}".encode())
+    if sectors is not None:
+        digest.update(b"|sectors|")
+        digest.update(memoryview(np.ascontiguousarray(sectors, dtype=np.int64)).cast('B'))
+    return digest.hexdigest()
+
+
+def estimate_result_bytes(results):
+    """
+    Approximate memory held by a get_all_results() dict
+
+    Args:
+        results (dict): Results keyed by algorithm name
+
+    Returns:
+        int: Estimated size in bytes
+    """
+    total = 0
+    for result in results.values():
+        sequence = result['sequence']
+        if isinstance(sequence, (np.ndarray, RunLengthSequence)):
+            total += sequence.nbytes
+        else:
+            total += len(sequence) * LIST_ENTRY_BYTES
+        total += 256  # dict and metric overhead
+    return total
+
+
+class ResultCache:
+    """Thread-safe LRU cache of get_all_results() output
+
+    Entries are evicted least-recently-used first once their estimated
+    total size exceeds max_bytes. Cached result dicts are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache
+
+        Args:
+            max_bytes (int): Memory budget for cached results
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Look up cached results and mark them as recently used
+
+        Args:
+            key (str): Scenario fingerprint from scenario_key()
+
+        Returns:
+            dict: Cached results, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, results):
+        """
+        Store results, evicting old entries to stay within max_bytes
+
+        Results larger than the whole budget are not cached.
+
+        Args:
+            key (str): Scenario fingerprint from scenario_key()
+            results (dict): Output of get_all_results()
+        """
+        size = estimate_result_bytes(results)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (results, size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """
+        Report cache effectiveness
+
+        Returns:
+            dict: hits, misses, evictions, entries, current_bytes, max_bytes, hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'current_bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hit_rate': self.hits / lookups if lookups else 0
+            }
+
+    def get_all_results(self, requests, head_start, disk_size, direction='right',
+                        engine='python', compact=False, cost_model=None):
+        """
+        Memoized DiskScheduler.get_all_results()
+
+        Args:
+            requests (array-like): Cylinder requests in arrival order
+            head_start (int): Initial head position
+            disk_size (int): Total number of cylinders
+            direction (str): Initial direction ('right' or 'left')
+            engine (str): Engine used on a miss ('python' or 'numpy')
+            compact (bool): Store sequences as RunLengthSequence objects
+            cost_model (CostModel): Optional service time model
+
+        Returns:
+            dict: Results for all algorithms (shared, read-only)
+        """
+        key = scenario_key(requests, head_start, disk_size, direction, compact, engine, cost_model)
+        results = self.get(key)
+        if results is None:
+            scheduler = create_scheduler(requests, head_start, disk_size, direction, engine=engine,
+                                         cost_model=cost_model)
+            results = scheduler.get_all_results(compact=compact)
+            self.put(key, results)
+        return results
+
+
+class DiskResultCache:
+    """Directory of compact get_all_results() output that survives restarts
+
+    Each entry stores the run-length encoded sequences of all algorithms
+    in two .npy files plus a JSON file with the metrics, under a
+    subdirectory per ALGORITHM_VERSION so results computed by older
+    algorithm code are never returned. Loaded sequences are
+    RunLengthSequence views of memory-mapped arrays: a warm start reads
+    only the metadata until a sequence is actually used.
+    """
+
+    def __init__(self, directory):
+        """
+        Initialize the cache (the directory is created on first write)
+
+        Args:
+            directory (str): Cache root directory
+        """
+        self.directory = directory
+        self.version_directory = os.path.join(directory, f"v{ALGORITHM_VERSION}")
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key):
+        return os.path.join(self.version_directory, key)
+
+    def get(self, key):
+        """
+        Load cached results
+
+        Args:
+            key (str): Scenario fingerprint from scenario_key()
+
+        Returns:
+            dict: Results with memory-mapped RunLengthSequence sequences,
+                or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(os.path.join(path, CACHE_META_FILE), 'r') as f:
+                meta = json.load(f)
+            if meta['version'] != ALGORITHM_VERSION:
+                raise ValueError("stale cache entry")
+            cylinders = np.load(os.path.join(path, CACHE_CYLINDERS_FILE), mmap_mode='r')
+            counts = np.load(os.path.join(path, CACHE_COUNTS_FILE), mmap_mode='r')
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError):
+            # Unreadable or partial entry: drop it and recompute
+            shutil.rmtree(path, ignore_errors=True)
+            self.misses += 1
+            return None
+
+        results = {}
+        for name, entry in meta['algorithms'].items():
+            start, stop = entry.pop('runs')
+            length = entry.pop('length', None)
+            results[name] = dict(
+                entry,
+                sequence=RunLengthSequence.from_runs(cylinders[start:stop], counts[start:stop], length)
+            )
+        self.hits += 1
+        return results
+
+    def put(self, key, results):
+        """
+        Write results to the cache
+
+        The entry is assembled in a temporary directory and renamed into
+        place, so concurrent readers never see a partial entry.
+
+        Args:
+            key (str): Scenario fingerprint from scenario_key()
+            results (dict): Output of get_all_results() (plain sequences
+                are compressed before writing)
+        """
+        algorithms = {}
+        cylinder_parts = []
+        count_parts = []
+        offset = 0
+        for name, result in results.items():
+            sequence = result['sequence']
+            if not isinstance(sequence, RunLengthSequence):
+                sequence = RunLengthSequence.from_chunks([sequence])
+            cylinder_parts.append(np.asarray(sequence.cylinders, dtype=np.int64))
+            count_parts.append(np.asarray(sequence.counts, dtype=np.int64))
+            # Metrics (seek counts, cost model estimates) as JSON scalars
+            entry = {key: value.item() if hasattr(value, 'item') else value
+                     for key, value in result.items() if key != 'sequence'}
+            entry['runs'] = [offset, offset + sequence.run_count]
+            entry['length'] = len(sequence)
+            algorithms[name] = entry
+            offset += sequence.run_count
+
+        os.makedirs(self.version_directory, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self.version_directory, prefix='.tmp-')
+        try:
+            np.save(os.path.join(staging, CACHE_CYLINDERS_FILE), np.concatenate(cylinder_parts))
+            np.save(os.path.join(staging, CACHE_COUNTS_FILE), np.concatenate(count_parts))
+            with open(os.path.join(staging, CACHE_META_FILE), 'w') as f:
+                json.dump({'version': ALGORITHM_VERSION, 'algorithms': algorithms}, f)
+            os.rename(staging, self._entry_path(key))
+        except OSError:
+            # Another writer stored the same entry first
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def get_all_results(self, requests, head_start, disk_size, direction='right', engine='numpy',
+                        cost_model=None):
+        """
+        DiskScheduler.get_all_results(compact=True), computed at most once per scenario
+
+        Args:
+            requests (array-like): Cylinder requests (memory-mapped traces
+                are hashed in blocks, not copied)
+            head_start (int): Initial head position
+            disk_size (int): Total number of cylinders
+            direction (str): Initial direction ('right' or 'left')
+            engine (str): Engine used on a miss ('python' or 'numpy')
+            cost_model (CostModel): Optional service time model
+
+        Returns:
+            dict: Results for all algorithms with RunLengthSequence sequences
+        """
+        key = scenario_key(requests, head_start, disk_size, direction, compact=True,
+                           cost_model=cost_model)
+        results = self.get(key)
+        if results is None:
+            scheduler = create_scheduler(requests, head_start, disk_size, direction, engine=engine,
+                                         cost_model=cost_model)
+            results = scheduler.get_all_results(compact=True)
+            self.put(key, results)
+        return results
+
+    def prune(self):
+        """
+        Delete entries written by other algorithm versions
+
+        Returns:
+            int: Number of version directories removed
+        """
+        if not os.path.isdir(self.directory):
+            return 0
+        removed = 0
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith('v') and path != self.version_directory and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def clear(self):
+        """Delete every entry of the current version"""
+        shutil.rmtree(self.version_directory, ignore_errors=True)
+
+    def stats(self):
+        """
+        Report cache effectiveness
+
+        Returns:
+            dict: hits, misses, entries, hit_rate
+        """
+        entries = 0
+        if os.path.isdir(self.version_directory):
+            entries = sum(1 for name in os.listdir(self.version_directory)
+                          if not name.startswith('.'))
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': entries,
+            'hit_rate': self.hits / lookups if lookups else 0
+        }
+
+
+# Process-wide cache shared by the GUI and scripts
+default_cache = ResultCache()
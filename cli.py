@@ -0,0 +1,351 @@
+"""
+Command-Line Runner for Disk Scheduler
+Headless batch scheduling with JSON-lines and CSV input/output
+
+Each input scenario gives a request queue, head position, disk size and
+optional direction and id:
+
+    {"id": "a", "requests": [82, 170, 43, 140], "head_start": 50, "disk_size": 200}
+
+    id,requests,head_start,disk_size,direction
+    a,82 170 43 140,50,200,right
+
+Results are written one scenario at a time as soon as they are ready.
+This module never imports tkinter or matplotlib.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from functools import lru_cache
+
+from algorithms import ALGORITHM_NAMES, ENGINES, create_scheduler
+from cost_models import COST_MODELS, create_cost_model
+from utils import validate_input
+
+INPUT_FORMATS = ('auto', 'jsonl', 'csv')
+OUTPUT_FORMATS = ('jsonl', 'csv')
+
+CSV_OUTPUT_FIELDS = ('id', 'algorithm', 'seek_count', 'avg_seek_time',
+                     'service_time_ms', 'iops', 'wait_p50', 'wait_p95', 'wait_p99', 'wait_max',
+                     'best', 'error')
+
+# Tail latency columns (see algorithms.wait_metrics)
+WAIT_FIELDS = ('wait_p50', 'wait_p95', 'wait_p99', 'wait_max')
+
+# Scenarios submitted ahead of the one being written, per worker
+PREFETCH_PER_WORKER = 4
+
+
+def read_scenarios(stream, input_format='jsonl'):
+    """
+    Parse scenarios from an open text stream
+
+    Args:
+        stream (file): Input stream
+        input_format (str): 'jsonl' or 'csv'
+
+    Yields:
+        dict: Raw scenario records
+    """
+    if input_format == 'csv':
+        yield from csv.DictReader(stream)
+        return
+
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {'error': f"Line {line_number}: invalid JSON ({e.msg})"}
+
+
+def _detect_format(path, input_format):
+    """Input format of one path ('-' is stdin)"""
+    if input_format != 'auto':
+        return input_format
+    return 'csv' if path.lower().endswith('.csv') else 'jsonl'
+
+
+def _iter_inputs(paths, input_format):
+    """Scenarios from every input path in order"""
+    for path in paths:
+        fmt = _detect_format(path, input_format)
+        if path == '-':
+            yield from read_scenarios(sys.stdin, fmt)
+        else:
+            with open(path, 'r', newline='') as f:
+                yield from read_scenarios(f, fmt)
+
+
+@lru_cache(maxsize=None)
+def _cost_model(name):
+    """Shared model instance per process, so lookup tables are built once"""
+    return create_cost_model(name) if name else None
+
+
+def run_scenario(record, algorithms=ALGORITHM_NAMES, engine='python', sequences=False,
+                 cost_model=None, latency=False):
+    """
+    Validate and schedule one scenario
+
+    Args:
+        record (dict): Scenario with requests, head_start, disk_size and
+            optional direction and id
+        algorithms (tuple): Algorithm names to run
+        engine (str): 'python' or 'numpy'
+        sequences (bool): Include seek sequences in the output
+        cost_model (str): Name of a cost model (see cost_models.COST_MODELS)
+            adding service time and IOPS estimates, or None
+        latency (bool): Add wait_p50/p95/p99/max to every result
+
+    Returns:
+        dict: id plus either results and best, or error
+    """
+    output = {'id': record.get('id')}
+    if 'error' in record:
+        output['error'] = record['error']
+        return output
+
+    try:
+        requests = record.get('requests', '')
+        if isinstance(requests, list):
+            requests = ' '.join(str(r) for r in requests)
+        elif not isinstance(requests, str):
+            raise ValueError("Requests must be a string or list of integers")
+        direction = record.get('direction') or 'right'
+        if not isinstance(direction, str) or direction.lower() not in ('left', 'right'):
+            raise ValueError("Direction must be 'left' or 'right'")
+        direction = direction.lower()
+
+        requests, head_start, disk_size = validate_input(
+            requests,
+            _integer_field(record, 'head_start', "Initial head position must be an integer"),
+            _integer_field(record, 'disk_size', "Disk size must be an integer"),
+            as_array=engine == 'numpy'
+        )
+        scheduler = create_scheduler(requests, head_start, disk_size, direction, engine=engine,
+                                     cost_model=_cost_model(cost_model))
+
+        results = {}
+        for algo_name in algorithms:
+            if sequences:
+                result = scheduler.get_result(algo_name)
+                sequence = result['sequence']
+                result['sequence'] = sequence if isinstance(sequence, list) else sequence.tolist()
+            else:
+                result = scheduler.get_metrics(algo_name)
+            if latency:
+                result.update(scheduler.get_latency(algo_name, result))
+            results[algo_name] = result
+    except (ValueError, TypeError) as e:
+        output['error'] = str(e)
+        return output
+
+    output['results'] = results
+    output['best'] = min(results.items(), key=lambda x: x[1]['seek_count'])[0]
+    return output
+
+
+def _integer_field(record, name, message):
+    """
+    Read a scalar field that validate_input() will parse with int()
+
+    JSON numbers arrive as int or float; int() would silently truncate
+    5.7, so only integral values (or text) are passed on.
+
+    Raises:
+        ValueError: With message, if the value is not an integer
+    """
+    value = record.get(name, '')
+    if isinstance(value, str) or (isinstance(value, int) and not isinstance(value, bool)):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise ValueError(message)
+
+
+def run_scenarios(records, algorithms=ALGORITHM_NAMES, engine='python', sequences=False, workers=1,
+                  cost_model=None, latency=False):
+    """
+    Schedule a stream of scenarios, yielding outputs in input order
+
+    With more than one worker, scenarios are fanned out to a process pool
+    with a bounded number in flight, so arbitrarily long inputs are
+    processed in constant memory.
+
+    Args:
+        records (iterable): Scenario records
+        algorithms (tuple): Algorithm names to run
+        engine (str): 'python' or 'numpy'
+        sequences (bool): Include seek sequences in the output
+        workers (int): Worker processes
+        cost_model (str): Cost model name, or None
+        latency (bool): Add tail latency to every result
+
+    Yields:
+        dict: One output per scenario (see run_scenario)
+    """
+    records = (_with_default_id(record, index) for index, record in enumerate(records, 1))
+    if workers <= 1:
+        for record in records:
+            yield run_scenario(record, algorithms, engine, sequences, cost_model, latency)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for record in records:
+            pending.append(executor.submit(run_scenario, record, algorithms, engine, sequences,
+                                           cost_model, latency))
+            if len(pending) >= workers * PREFETCH_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _with_default_id(record, index):
+    """Number scenarios that do not carry an id"""
+    if not isinstance(record, dict):
+        return {'id': index, 'error': "Scenario must be a JSON object"}
+    if record.get('id') in (None, ''):
+        record = dict(record, id=index)
+    return record
+
+
+class _CsvWriter:
+    """Writes one row per (scenario, algorithm)"""
+
+    def __init__(self, stream):
+        self.writer = csv.DictWriter(stream, fieldnames=CSV_OUTPUT_FIELDS, extrasaction='ignore')
+        self.writer.writeheader()
+
+    def write(self, output):
+        if 'error' in output:
+            self.writer.writerow({'id': output['id'], 'error': output['error']})
+            return
+        for algo_name, result in output['results'].items():
+            row = {
+                'id': output['id'],
+                'algorithm': algo_name,
+                'seek_count': result['seek_count'],
+                'avg_seek_time': f"{result['avg_seek_time']:.2f}",
+                'best': int(algo_name == output['best'])
+            }
+            if 'service_time_ms' in result:
+                row['service_time_ms'] = f"{result['service_time_ms']:.3f}"
+                row['iops'] = f"{result['iops']:.1f}"
+            for field in WAIT_FIELDS:
+                if field in result:
+                    row[field] = result[field]
+            self.writer.writerow(row)
+
+
+class _JsonLinesWriter:
+    """Writes one JSON object per scenario"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, output):
+        self.stream.write(json.dumps(output) + '\n')
+
+
+def parse_algorithms(value):
+    """
+    Parse a comma-separated algorithm list (case-insensitive)
+
+    Args:
+        value (str): e.g. "fcfs,scan,c-look"
+
+    Returns:
+        tuple: Canonical algorithm names
+    """
+    names = {name.upper(): name for name in ALGORITHM_NAMES}
+    selected = []
+    for token in value.split(','):
+        token = token.strip().upper()
+        if not token:
+            continue
+        if token not in names:
+            raise argparse.ArgumentTypeError(
+                f"unknown algorithm '{token}' (choose from {', '.join(ALGORITHM_NAMES)})"
+            )
+        selected.append(names[token])
+    if not selected:
+        raise argparse.ArgumentTypeError("no algorithms selected")
+    return tuple(selected)
+
+
+def build_parser():
+    """Create the argument parser"""
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description="Run disk scheduling algorithms over scenarios read from "
+                    "JSON-lines or CSV files (or stdin)."
+    )
+    parser.add_argument('inputs', nargs='*', default=['-'],
+                        help="scenario files ('-' or none for stdin)")
+    parser.add_argument('-f', '--format', choices=INPUT_FORMATS, default='auto',
+                        help="input format (default: by file extension, JSON lines for stdin)")
+    parser.add_argument('-a', '--algorithms', type=parse_algorithms, default=ALGORITHM_NAMES,
+                        help="comma-separated algorithms to run (default: all)")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="worker processes (0 for one per CPU)")
+    parser.add_argument('-e', '--engine', choices=ENGINES, default='python',
+                        help="scheduling engine")
+    parser.add_argument('-c', '--cost-model', choices=COST_MODELS, default=None,
+                        help="add estimated service time and IOPS using a drive model")
+    parser.add_argument('-l', '--latency', action='store_true',
+                        help="add p50/p95/p99/max wait (cylinders travelled before service)")
+    parser.add_argument('-s', '--sequences', action='store_true',
+                        help="include seek sequences (JSON-lines output only)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file (default: stdout)")
+    parser.add_argument('--output-format', choices=OUTPUT_FORMATS, default='jsonl',
+                        help="output format")
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the command-line interface
+
+    Args:
+        argv (list): Arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: Exit status (1 if any scenario failed)
+    """
+    args = build_parser().parse_args(argv)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    failed = False
+    try:
+        writer = _CsvWriter(out) if args.output_format == 'csv' else _JsonLinesWriter(out)
+        outputs = run_scenarios(_iter_inputs(args.inputs, args.format), args.algorithms,
+                                args.engine, args.sequences, workers, args.cost_model, args.latency)
+        for output in outputs:
+            failed = failed or 'error' in output
+            writer.write(output)
+            out.flush()
+    except BrokenPipeError:
+        # Output consumer exited early (e.g. piped into head)
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
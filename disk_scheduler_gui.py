@@ -2,25 +2,55 @@
 Disk Scheduling Algorithm Visualizer
 Main Application File
 
-This application compares 5 disk scheduling algorithms:
+This application compares 8 disk scheduling algorithms:
 - FCFS (First Come First Serve)
+- SSTF (Shortest Seek Time First)
 - SCAN (Elevator Algorithm)
 - C-SCAN (Circular SCAN)
 - LOOK
 - C-LOOK
+- DEADLINE
+- ANTICIPATORY
+- SATF (Shortest Access Time First, when sectors are given)
 
 Author: Educational Project
 Date: 2026
 """
 
 import tkinter as tk
-from tkinter import messagebox, Menu
+from tkinter import ttk, messagebox, filedialog, Menu
+import queue
 import sys
+import threading
 
 # Import custom modules
-from algorithms import DiskScheduler
-from utils import validate_input, format_result_text, calculate_statistics, export_results_to_csv
-from gui_components import InputFrame, ResultsDisplay, VisualizationPanel, ComparisonChart
+from algorithms import ALGORITHM_NAMES, create_scheduler, wait_metrics
+from cache import default_cache, scenario_key
+from cost_models import DiskDriveModel
+from profiling import profiler, instrument
+from satf import DEFAULT_SECTORS_PER_TRACK, add_rotational_results
+from utils import (validate_input, validate_sectors, format_result_text, calculate_statistics,
+                   export_results_to_csv, export_sequence_to_csv, MAX_DISPLAYED_STEPS)
+from gui_components import InputFrame, ResultsDisplay, VisualizationPanel, ComparisonChart, warm_up_plotting
+
+# Background calculation settings
+POLL_INTERVAL_MS = 50
+LARGE_INPUT_THRESHOLD = 100000  # Use the NumPy engine from this many requests
+
+# Drive model used for the service time and IOPS estimates
+DEFAULT_COST_MODEL = DiskDriveModel()
+
+# Delay before Matplotlib is imported in the background, so the window is
+# drawn first
+PLOT_WARMUP_DELAY_MS = 300
+
+
+def _summarize_values(values):
+    """Comma-separated values, cut off after MAX_DISPLAYED_STEPS entries"""
+    text = ', '.join(map(str, values[:MAX_DISPLAYED_STEPS]))
+    if len(values) > MAX_DISPLAYED_STEPS:
+        text += f", … {len(values) - MAX_DISPLAYED_STEPS} more"
+    return text
 
 
 class DiskSchedulerApp:
@@ -42,6 +72,15 @@ class DiskSchedulerApp:
         self.results = {}
         self.current_inputs = {}
 
+        # Scheduler kept between calculations for incremental queue edits,
+        # as (engine, head_start, disk_size, direction, scheduler)
+        self.last_scheduler = None
+
+        # Background calculation state
+        self.worker = None
+        self.worker_queue = None
+        self.cancel_event = None
+
         # Create menu bar
         self.create_menu()
 
@@ -51,6 +90,9 @@ class DiskSchedulerApp:
         # Center window
         self.center_window()
 
+        # Load plotting libraries once the window is up
+        self.root.after(PLOT_WARMUP_DELAY_MS, warm_up_plotting)
+
     def create_menu(self):
         """Create menu bar"""
         menubar = Menu(self.root)
@@ -60,9 +102,28 @@ class DiskSchedulerApp:
         file_menu = Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Export Results (CSV)", command=self.export_results)
+        file_menu.add_command(label="Export Selected Sequence (CSV)", command=self.export_sequence)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
 
+        # Performance menu
+        self.profiling_var = tk.BooleanVar(value=False)
+        self.trace_memory_var = tk.BooleanVar(value=False)
+        self.cprofile_var = tk.BooleanVar(value=False)
+        perf_menu = Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Performance", menu=perf_menu)
+        perf_menu.add_checkbutton(label="Enable Profiling", variable=self.profiling_var,
+                                  command=self.apply_profiling_settings)
+        perf_menu.add_checkbutton(label="Trace Memory Allocations", variable=self.trace_memory_var,
+                                  command=self.apply_profiling_settings)
+        perf_menu.add_checkbutton(label="Collect cProfile Data", variable=self.cprofile_var,
+                                  command=self.apply_profiling_settings)
+        perf_menu.add_separator()
+        perf_menu.add_command(label="Show Performance Panel", command=self.show_performance_panel)
+        perf_menu.add_command(label="Save cProfile Stats...", command=self.save_cprofile_stats)
+        perf_menu.add_command(label="Save Memory Snapshot...", command=self.save_memory_snapshot)
+        perf_menu.add_command(label="Reset Counters", command=self.reset_profiling)
+
         # Help menu
         help_menu = Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
@@ -170,17 +231,35 @@ class DiskSchedulerApp:
         self.viz_panel.frame.pack(side='right', fill='both', expand=True)
 
         # Status bar
+        status_frame = tk.Frame(self.root, bg='#e0e0e0', relief='sunken', bd=1)
+        status_frame.pack(side='bottom', fill='x')
+
         self.status_var = tk.StringVar(value="Ready")
         status_bar = tk.Label(
-            self.root,
+            status_frame,
             textvariable=self.status_var,
             font=('Arial', 9),
             bg='#e0e0e0',
-            anchor='w',
-            relief='sunken',
-            bd=1
+            anchor='w'
+        )
+        status_bar.pack(side='left', fill='x', expand=True)
+
+        # Progress and cancel controls (shown only while calculating)
+        self.cancel_button = tk.Button(
+            status_frame,
+            text="Cancel",
+            command=self.cancel_calculation,
+            font=('Arial', 8),
+            padx=8,
+            pady=0
+        )
+        self.progress_bar = ttk.Progressbar(
+            status_frame,
+            orient='horizontal',
+            length=200,
+            mode='determinate',
+            maximum=len(ALGORITHM_NAMES)
         )
-        status_bar.pack(side='bottom', fill='x')
 
     def center_window(self):
         """Center the window on screen"""
@@ -192,97 +271,270 @@ class DiskSchedulerApp:
         self.root.geometry(f'{width}x{height}+{x}+{y}')
 
     def calculate_all(self):
-        """Calculate all algorithms"""
-        try:
-            self.status_var.set("Calculating...")
-            self.root.update()
+        """Calculate all algorithms on a background thread"""
+        if self.worker is not None:
+            return
+
+        # Read widgets here; the worker thread must not touch Tk
+        inputs = self.input_frame.get_values()
+
+        self.worker_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.worker = threading.Thread(
+            target=self._calculation_worker,
+            args=(inputs, self.worker_queue, self.cancel_event, self.last_scheduler),
+            daemon=True
+        )
+
+        self._set_busy(True)
+        self.status_var.set("Calculating...")
+        self.worker.start()
+        self.root.after(POLL_INTERVAL_MS, self._poll_calculation)
+
+    def cancel_calculation(self):
+        """Ask the running calculation to stop after the current algorithm"""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.status_var.set("Cancelling...")
+
+    @staticmethod
+    def _calculation_worker(inputs, worker_queue, cancel_event, last_scheduler=None):
+        """
+        Validate inputs and run every algorithm (runs off the Tk thread)
 
-            # Get inputs
-            inputs = self.input_frame.get_values()
+        When only the request queue changed since the previous calculation,
+        the previous scheduler is updated in place instead of re-sorting.
 
-            # Validate
+        Posts ('progress', done, total, algo_name),
+        ('done', results, inputs, last_scheduler), ('cancelled',) or
+        ('error', exception) messages to worker_queue.
+        """
+        try:
+            with profiler.cprofile_thread():
+                DiskSchedulerApp._calculate(inputs, worker_queue, cancel_event, last_scheduler)
+        except Exception as e:
+            # Profiler setup failed; _calculate reports its own errors
+            worker_queue.put(('error', e))
+
+    @staticmethod
+    def _calculate(inputs, worker_queue, cancel_event, last_scheduler):
+        """Body of _calculation_worker"""
+        try:
             requests, head_start, disk_size = validate_input(
                 inputs['requests'],
                 inputs['head'],
-                inputs['disk_size']
+                inputs['disk_size'],
+                as_array=True
             )
 
-            # Store inputs
-            self.current_inputs = {
+            sectors = validate_sectors(inputs.get('sectors', ''), len(requests), DEFAULT_SECTORS_PER_TRACK)
+
+            engine = 'numpy' if len(requests) >= LARGE_INPUT_THRESHOLD else 'python'
+
+            # Large schedules are kept run-length encoded
+            compact = engine == 'numpy'
+
+            key = scenario_key(requests, head_start, disk_size, inputs['direction'], compact, engine,
+                               DEFAULT_COST_MODEL, sectors)
+            if engine == 'python':
+                requests = requests.tolist()
+
+            current_inputs = {
                 'requests': requests,
                 'head_start': head_start,
                 'disk_size': disk_size,
-                'direction': inputs['direction']
+                'direction': inputs['direction'],
+                'sectors': sectors
             }
 
-            # Create scheduler and calculate
-            scheduler = DiskScheduler(
-                requests, 
-                head_start, 
-                disk_size, 
-                inputs['direction']
-            )
-            self.results = scheduler.get_all_results()
+            # Repeated scenarios come straight from the result cache
+            results = default_cache.get(key)
+            if results is not None:
+                report = DiskSchedulerApp.format_report(results, current_inputs)
+                worker_queue.put(('done', results, current_inputs, last_scheduler, report))
+                return
+
+            params = (engine, head_start, disk_size, inputs['direction'])
+            if last_scheduler is not None and last_scheduler[:4] == params:
+                scheduler = last_scheduler[4]
+                scheduler.update_requests(requests)
+            else:
+                scheduler = create_scheduler(
+                    requests,
+                    head_start,
+                    disk_size,
+                    inputs['direction'],
+                    engine=engine,
+                    cost_model=DEFAULT_COST_MODEL
+                )
+            last_scheduler = params + (scheduler,)
+
+            results = {}
+            for done, algo_name in enumerate(ALGORITHM_NAMES):
+                if cancel_event.is_set():
+                    worker_queue.put(('cancelled',))
+                    return
+                worker_queue.put(('progress', done, len(ALGORITHM_NAMES), algo_name))
+                result = scheduler.get_result(algo_name, compact=compact)
+                result.update(scheduler.get_latency(algo_name, result))
+                results[algo_name] = result
+
+            if sectors is not None:
+                # Retime every algorithm on the rotating drive and add SATF
+                worker_queue.put(('progress', len(ALGORITHM_NAMES), len(ALGORITHM_NAMES) + 1, 'SATF'))
+                if add_rotational_results(results, requests, sectors, head_start, disk_size,
+                                          DEFAULT_COST_MODEL, DEFAULT_SECTORS_PER_TRACK,
+                                          cancel_event) is None:
+                    worker_queue.put(('cancelled',))
+                    return
+                results['SATF'].update(wait_metrics([results['SATF']['sequence']], requests))
+
+            default_cache.put(key, results)
+            # The report text is built here too, so the Tk thread only inserts it
+            report = DiskSchedulerApp.format_report(results, current_inputs)
+            worker_queue.put(('done', results, current_inputs, last_scheduler, report))
 
-            # Display results
-            self.display_results()
+        except Exception as e:
+            worker_queue.put(('error', e))
 
-            # Update algorithm combo
-            self.viz_panel.algo_combo.set('FCFS')
+    def _poll_calculation(self):
+        """Apply messages from the calculation worker (runs on the Tk thread)"""
+        finished = False
+        try:
+            while True:
+                message = self.worker_queue.get_nowait()
+                kind = message[0]
+
+                if kind == 'progress':
+                    _, done, total, algo_name = message
+                    self.progress_bar['maximum'] = total
+                    self.progress_bar['value'] = done
+                    self.status_var.set(f"Calculating {algo_name} ({done + 1}/{total})...")
+                elif kind == 'done':
+                    finished = True
+                    self.last_scheduler = message[3]
+                    self._calculation_finished(message[1], message[2], message[4])
+                elif kind == 'cancelled':
+                    finished = True
+                    self.status_var.set("Calculation cancelled")
+                elif kind == 'error':
+                    finished = True
+                    self._calculation_failed(message[1])
+        except queue.Empty:
+            pass
 
-            self.status_var.set(f"✓ Calculated {len(self.results)} algorithms successfully")
-            messagebox.showinfo(
-                "Success", 
-                f"All algorithms calculated successfully!\n\n" +
-                f"Requests: {len(requests)}\n" +
-                f"Best Algorithm: {scheduler.get_best_algorithm()[0]}"
-            )
+        if finished:
+            self.worker = None
+            self.worker_queue = None
+            self.cancel_event = None
+            self._set_busy(False)
+        else:
+            self.root.after(POLL_INTERVAL_MS, self._poll_calculation)
+
+    def _calculation_finished(self, results, current_inputs, report):
+        """Store and display results from a completed calculation"""
+        self.results = results
+        self.current_inputs = current_inputs
+
+        # Display results
+        self.results_display.display_text(report)
+
+        # Update algorithm combo
+        self.viz_panel.algo_combo['values'] = list(self.results)
+        self.viz_panel.algo_combo.set('FCFS')
+
+        best_algo = min(self.results.items(), key=lambda x: x[1]['seek_count'])
+        stats = default_cache.stats()
+        self.status_var.set(self._with_timings(
+            f"✓ Calculated {len(self.results)} algorithms successfully "
+            f"(cache: {stats['hits']} hits, {stats['misses']} misses)"
+        ))
+        messagebox.showinfo(
+            "Success", 
+            f"All algorithms calculated successfully!\n\n" +
+            f"Requests: {len(current_inputs['requests'])}\n" +
+            f"Best Algorithm: {best_algo[0]}"
+        )
 
-        except ValueError as e:
+    def _calculation_failed(self, error):
+        """Report an error raised by the calculation worker"""
+        if isinstance(error, ValueError):
             self.status_var.set("Error in input validation")
-            messagebox.showerror("Input Error", str(e))
-        except Exception as e:
+            messagebox.showerror("Input Error", str(error))
+        else:
             self.status_var.set("Calculation error")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            messagebox.showerror("Error", f"An error occurred: {str(error)}")
+
+    def _set_busy(self, busy):
+        """Toggle controls and progress display while a calculation runs"""
+        state = 'disabled' if busy else 'normal'
+        for button in (self.calc_button, self.viz_button, self.compare_button, self.clear_button):
+            button.config(state=state)
+
+        if busy:
+            self.progress_bar['value'] = 0
+            self.cancel_button.pack(side='right', padx=5)
+            self.progress_bar.pack(side='right', padx=5)
+        else:
+            self.progress_bar.pack_forget()
+            self.cancel_button.pack_forget()
+
+    @staticmethod
+    @instrument()
+    def format_report(results, current_inputs):
+        """
+        Build the results text for a completed calculation
 
-    def display_results(self):
-        """Display calculation results"""
-        if not self.results:
-            return
+        Runs on the calculation worker. Long sequences are cut off after
+        MAX_DISPLAYED_STEPS entries, so the text stays small enough for
+        the Tk thread to insert without stalling on large traces.
 
+        Returns:
+            str: Report shown in the results panel
+        """
         # Get best algorithm
-        best_algo = min(self.results.items(), key=lambda x: x[1]['seek_count'])
+        best_algo = min(results.items(), key=lambda x: x[1]['seek_count'])
 
         # Build output text
         output = "=" * 70 + "\n"
         output += "INPUT PARAMETERS\n"
         output += "=" * 70 + "\n"
-        output += f"Request Queue: {self.current_inputs['requests']}\n"
-        output += f"Initial Head Position: {self.current_inputs['head_start']}\n"
-        output += f"Disk Size: {self.current_inputs['disk_size']} cylinders\n"
-        output += f"Direction: {self.current_inputs['direction'].upper()}\n\n"
+        output += f"Request Queue: {_summarize_values(current_inputs['requests'])}\n"
+        output += f"Initial Head Position: {current_inputs['head_start']}\n"
+        output += f"Disk Size: {current_inputs['disk_size']} cylinders\n"
+        output += f"Direction: {current_inputs['direction'].upper()}\n"
+        if current_inputs.get('sectors') is not None:
+            output += f"Sectors: {_summarize_values(current_inputs['sectors'])}\n"
+        output += "\n"
 
         # Results for each algorithm
-        for algo_name, result in self.results.items():
+        for algo_name, result in results.items():
             is_best = (algo_name == best_algo[0])
             output += format_result_text(algo_name, result, is_best)
 
         # Summary
-        stats = calculate_statistics(self.results)
+        stats = calculate_statistics(results)
         output += "=" * 70 + "\n"
         output += "STATISTICAL SUMMARY\n"
         output += "=" * 70 + "\n"
         output += f"Best Performance: {best_algo[0]} ({best_algo[1]['seek_count']} cylinders)\n"
-        output += f"Worst Performance: {max(self.results.items(), key=lambda x: x[1]['seek_count'])[0]} "
+        output += f"Worst Performance: {max(results.items(), key=lambda x: x[1]['seek_count'])[0]} "
         output += f"({stats['max_seek']} cylinders)\n"
         output += f"Average Seek Count: {stats['avg_seek']:.2f} cylinders\n"
-        output += f"Performance Range: {stats['range']} cylinders\n\n"
+        output += f"Performance Range: {stats['range']} cylinders\n"
+        if all('wait_max' in result for result in results.values()):
+            steadiest = min(results.items(), key=lambda x: (x[1]['wait_p99'], x[1]['wait_max']))
+            output += (f"Lowest Tail Latency: {steadiest[0]} (p99 wait {steadiest[1]['wait_p99']}, "
+                       f"max {steadiest[1]['wait_max']} cylinders)\n")
+        if all('iops' in result for result in results.values()):
+            fastest = max(results.items(), key=lambda x: x[1]['iops'])
+            output += f"Highest Throughput: {fastest[0]} ({fastest[1]['iops']:.1f} IOPS)\n"
+        output += "\n"
 
         output += "RECOMMENDATION:\n"
         output += f"Use {best_algo[0]} algorithm for optimal performance!\n"
 
-        # Display
-        self.results_display.display_text(output)
+        return output
 
     def visualize_selected(self):
         """Visualize selected algorithm"""
@@ -300,7 +552,7 @@ class DiskSchedulerApp:
                 self.current_inputs['head_start']
             )
 
-            self.status_var.set(f"Visualized {algo_name} algorithm")
+            self.status_var.set(self._with_timings(f"Visualized {algo_name} algorithm"))
 
         except Exception as e:
             messagebox.showerror("Visualization Error", str(e))
@@ -341,6 +593,21 @@ class DiskSchedulerApp:
         except Exception as e:
             messagebox.showerror("Export Error", str(e))
 
+    def export_sequence(self):
+        """Export the selected algorithm's seek sequence to CSV, one row per step"""
+        if not self.results:
+            messagebox.showwarning("No Data", "Please calculate algorithms first!")
+            return
+
+        try:
+            algo_name = self.viz_panel.algo_var.get()
+            filename = f"disk_scheduler_{algo_name.lower()}_sequence.csv"
+            export_sequence_to_csv(self.results[algo_name]['sequence'], filename)
+            messagebox.showinfo("Export Success", f"{algo_name} sequence exported to {filename}")
+            self.status_var.set(f"{algo_name} sequence exported to {filename}")
+        except Exception as e:
+            messagebox.showerror("Export Error", str(e))
+
     def clear_all(self):
         """Clear all data and reset"""
         self.input_frame.clear()
@@ -348,8 +615,83 @@ class DiskSchedulerApp:
         self.viz_panel.clear()
         self.results = {}
         self.current_inputs = {}
+        self.last_scheduler = None
         self.status_var.set("All data cleared")
 
+    def _with_timings(self, message):
+        """Append the slowest profiled phases to a status message"""
+        if not profiler.enabled:
+            return message
+        return f"{message}  —  {profiler.summary(limit=3)}"
+
+    def apply_profiling_settings(self):
+        """Enable or disable instrumentation from the Performance menu"""
+        profiler.disable()
+        if self.profiling_var.get():
+            profiler.enable(
+                trace_memory=self.trace_memory_var.get(),
+                cprofile=self.cprofile_var.get()
+            )
+            self.status_var.set("Profiling enabled")
+        else:
+            self.status_var.set("Profiling disabled")
+
+    def show_performance_panel(self):
+        """Show per-phase timings in a separate window"""
+        panel = tk.Toplevel(self.root)
+        panel.title("Performance")
+        panel.geometry("780x360")
+
+        text = tk.Text(panel, font=('Courier', 9), wrap='none')
+        text.pack(fill='both', expand=True, padx=10, pady=(10, 5))
+
+        def refresh():
+            text.delete('1.0', tk.END)
+            text.insert('1.0', profiler.format_report())
+
+        def reset():
+            self.reset_profiling()
+            refresh()
+
+        button_frame = tk.Frame(panel)
+        button_frame.pack(pady=(0, 10))
+        tk.Button(button_frame, text="Refresh", command=refresh, width=10).pack(side='left', padx=5)
+        tk.Button(button_frame, text="Reset", command=reset, width=10).pack(side='left', padx=5)
+        refresh()
+
+    def save_cprofile_stats(self):
+        """Write collected cProfile statistics to a file"""
+        filename = filedialog.asksaveasfilename(
+            defaultextension='.prof',
+            filetypes=[("cProfile stats", "*.prof"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        try:
+            profiler.dump_cprofile(filename)
+            self.status_var.set(f"cProfile stats saved to {filename}")
+        except (RuntimeError, OSError) as e:
+            messagebox.showerror("Profiling Error", str(e))
+
+    def save_memory_snapshot(self):
+        """Write a tracemalloc snapshot to a file"""
+        filename = filedialog.asksaveasfilename(
+            defaultextension='.snapshot',
+            filetypes=[("tracemalloc snapshot", "*.snapshot"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        try:
+            profiler.dump_tracemalloc(filename)
+            self.status_var.set(f"Memory snapshot saved to {filename}")
+        except (RuntimeError, OSError) as e:
+            messagebox.showerror("Profiling Error", str(e))
+
+    def reset_profiling(self):
+        """Discard collected profiling data"""
+        profiler.reset()
+        self.status_var.set("Profiling counters reset")
+
     def show_about(self):
         """Show about dialog"""
         about_text = """
@@ -357,14 +699,18 @@ class DiskSchedulerApp:
         Version 1.0
 
         A comprehensive tool to compare and visualize
-        5 disk scheduling algorithms.
+        8 disk scheduling algorithms.
 
         Algorithms Implemented:
         • FCFS (First Come First Serve)
+        • SSTF (Shortest Seek Time First)
         • SCAN (Elevator Algorithm)
         • C-SCAN (Circular SCAN)
         • LOOK
         • C-LOOK
+        • DEADLINE
+        • ANTICIPATORY
+        • SATF (with per-request sectors)
 
         Created for educational purposes.
         © 2026
@@ -394,7 +740,16 @@ DISK SCHEDULING ALGORITHMS - DETAILED INFORMATION
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-2. SCAN (Elevator Algorithm)
+2. SSTF (Shortest Seek Time First)
+   • Always services the closest pending request
+   • Greedy choice based on current head position
+   • Advantages: Low average seek time
+   • Disadvantages: Far requests can starve
+   • Best for: Throughput-oriented batch workloads
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+3. SCAN (Elevator Algorithm)
    • Moves head in one direction to disk end
    • Reverses direction and continues
    • Advantages: Better than FCFS for heavy loads
@@ -403,7 +758,7 @@ DISK SCHEDULING ALGORITHMS - DETAILED INFORMATION
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-3. C-SCAN (Circular SCAN)
+4. C-SCAN (Circular SCAN)
    • Moves to disk end, jumps to start
    • Services requests in one direction only
    • Advantages: Uniform waiting time
@@ -412,7 +767,7 @@ DISK SCHEDULING ALGORITHMS - DETAILED INFORMATION
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-4. LOOK
+5. LOOK
    • Like SCAN but reverses at last request
    • More efficient than SCAN
    • Advantages: No unnecessary disk end travel
@@ -421,7 +776,7 @@ DISK SCHEDULING ALGORITHMS - DETAILED INFORMATION
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-5. C-LOOK
+6. C-LOOK
    • Like C-SCAN but jumps from last to first request
    • Most efficient algorithm
    • Advantages: Lowest seek time, best throughput
@@ -430,12 +785,57 @@ DISK SCHEDULING ALGORITHMS - DETAILED INFORMATION
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+7. DEADLINE
+   • One-way elevator, dispatched in batches of 16
+   • Every request expires after two full-disk sweeps of head travel
+   • Overdue requests are serviced first, oldest first
+   • Advantages: Bounded waiting, no starvation
+   • Disadvantages: More seeking than LOOK once requests expire
+   • Best for: Latency-sensitive workloads
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+8. ANTICIPATORY
+   • DEADLINE plus short backward seeks
+   • Goes back up to 1/32 of the disk when that is less than
+     half the distance of the next request ahead
+   • Advantages: Keeps the head near recent requests
+   • Disadvantages: Can delay requests further ahead
+   • Best for: Clustered or sequential workloads
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+9. SATF (Shortest Access Time First)
+   • Runs when a sector is entered for every request
+   • Picks the request with the lowest seek + rotational delay
+   • Tracks the platter angle as time passes
+   • Advantages: Highest throughput on real drives
+   • Disadvantages: Needs sector positions, can starve requests
+   • Best for: Deep queues on rotating disks
+
+   With sectors, every algorithm's service time and IOPS are
+   estimated on the same rotating drive model.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+   Wait percentiles (p50/p95/p99/max) count the cylinders the
+   head travels before reaching each request.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
 PERFORMANCE RANKING (Typical):
 1. C-LOOK ★★★★★ (Best)
 2. LOOK ★★★★☆
-3. C-SCAN ★★★☆☆
-4. SCAN ★★☆☆☆
-5. FCFS ★☆☆☆☆ (Worst)
+3. SSTF ★★★★☆
+4. C-SCAN ★★★☆☆
+5. SCAN ★★☆☆☆
+6. FCFS ★☆☆☆☆ (Worst)
+
+   DEADLINE and ANTICIPATORY are not ranked here: they give up
+   some seek distance to bound the longest wait, so compare them
+   on the wait percentiles instead (their seek totals usually land
+   near C-LOOK and LOOK respectively). SATF is compared on service
+   time, since it optimizes rotation as well as seeking.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         """
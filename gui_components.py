@@ -3,11 +3,54 @@ GUI Components for Disk Scheduler
 Modular GUI components for better organization
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+
+import numpy as np
+
+from algorithms import ALGORITHM_NAMES
+from profiling import instrument
+from sequences import RunLengthSequence
+from utils import decimate_minmax
+
+# Point markers are drawn only when at most this many points are plotted
+MARKER_POINT_LIMIT = 300
+
+# Matplotlib classes, imported on first use (see load_plotting)
+_plotting = None
+_plotting_lock = threading.Lock()
+
+
+def load_plotting():
+    """
+    Import the Matplotlib classes used for charts
+
+    Matplotlib takes seconds to import on slow machines, so it is loaded
+    on the first chart (or by warm_up_plotting) instead of at startup.
+
+    Returns:
+        tuple: (Figure, FigureCanvasTkAgg, NavigationToolbar2Tk)
+    """
+    global _plotting
+    with _plotting_lock:
+        if _plotting is None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+            from matplotlib.figure import Figure
+            _plotting = (Figure, FigureCanvasTkAgg, NavigationToolbar2Tk)
+    return _plotting
+
+
+def warm_up_plotting():
+    """
+    Import Matplotlib on a background thread
+
+    Returns:
+        threading.Thread: The started daemon thread
+    """
+    thread = threading.Thread(target=load_plotting, daemon=True)
+    thread.start()
+    return thread
 
 
 class InputFrame:
@@ -30,7 +73,7 @@ class InputFrame:
         # Request Queue
         tk.Label(
             self.frame, 
-            text="Request Queue (comma-separated):", 
+            text="Request Queue (comma/space-separated):", 
             font=('Arial', 10), 
             bg='#ffffff'
         ).grid(row=0, column=0, sticky='w', pady=5)
@@ -91,13 +134,25 @@ class InputFrame:
             bg='#ffffff'
         ).pack(side='left', padx=5)
 
+        # Sectors (enables rotation-aware SATF)
+        tk.Label(
+            self.frame, 
+            text="Sectors (optional, one per request):", 
+            font=('Arial', 10), 
+            bg='#ffffff'
+        ).grid(row=4, column=0, sticky='w', pady=5)
+
+        self.sector_entry = tk.Entry(self.frame, width=50, font=('Arial', 10))
+        self.sector_entry.grid(row=4, column=1, pady=5, padx=10)
+
     def get_values(self):
         """Get all input values"""
         return {
             'requests': self.request_entry.get(),
             'head': self.head_entry.get(),
             'disk_size': self.disk_size_entry.get(),
-            'direction': self.direction_var.get()
+            'direction': self.direction_var.get(),
+            'sectors': self.sector_entry.get()
         }
 
     def clear(self):
@@ -105,6 +160,7 @@ class InputFrame:
         self.request_entry.delete(0, tk.END)
         self.head_entry.delete(0, tk.END)
         self.disk_size_entry.delete(0, tk.END)
+        self.sector_entry.delete(0, tk.END)
         self.direction_var.set('right')
 
 
@@ -174,6 +230,9 @@ class VisualizationPanel:
         )
 
         self.current_canvas = None
+        self._line = None
+        self._x = None
+        self._y = None
         self.create_widgets()
 
     def create_widgets(self):
@@ -193,7 +252,7 @@ class VisualizationPanel:
         self.algo_combo = ttk.Combobox(
             control_frame,
             textvariable=self.algo_var,
-            values=['FCFS', 'SCAN', 'C-SCAN', 'LOOK', 'C-LOOK'],
+            values=list(ALGORITHM_NAMES),
             state='readonly',
             width=15
         )
@@ -203,23 +262,39 @@ class VisualizationPanel:
         self.canvas_frame = tk.Frame(self.frame, bg='#ffffff')
         self.canvas_frame.pack(fill='both', expand=True, pady=10)
 
+    @instrument()
     def visualize(self, algo_name, result, head_start):
-        """Create visualization for selected algorithm"""
+        """
+        Create visualization for selected algorithm
+
+        Long sequences are drawn with min/max decimation (at most four
+        points per pixel column) and without markers; zooming or panning
+        re-decimates the visible range from the full data.
+        """
         # Clear previous canvas
-        for widget in self.canvas_frame.winfo_children():
-            widget.destroy()
+        self.clear()
 
         # Create figure
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = load_plotting()
         fig = Figure(figsize=(7, 5), dpi=100)
         ax = fig.add_subplot(111)
 
         sequence = result['sequence']
-        x_pos = list(range(len(sequence)))
+        if isinstance(sequence, RunLengthSequence):
+            # Draw runs directly (two vertices per run) instead of expanding
+            x_pos, y_pos = sequence.plot_points()
+        else:
+            x_pos = np.arange(len(sequence))
+            y_pos = sequence
+        self._x = np.asarray(x_pos)
+        self._y = np.asarray(y_pos)
 
         # Plot head movement
-        ax.plot(x_pos, sequence, 'b-o', linewidth=2.5, markersize=8, 
-                label='Head Movement', markerfacecolor='#2196F3', 
-                markeredgecolor='white', markeredgewidth=1.5)
+        x_shown, y_shown = decimate_minmax(self._x, self._y, self._pixel_columns(ax))
+        self._line, = ax.plot(x_shown, y_shown, 'b-', linewidth=2.5, markersize=8,
+                              label='Head Movement', markerfacecolor='#2196F3',
+                              markeredgecolor='white', markeredgewidth=1.5)
+        self._line.set_marker('o' if x_shown.size <= MARKER_POINT_LIMIT else 'None')
 
         # Initial position line
         ax.axhline(y=head_start, color='red', linestyle='--', 
@@ -257,16 +332,37 @@ class VisualizationPanel:
 
         fig.tight_layout()
 
-        # Embed in tkinter
+        # Embed in tkinter, with a toolbar for zooming and panning
         canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
+        toolbar = NavigationToolbar2Tk(canvas, self.canvas_frame)
+        toolbar.update()
         canvas.draw()
         canvas.get_tk_widget().pack(fill='both', expand=True)
         self.current_canvas = canvas
 
+        ax.callbacks.connect('xlim_changed', self._redecimate)
+
+    @staticmethod
+    def _pixel_columns(ax):
+        """Width of the plotting area in pixels"""
+        return max(int(ax.bbox.width), 1)
+
+    def _redecimate(self, ax):
+        """Rebuild the plotted line for the visible x range"""
+        x_min, x_max = ax.get_xlim()
+        x_shown, y_shown = decimate_minmax(self._x, self._y, self._pixel_columns(ax), x_min, x_max)
+        self._line.set_data(x_shown, y_shown)
+        self._line.set_marker('o' if x_shown.size <= MARKER_POINT_LIMIT else 'None')
+        self.current_canvas.draw_idle()
+
     def clear(self):
         """Clear visualization"""
         for widget in self.canvas_frame.winfo_children():
             widget.destroy()
+        self.current_canvas = None
+        self._line = None
+        self._x = None
+        self._y = None
 
 
 class ComparisonChart:
@@ -275,15 +371,19 @@ class ComparisonChart:
     def __init__(self, parent):
         self.frame = tk.Frame(parent, bg='#ffffff')
 
+    @instrument()
     def create_bar_chart(self, results):
         """Create bar chart comparing all algorithms"""
+        Figure, FigureCanvasTkAgg, _ = load_plotting()
         fig = Figure(figsize=(8, 4), dpi=100)
         ax = fig.add_subplot(111)
 
         algorithms = list(results.keys())
         seek_counts = [results[algo]['seek_count'] for algo in algorithms]
 
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8']
+        palette = ['#FF6B6B', '#C39BD3', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8',
+                   '#F7DC6F', '#85C1E9', '#F0B27A']
+        colors = [palette[i % len(palette)] for i in range(len(algorithms))]
         bars = ax.bar(algorithms, seek_counts, color=colors, edgecolor='black', linewidth=1.5)
 
         # Highlight best algorithm
@@ -302,6 +402,8 @@ class ComparisonChart:
         for i, (bar, count) in enumerate(zip(bars, seek_counts)):
             height = bar.get_height()
             label = f'{count}'
+            if 'iops' in results[algorithms[i]]:
+                label += f"\n{results[algorithms[i]]['iops']:.0f} IOPS"
             if i == best_idx:
                 label += '\n★ BEST'
             ax.text(bar.get_x() + bar.get_width()/2., height,
@@ -0,0 +1,268 @@
+"""
+Out-of-Core Disk Scheduling
+Bounded-memory scheduling of traces larger than RAM
+"""
+
+import numpy as np
+
+from algorithms import closed_form_seek
+
+OUT_OF_CORE_ALGORITHMS = ('FCFS', 'SCAN', 'C-SCAN', 'LOOK', 'C-LOOK')
+
+# Requests read per chunk from the trace
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def cylinder_histogram(requests, disk_size, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Count requests per cylinder, reading the trace chunk by chunk
+
+    Args:
+        requests (array-like): Requests (ndarray, memmap or trace view)
+        disk_size (int): Total number of cylinders
+        chunk_size (int): Requests read per chunk
+
+    Returns:
+        ndarray: int64 array of length disk_size with one count per cylinder
+
+    Raises:
+        ValueError: If a request lies outside 0..disk_size-1
+    """
+    counts = np.zeros(disk_size, dtype=np.int64)
+    for start in range(0, len(requests), chunk_size):
+        chunk = np.asarray(requests[start:start + chunk_size])
+        bad = np.flatnonzero((chunk < 0) | (chunk >= disk_size))
+        if bad.size:
+            raise ValueError(
+                f"Request {chunk[bad[0]]} at index {start + bad[0]} is out of range (0-{disk_size - 1})"
+            )
+        counts += np.bincount(chunk, minlength=disk_size)
+    return counts
+
+
+class CylinderRuns:
+    """Sorted view of the requests in a cylinder range, backed by a histogram
+
+    Iterating expands cylinders in order without ever holding more than
+    one chunk of the expanded sequence.
+    """
+
+    def __init__(self, counts, start, stop, descending=False):
+        """
+        Args:
+            counts (ndarray): Requests per cylinder
+            start (int): First cylinder of the range
+            stop (int): One past the last cylinder of the range
+            descending (bool): Yield cylinders from high to low
+        """
+        self.counts = counts
+        self.start = start
+        self.stop = stop
+        self.descending = descending
+
+    def reversed(self):
+        """Same range in the opposite order"""
+        return CylinderRuns(self.counts, self.start, self.stop, not self.descending)
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Yield the expanded cylinders in chunks of at most chunk_size
+
+        Args:
+            chunk_size (int): Maximum cylinders per chunk
+
+        Yields:
+            ndarray: int64 cylinder numbers in order
+        """
+        cylinders = np.flatnonzero(self.counts[self.start:self.stop]) + self.start
+        if self.descending:
+            cylinders = cylinders[::-1]
+        if not cylinders.size:
+            return
+
+        repeats = self.counts[cylinders]
+        cumulative = np.cumsum(repeats)
+        total = int(cumulative[-1])
+
+        # Locate the cylinders covering expanded positions [first, last)
+        for first in range(0, total, chunk_size):
+            last = min(first + chunk_size, total)
+            i = int(np.searchsorted(cumulative, first, side='right'))
+            j = int(np.searchsorted(cumulative, last - 1, side='right'))
+
+            chunk_repeats = repeats[i:j + 1].copy()
+            if i == j:
+                chunk_repeats[0] = last - first
+            else:
+                chunk_repeats[0] = cumulative[i] - first
+                chunk_repeats[-1] = last - cumulative[j - 1]
+            yield np.repeat(cylinders[i:j + 1], chunk_repeats)
+
+
+class OutOfCoreScheduler:
+    """Scheduler for FCFS and the SCAN family with memory bounded by disk_size
+
+    Requests are read in chunks (typically from a memory-mapped trace)
+    into a per-cylinder histogram instead of being sorted in memory. The
+    histogram gives the sorted order and the request extremes, so seek
+    totals and streamed sequences match DiskScheduler exactly while the
+    working set stays O(disk_size + chunk_size).
+    """
+
+    def __init__(self, requests, head_start, disk_size, direction='right',
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the out-of-core scheduler
+
+        Args:
+            requests (array-like): Requests supporting len() and slicing
+                (ndarray, np.memmap, Trace.cylinders)
+            head_start (int): Initial head position
+            disk_size (int): Total number of cylinders
+            direction (str): Initial direction ('right' or 'left')
+            chunk_size (int): Requests processed per chunk
+        """
+        self.requests = requests
+        self.head_start = head_start
+        self.disk_size = disk_size
+        self.direction = direction.lower()
+        self.chunk_size = chunk_size
+        self._counts = None
+
+    def _histogram(self):
+        """Per-cylinder request counts (built once, on first use)"""
+        if self._counts is None:
+            self._counts = cylinder_histogram(self.requests, self.disk_size, self.chunk_size)
+        return self._counts
+
+    def _extremes(self):
+        """
+        Smallest and largest request on each side of the head
+
+        Returns:
+            tuple: (left_min, left_max, right_min, right_max); None for an empty side
+        """
+        occupied = np.flatnonzero(self._histogram())
+        split = int(np.searchsorted(occupied, self.head_start, side='left'))
+        left, right = occupied[:split], occupied[split:]
+        return (int(left[0]) if left.size else None, int(left[-1]) if left.size else None,
+                int(right[0]) if right.size else None, int(right[-1]) if right.size else None)
+
+    def _fcfs_seek(self):
+        """Total FCFS seek distance, carrying the last position across chunks"""
+        seek_count = 0
+        position = self.head_start
+        for start in range(0, len(self.requests), self.chunk_size):
+            chunk = np.asarray(self.requests[start:start + self.chunk_size], dtype=np.int64)
+            if not chunk.size:
+                continue
+            seek_count += abs(int(chunk[0]) - position)
+            seek_count += int(np.abs(np.diff(chunk)).sum())
+            position = int(chunk[-1])
+        return seek_count
+
+    def get_metrics(self, algo_name):
+        """
+        Calculate seek metrics for one algorithm
+
+        Args:
+            algo_name (str): 'FCFS', 'SCAN', 'C-SCAN', 'LOOK' or 'C-LOOK'
+
+        Returns:
+            dict: Contains seek_count and avg_seek_time
+        """
+        if algo_name not in OUT_OF_CORE_ALGORITHMS:
+            raise ValueError(f"Algorithm '{algo_name}' is not supported out of core")
+
+        if algo_name == 'FCFS':
+            seek_count = self._fcfs_seek()
+        else:
+            left_min, left_max, right_min, right_max = self._extremes()
+            seek_count = closed_form_seek(
+                algo_name,
+                self.head_start,
+                self.disk_size,
+                int(self.direction == 'right'),
+                int(left_min is not None), left_min or 0, left_max or 0,
+                int(right_min is not None), right_min or 0, right_max or 0
+            )
+        n = len(self.requests)
+        return {
+            'seek_count': seek_count,
+            'avg_seek_time': seek_count / n if n else 0
+        }
+
+    def get_all_metrics(self):
+        """
+        Calculate seek metrics for every supported algorithm
+
+        Returns:
+            dict: Metrics keyed by algorithm name
+        """
+        return {name: self.get_metrics(name) for name in OUT_OF_CORE_ALGORITHMS}
+
+    def _sequence_parts(self, algo_name):
+        """Sequence parts in the same order as DiskScheduler._sequence_parts"""
+        head = [self.head_start]
+        end = self.disk_size - 1
+        going_right = self.direction == 'right'
+
+        if algo_name == 'FCFS':
+            return [head, self.requests]
+        if algo_name not in OUT_OF_CORE_ALGORITHMS:
+            raise ValueError(f"Algorithm '{algo_name}' is not supported out of core")
+
+        counts = self._histogram()
+        left = CylinderRuns(counts, 0, min(self.head_start, self.disk_size))
+        right = CylinderRuns(counts, self.head_start, self.disk_size)
+
+        if algo_name == 'SCAN':
+            if going_right:
+                return [head, right, [end], left.reversed()]
+            return [head, left.reversed(), [0], right]
+        if algo_name == 'C-SCAN':
+            if going_right:
+                return [head, right, [end, 0], left]
+            return [head, left, [0, end], right]
+        if algo_name == 'LOOK':
+            if going_right:
+                return [head, right, left.reversed()]
+            return [head, left.reversed(), right]
+        if going_right:
+            return [head, right, left]
+        return [head, left, right]
+
+    def iter_sequence_chunks(self, algo_name, chunk_size=None):
+        """
+        Stream the seek sequence of one algorithm in bounded chunks
+
+        Args:
+            algo_name (str): 'FCFS', 'SCAN', 'C-SCAN', 'LOOK' or 'C-LOOK'
+            chunk_size (int): Maximum cylinders per chunk (defaults to the
+                scheduler's chunk size)
+
+        Yields:
+            ndarray: int64 slices of the sequence
+        """
+        chunk_size = chunk_size or self.chunk_size
+        for part in self._sequence_parts(algo_name):
+            if isinstance(part, CylinderRuns):
+                yield from part.iter_chunks(chunk_size)
+            elif isinstance(part, list):
+                yield np.array(part, dtype=np.int64)
+            else:
+                for start in range(0, len(part), chunk_size):
+                    yield np.asarray(part[start:start + chunk_size], dtype=np.int64)
+
+    def iter_sequence(self, algo_name):
+        """
+        Stream the seek sequence of one algorithm as Python ints
+
+        Args:
+            algo_name (str): 'FCFS', 'SCAN', 'C-SCAN', 'LOOK' or 'C-LOOK'
+
+        Yields:
+            int: Cylinder numbers, starting with the head position
+        """
+        for chunk in self.iter_sequence_chunks(algo_name):
+            yield from chunk.tolist()
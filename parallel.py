@@ -0,0 +1,168 @@
+"""
+Parallel Disk Scheduling
+Fans algorithms and scenario chunks out to a process pool
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from algorithms import ALGORITHM_NAMES, CLASSIC_ALGORITHMS
+from batch import BatchScheduler
+from vectorized import VectorizedDiskScheduler
+
+
+class SharedArray:
+    """int64 array stored in shared memory so workers can read it without pickling"""
+
+    def __init__(self, values):
+        """
+        Copy values into a new shared memory block
+
+        Args:
+            values (array-like): Integers to share
+        """
+        values = np.asarray(values, dtype=np.int64)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        self.array = np.ndarray(values.shape, dtype=np.int64, buffer=self._shm.buf)
+        self.array[:] = values
+        self.handle = (self._shm.name, values.size)
+
+    def close(self):
+        """Release and unlink the shared memory block"""
+        if self._shm is not None:
+            self.array = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+def _attach(handle):
+    """Map a SharedArray handle in a worker; returns (shared_memory, ndarray view)"""
+    name, length = handle
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray((length,), dtype=np.int64, buffer=shm.buf)
+
+
+def _run_algorithm(handle, head_start, disk_size, direction, algo_name, metrics_only):
+    """Worker task: one algorithm for one scenario"""
+    shm, requests = _attach(handle)
+    scheduler = None
+    try:
+        # Read the shared block in place; sorting makes the only private copy
+        scheduler = VectorizedDiskScheduler(requests, head_start, disk_size, direction, copy=False)
+        if metrics_only:
+            return algo_name, scheduler.get_metrics(algo_name)
+        return algo_name, scheduler.get_result(algo_name)
+    finally:
+        del requests, scheduler
+        shm.close()
+
+
+def _evaluate_chunk(requests_handle, sorted_handle, scenarios, algorithms):
+    """Worker task: batch evaluation of one chunk of scenarios"""
+    shm, requests = _attach(requests_handle)
+    sorted_shm, sorted_requests = _attach(sorted_handle)
+    try:
+        return BatchScheduler(requests, sorted_requests).evaluate(scenarios, algorithms)
+    finally:
+        del requests, sorted_requests
+        shm.close()
+        sorted_shm.close()
+
+
+class ParallelScheduler:
+    """Runs scheduling work for one request set on a process pool
+
+    The request array (and its sorted copy for scenario sweeps) is placed
+    in shared memory once; tasks only carry the shared block names and
+    the scenario parameters. Use as a context manager so the pool and the
+    shared memory are released.
+    """
+
+    def __init__(self, requests, max_workers=None):
+        """
+        Initialize the parallel scheduler
+
+        Args:
+            requests (array-like): Cylinder requests in arrival order
+            max_workers (int): Worker processes (defaults to the CPU count)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._requests = SharedArray(requests)
+        self._sorted = None
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Shut down the pool and release shared memory"""
+        self._executor.shutdown(wait=True)
+        self._requests.close()
+        if self._sorted is not None:
+            self._sorted.close()
+
+    def get_all_results(self, head_start, disk_size, direction='right',
+                        algorithms=ALGORITHM_NAMES, metrics_only=False):
+        """
+        Run each algorithm in its own worker process
+
+        Args:
+            head_start (int): Initial head position
+            disk_size (int): Total number of cylinders
+            direction (str): Initial direction ('right' or 'left')
+            algorithms (iterable): Algorithm names to run
+            metrics_only (bool): Return only seek_count/avg_seek_time, which
+                avoids sending sequences back from the workers
+
+        Returns:
+            dict: Results keyed by algorithm name, in the same format as
+                DiskScheduler.get_all_results() (sequences are ndarrays)
+        """
+        futures = [
+            self._executor.submit(_run_algorithm, self._requests.handle, head_start,
+                                  disk_size, direction, algo_name, metrics_only)
+            for algo_name in algorithms
+        ]
+        return dict(future.result() for future in futures)
+
+    def evaluate(self, scenarios, algorithms=CLASSIC_ALGORITHMS, chunk_size=None):
+        """
+        Evaluate a scenario array in parallel chunks
+
+        Args:
+            scenarios (array-like): Shape (m, 3) array as for BatchScheduler.evaluate()
+            algorithms (iterable): Algorithm names to evaluate (see
+                BatchScheduler.evaluate for the cost of the deadline family)
+            chunk_size (int): Scenarios per task (defaults to an even split
+                across the workers)
+
+        Returns:
+            dict: Algorithm name -> int64 array of m seek counts
+        """
+        scenarios = np.atleast_2d(np.asarray(scenarios, dtype=np.int64))
+        algorithms = list(algorithms)
+        if self._sorted is None:
+            self._sorted = SharedArray(np.sort(self._requests.array))
+
+        if chunk_size is None:
+            chunk_size = max(1, -(-len(scenarios) // self.max_workers))
+        chunks = [scenarios[start:start + chunk_size]
+                  for start in range(0, len(scenarios), chunk_size)]
+
+        futures = [
+            self._executor.submit(_evaluate_chunk, self._requests.handle,
+                                  self._sorted.handle, chunk, algorithms)
+            for chunk in chunks
+        ]
+        partials = [future.result() for future in futures]
+
+        if not partials:
+            return {name: np.zeros(0, dtype=np.int64) for name in algorithms}
+        return {name: np.concatenate([part[name] for part in partials]) for name in algorithms}
@@ -0,0 +1,335 @@
+"""
+Performance Instrumentation for Disk Scheduler
+Opt-in per-phase timing, call counts, allocation tracking and profile dumps
+"""
+
+import cProfile
+import functools
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+# Shared no-op context returned while profiling is disabled
+_DISABLED = nullcontext()
+
+# Python 3.12+ allows one active cProfile per process, covering all threads
+_SHARED_CPROFILE = sys.version_info >= (3, 12)
+
+
+class PhaseStats:
+    """Accumulated measurements of one named phase"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.last_seconds = 0.0
+        self.max_seconds = 0.0
+        self.allocated_blocks = 0
+        self.peak_bytes = 0
+
+    def as_dict(self):
+        """
+        Snapshot of the measurements
+
+        Returns:
+            dict: calls, total/last/max/mean seconds, allocated_blocks, peak_bytes
+        """
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'total_seconds': self.total_seconds,
+            'last_seconds': self.last_seconds,
+            'max_seconds': self.max_seconds,
+            'mean_seconds': self.total_seconds / self.calls if self.calls else 0,
+            'allocated_blocks': self.allocated_blocks,
+            'peak_bytes': self.peak_bytes
+        }
+
+
+class _Phase:
+    """Context manager measuring one execution of a phase"""
+
+    __slots__ = ('profiler', 'name', 'start', 'blocks', 'base', 'peak')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        profiler = self.profiler
+        if profiler.trace_memory:
+            # Fold the parent's peak so far into it before resetting
+            stack = profiler._stack()
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.base = self.peak = current
+            stack.append(self)
+        self.blocks = sys.getallocatedblocks()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.start
+        blocks = sys.getallocatedblocks() - self.blocks
+        profiler = self.profiler
+
+        peak_bytes = 0
+        if profiler.trace_memory and tracemalloc.is_tracing():
+            stack = profiler._stack()
+            peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            if stack and stack[-1] is self:
+                stack.pop()
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            peak_bytes = peak - self.base
+        profiler._record(self.name, elapsed, blocks, peak_bytes)
+        return False
+
+
+class _ThreadProfile:
+    """Context manager running cProfile in a worker thread"""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.profile = cProfile.Profile()
+
+    def __enter__(self):
+        self.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profile.disable()
+        with self.profiler._lock:
+            self.profiler._thread_profiles.append(self.profile)
+        return False
+
+
+class Profiler:
+    """Opt-in instrumentation of named phases
+
+    While disabled, phase() returns a shared no-op context and instrumented
+    functions call straight through, so instrumentation can stay in hot
+    paths. When enabled, each phase records call count and wall time, the
+    net number of allocated memory blocks and, with trace_memory, the peak
+    traced memory above the phase's starting point. Optionally a cProfile
+    profile runs over the whole enabled period.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self._phases = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cprofile = None
+        self._thread_profiles = []
+
+    def enable(self, trace_memory=False, cprofile=False):
+        """
+        Start recording
+
+        Args:
+            trace_memory (bool): Track peak memory with tracemalloc (slows
+                allocation-heavy code noticeably)
+            cprofile (bool): Also run cProfile until disable()
+        """
+        self.trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if cprofile:
+            if self._cprofile is None:
+                self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording (collected statistics are kept)"""
+        self.enabled = False
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.trace_memory = False
+
+    def reset(self):
+        """Discard collected statistics and any cProfile data"""
+        with self._lock:
+            self._phases.clear()
+            self._thread_profiles.clear()
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile = None
+            if self.enabled:
+                self.enable(self.trace_memory, cprofile=True)
+
+    @property
+    def cprofile_active(self):
+        """Whether cProfile data is being collected"""
+        return self.enabled and self._cprofile is not None
+
+    def cprofile_thread(self):
+        """
+        Profile the calling worker thread into the cProfile data
+
+        Before Python 3.12 cProfile only follows the thread that enabled it,
+        so background threads wrap their work in this context. From 3.12 on
+        a single profiler is active per process and already sees every
+        thread, and enabling a second one raises ValueError, so the shared
+        profile is used as-is.
+
+        Returns:
+            context manager: Thread profiling context, or a no-op
+        """
+        if not self.cprofile_active or _SHARED_CPROFILE:
+            return _DISABLED
+        return _ThreadProfile(self)
+
+    def phase(self, name):
+        """
+        Measure a block of code as one call of a named phase
+
+        Args:
+            name (str): Phase name
+
+        Returns:
+            context manager: Recording context, or a no-op when disabled
+        """
+        if not self.enabled:
+            return _DISABLED
+        return _Phase(self, name)
+
+    def instrument(self, name=None):
+        """
+        Decorator recording every call of a function as a phase
+
+        Args:
+            name (str): Phase name (defaults to the function's qualified name)
+
+        Returns:
+            callable: Decorator
+        """
+        def decorator(func):
+            phase_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Phase(self, phase_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _stack(self):
+        """Open phases of the calling thread"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, name, elapsed, blocks, peak_bytes):
+        with self._lock:
+            stats = self._phases.get(name)
+            if stats is None:
+                stats = self._phases[name] = PhaseStats(name)
+            stats.calls += 1
+            stats.total_seconds += elapsed
+            stats.last_seconds = elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            stats.allocated_blocks += blocks
+            stats.peak_bytes = max(stats.peak_bytes, peak_bytes)
+
+    def report(self):
+        """
+        Collected statistics, slowest phase first
+
+        Returns:
+            list: PhaseStats.as_dict() for every phase
+        """
+        with self._lock:
+            rows = [stats.as_dict() for stats in self._phases.values()]
+        return sorted(rows, key=lambda row: row['total_seconds'], reverse=True)
+
+    def format_report(self):
+        """
+        Render the statistics as a fixed-width table
+
+        Returns:
+            str: Report text
+        """
+        rows = self.report()
+        if not rows:
+            return "No phases recorded. Enable profiling and run an analysis."
+
+        lines = [
+            f"{'Phase':<34}{'Calls':>7}{'Total ms':>11}{'Last ms':>10}{'Max ms':>10}"
+            f"{'Blocks':>10}{'Peak KB':>10}",
+            "-" * 92
+        ]
+        for row in rows:
+            lines.append(
+                f"{row['name'][:33]:<34}{row['calls']:>7}{row['total_seconds'] * 1000:>11.2f}"
+                f"{row['last_seconds'] * 1000:>10.2f}{row['max_seconds'] * 1000:>10.2f}"
+                f"{row['allocated_blocks']:>10}{row['peak_bytes'] / 1024:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def summary(self, limit=4):
+        """
+        One-line summary of the most expensive phases (for a status bar)
+
+        Args:
+            limit (int): Number of phases to include
+
+        Returns:
+            str: e.g. "DiskScheduler.get_result 12.3ms | validate_input 1.2ms"
+        """
+        rows = self.report()[:limit]
+        return " | ".join(f"{row['name']} {row['total_seconds'] * 1000:.1f}ms" for row in rows)
+
+    def dump_cprofile(self, path):
+        """
+        Write cProfile statistics collected since enable(cprofile=True)
+
+        Args:
+            path (str): Output file (readable with pstats / snakeviz)
+
+        Raises:
+            RuntimeError: If cProfile was not enabled
+        """
+        if self._cprofile is None:
+            raise RuntimeError("cProfile was not enabled")
+        # Collecting stats stops the profiler; resume it while still enabled
+        stats = pstats.Stats(self._cprofile)
+        if self.enabled:
+            self._cprofile.enable()
+        with self._lock:
+            thread_profiles = list(self._thread_profiles)
+        for thread_profile in thread_profiles:
+            stats.add(thread_profile)
+        stats.dump_stats(path)
+
+    def dump_tracemalloc(self, path):
+        """
+        Write a tracemalloc snapshot of currently traced allocations
+
+        Args:
+            path (str): Output file (load with tracemalloc.Snapshot.load)
+
+        Raises:
+            RuntimeError: If memory tracing is not active
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("Memory tracing is not active")
+        tracemalloc.take_snapshot().dump(path)
+
+
+# Process-wide profiler used by the instrumented modules
+profiler = Profiler()
+instrument = profiler.instrument
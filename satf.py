@@ -0,0 +1,296 @@
+"""
+Rotational-Position-Aware Disk Scheduling
+Shortest Access Time First (SATF / SPTF) over (cylinder, sector) requests
+"""
+
+import math
+from bisect import bisect_left
+from collections import Counter, deque
+
+from algorithms import _find
+from cost_models import DiskDriveModel
+from utils import find_out_of_range
+
+DEFAULT_SECTORS_PER_TRACK = 64
+
+# Queue steps between two checks of the cancel event
+CANCEL_CHECK_INTERVAL = 1024
+
+
+class SectorIndex:
+    """Pending requests grouped by sector, each group sorted by cylinder
+
+    Within one sector, a request's access time only grows with its seek
+    distance, so the best candidate of a sector is its nearest pending
+    cylinder on either side of the head, found by binary search. Serviced
+    slots are skipped with union-find links in both directions (as in
+    algorithms.deadline_order), so a lookup costs O(log n) however long
+    the queue is.
+    """
+
+    def __init__(self, requests, sectors, sectors_per_track):
+        """
+        Args:
+            requests (list): Cylinder of each request
+            sectors (list): Sector of each request
+            sectors_per_track (int): Sectors per revolution
+        """
+        groups = [[] for _ in range(sectors_per_track)]
+        for request_id, (cylinder, sector) in enumerate(zip(requests, sectors)):
+            groups[sector].append((cylinder, request_id))
+        for group in groups:
+            group.sort()
+
+        self.cylinders = [[cylinder for cylinder, _ in group] for group in groups]
+        self.ids = [[request_id for _, request_id in group] for group in groups]
+        # next_free[s][i]: first live slot >= i; prev_free[s][i + 1]: last
+        # live slot <= i, stored shifted by one
+        self.next_free = [list(range(len(group) + 1)) for group in groups]
+        self.prev_free = [list(range(len(group) + 1)) for group in groups]
+        self.pending = [len(group) for group in groups]
+        self._size = len(requests)
+
+    def __len__(self):
+        return self._size
+
+    def nearest(self, sector, cylinder):
+        """
+        Nearest pending requests of a sector around a cylinder
+
+        Returns:
+            list: Slots of the earliest request at the closest cylinder at
+                or above, and at the closest cylinder below (at most two)
+        """
+        cylinders = self.cylinders[sector]
+        next_free = self.next_free[sector]
+        split = bisect_left(cylinders, cylinder)
+        above = _find(next_free, split)
+        slots = [above] if above < len(cylinders) else []
+        below = _find(self.prev_free[sector], split) - 1
+        if below >= 0:
+            # Slots are ordered by (cylinder, arrival): use the earliest
+            slots.append(_find(next_free, bisect_left(cylinders, cylinders[below])))
+        return slots
+
+    def remove(self, sector, slot):
+        """Remove a queued request by its slot in the sector group"""
+        self.next_free[sector][slot] = slot + 1
+        self.prev_free[sector][slot + 1] = slot
+        self.pending[sector] -= 1
+        self._size -= 1
+
+
+class SATFScheduler:
+    """Shortest Access Time First scheduling with a rotating platter
+
+    Each request addresses a (cylinder, sector). The head position is a
+    cylinder plus an angle that advances with time at the drive's spindle
+    speed; the access time of a request is the seek (from the cost model's
+    seek table) plus the rotational wait until its sector passes under the
+    head, plus the transfer time. SATF always services the pending request
+    with the smallest access time. Ties go to the shorter seek, then to
+    the earliest arrival.
+    """
+
+    def __init__(self, requests, sectors, head_start, disk_size, cost_model=None,
+                 sectors_per_track=DEFAULT_SECTORS_PER_TRACK, start_sector=0):
+        """
+        Initialize the scheduler
+
+        Args:
+            requests (list): Cylinder of each request
+            sectors (list): Sector of each request (0..sectors_per_track-1)
+            head_start (int): Initial head cylinder
+            disk_size (int): Total number of cylinders
+            cost_model (DiskDriveModel): Seek curve, spindle speed and
+                transfer time (defaults to DiskDriveModel())
+            sectors_per_track (int): Sectors per revolution
+            start_sector (int): Sector under the head at time 0
+
+        Raises:
+            ValueError: If the inputs are inconsistent or out of range
+        """
+        if len(requests) != len(sectors):
+            raise ValueError("Each request needs exactly one sector")
+        bad = find_out_of_range(sectors, sectors_per_track)
+        if bad.size:
+            raise ValueError(f"Sector {sectors[bad[0]]} is out of range (0-{sectors_per_track - 1})")
+
+        self.requests = [int(r) for r in requests]
+        self.sectors = [int(s) for s in sectors]
+        self.head_start = head_start
+        self.disk_size = disk_size
+        self.cost_model = cost_model or DiskDriveModel()
+        self.sectors_per_track = sectors_per_track
+        self.start_sector = start_sector
+
+        self.revolution_ms = 60000.0 / self.cost_model.rpm
+        self.transfer_ms = getattr(self.cost_model, 'transfer_ms', 0.0)
+
+    def _angle(self, time_ms):
+        """Head angle (fraction of a revolution) at a point in time"""
+        return (self.start_sector / self.sectors_per_track + time_ms / self.revolution_ms) % 1.0
+
+    def _rotational_wait(self, sector, time_ms):
+        """Time until a sector reaches the head when arriving at time_ms"""
+        return ((sector / self.sectors_per_track - self._angle(time_ms)) % 1.0) * self.revolution_ms
+
+    def _access_time(self, sector, seek_ms, time_ms):
+        """
+        Seek plus rotational wait for a sector, starting at time_ms
+
+        Measured as the first pass of the sector after the seek ends,
+        counted in whole revolutions from its next pass after time_ms, so
+        requests catching the same pass get exactly equal access times
+        (and the tie falls to the shorter seek) instead of values that
+        differ by rounding.
+        """
+        wait = self._rotational_wait(sector, time_ms)
+        if seek_ms <= wait:
+            return wait
+        return wait + math.ceil((seek_ms - wait) / self.revolution_ms) * self.revolution_ms
+
+    def schedule(self, cancel_event=None):
+        """
+        Run SATF over the whole queue
+
+        Each step visits the sectors in the order they next pass under the
+        head and stops once a sector's rotational wait alone exceeds the
+        best access time found, checking at most two requests per sector.
+
+        Args:
+            cancel_event (threading.Event): Stops the run early when set
+
+        Returns:
+            dict: sequence (cylinders, starting with the head), sector_sequence,
+                seek_count, avg_seek_time, service_time_ms,
+                avg_service_time_ms and iops; None if cancelled
+        """
+        table = self.cost_model.lookup_table(self.disk_size)
+        index = SectorIndex(self.requests, self.sectors, self.sectors_per_track)
+        tracks = self.sectors_per_track
+        sector_ms = self.revolution_ms / tracks
+
+        position = self.head_start
+        now = 0.0
+        seek_count = 0
+        sequence = [self.head_start]
+        sector_sequence = []
+
+        steps = 0
+        while len(index):
+            steps += 1
+            if cancel_event is not None and steps % CANCEL_CHECK_INTERVAL == 0 and cancel_event.is_set():
+                return None
+
+            best = None
+            angle = self._angle(now)
+            first = math.ceil(angle * tracks)
+            # Rotational wait until sector `first` passes under the head
+            first_wait = (first / tracks - angle) * self.revolution_ms
+            for offset in range(tracks):
+                sector = (first + offset) % tracks
+                if not index.pending[sector]:
+                    continue
+                # Every request of this sector waits at least until it passes
+                if best is not None and first_wait + offset * sector_ms > best[0]:
+                    break
+                for slot in index.nearest(sector, position):
+                    cylinder = index.cylinders[sector][slot]
+                    distance = abs(cylinder - position)
+                    access = self._access_time(sector, table[distance], now)
+                    candidate = (access, distance, index.ids[sector][slot], sector, slot)
+                    if best is None or candidate < best:
+                        best = candidate
+
+            access, distance, _, sector, slot = best
+            cylinder = index.cylinders[sector][slot]
+            index.remove(sector, slot)
+            now += access + self.transfer_ms
+            seek_count += distance
+            position = cylinder
+            sequence.append(cylinder)
+            sector_sequence.append(sector)
+
+        result = {
+            'sequence': sequence,
+            'sector_sequence': sector_sequence,
+            'seek_count': seek_count,
+            'avg_seek_time': seek_count / len(self.requests) if self.requests else 0
+        }
+        result.update(self._time_metrics(now))
+        return result
+
+    def positioning_metrics(self, sequence):
+        """
+        Time any cylinder-order schedule on the same rotating drive
+
+        Cylinders in the sequence are matched to requests per cylinder in
+        arrival order (Counter-based), so each request's sector is used
+        exactly once; extra visits (SCAN end points, C-SCAN returns) are
+        plain seeks. This puts the cylinder-only algorithms and SATF on
+        the same time scale.
+
+        Args:
+            sequence (iterable): Cylinders in service order, starting with
+                the head position
+
+        Returns:
+            dict: service_time_ms, avg_service_time_ms and iops
+        """
+        table = self.cost_model.lookup_table(self.disk_size)
+        pending = {}
+        for cylinder, sector in zip(self.requests, self.sectors):
+            pending.setdefault(cylinder, deque()).append(sector)
+        remaining = Counter(self.requests)
+
+        cylinders = iter(sequence)
+        position = next(cylinders, self.head_start)
+        now = 0.0
+        for cylinder in cylinders:
+            cylinder = int(cylinder)
+            now += table[abs(cylinder - position)]
+            position = cylinder
+            if remaining[cylinder]:
+                remaining[cylinder] -= 1
+                now += self._rotational_wait(pending[cylinder].popleft(), now) + self.transfer_ms
+        return self._time_metrics(now)
+
+    def _time_metrics(self, total_ms):
+        n = len(self.requests)
+        total_ms = float(total_ms)
+        return {
+            'service_time_ms': total_ms,
+            'avg_service_time_ms': total_ms / n if n else 0,
+            'iops': n * 1000 / total_ms if total_ms else 0
+        }
+
+
+def add_rotational_results(results, requests, sectors, head_start, disk_size, cost_model=None,
+                           sectors_per_track=DEFAULT_SECTORS_PER_TRACK, cancel_event=None):
+    """
+    Add SATF to a get_all_results() dict and retime every algorithm with rotation
+
+    Args:
+        results (dict): Results keyed by algorithm name (updated in place)
+        requests (list): Cylinder of each request
+        sectors (list): Sector of each request
+        head_start (int): Initial head cylinder
+        disk_size (int): Total number of cylinders
+        cost_model (DiskDriveModel): Drive model shared by all algorithms
+        sectors_per_track (int): Sectors per revolution
+        cancel_event (threading.Event): Stops the work early when set
+
+    Returns:
+        dict: The updated results, with an added 'SATF' entry; None if cancelled
+    """
+    scheduler = SATFScheduler(requests, sectors, head_start, disk_size, cost_model, sectors_per_track)
+    for result in results.values():
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        result.update(scheduler.positioning_metrics(result['sequence']))
+    satf = scheduler.schedule(cancel_event)
+    if satf is None:
+        return None
+    results['SATF'] = satf
+    return results
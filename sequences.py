@@ -0,0 +1,203 @@
+"""
+Compact Sequence Storage for Disk Scheduler
+Run-length encoded seek sequences
+"""
+
+import operator
+from array import array
+from bisect import bisect_right
+from itertools import repeat
+
+import numpy as np
+
+
+class RunLengthSequence:
+    """Seek sequence stored as (cylinder, count) runs of adjacent duplicates
+
+    Cylinders and run lengths live in two int64 arrays, so a schedule that
+    keeps revisiting hot cylinders costs 16 bytes per run instead of one
+    Python int per entry. len() and iteration behave like the expanded
+    sequence; runs() exposes the compact form to consumers that can use it.
+    """
+
+    def __init__(self):
+        self.cylinders = array('q')
+        self.counts = array('q')
+        self._length = 0
+        self._offsets = None
+
+    @classmethod
+    def from_iterable(cls, cylinders):
+        """
+        Compress a sequence of cylinders
+
+        Args:
+            cylinders (iterable): Cylinder numbers in service order
+
+        Returns:
+            RunLengthSequence: Compressed sequence
+        """
+        sequence = cls()
+        for cylinder in cylinders:
+            sequence.append(cylinder)
+        return sequence
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """
+        Compress a sequence delivered in chunks (lists or ndarrays)
+
+        Args:
+            chunks (iterable): Consecutive slices of the sequence
+
+        Returns:
+            RunLengthSequence: Compressed sequence
+        """
+        sequence = cls()
+        for chunk in chunks:
+            sequence.extend(chunk)
+        return sequence
+
+    @classmethod
+    def from_runs(cls, cylinders, counts, length=None):
+        """
+        Wrap existing run arrays without copying them
+
+        Used to expose memory-mapped runs from the on-disk result cache;
+        the result is read-only when the arrays are.
+
+        Args:
+            cylinders (ndarray): Cylinder of each run
+            counts (ndarray): Length of each run
+            length (int): Expanded length when known, so counts is not
+                read (summed) up front
+
+        Returns:
+            RunLengthSequence: Sequence backed by the given arrays
+        """
+        sequence = cls()
+        sequence.cylinders = cylinders
+        sequence.counts = counts
+        sequence._length = int(np.sum(counts, dtype=np.int64)) if length is None else length
+        return sequence
+
+    def append(self, cylinder, count=1):
+        """
+        Add count visits of one cylinder, merging with the last run
+
+        Args:
+            cylinder (int): Cylinder number
+            count (int): Number of consecutive visits
+        """
+        if count <= 0:
+            return
+        if len(self.cylinders) and self.cylinders[-1] == cylinder:
+            self.counts[-1] += count
+        else:
+            self.cylinders.append(cylinder)
+            self.counts.append(count)
+        self._length += count
+        self._offsets = None
+
+    def extend(self, chunk):
+        """
+        Add a slice of the sequence
+
+        Args:
+            chunk (list or ndarray): Consecutive cylinders
+        """
+        values = np.asarray(chunk, dtype=np.int64)
+        if not values.size:
+            return
+
+        # Run boundaries found in one vectorized pass
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(values)) + 1))
+        lengths = np.diff(np.append(starts, values.size))
+        cylinders = values[starts].tolist()
+        counts = lengths.tolist()
+
+        if len(self.cylinders) and self.cylinders[-1] == cylinders[0]:
+            self.counts[-1] += counts[0]
+            cylinders, counts = cylinders[1:], counts[1:]
+        self.cylinders.extend(cylinders)
+        self.counts.extend(counts)
+        self._length += values.size
+        self._offsets = None
+
+    def runs(self):
+        """
+        Iterate over the compact form
+
+        Returns:
+            iterator: (cylinder, count) pairs in order
+        """
+        return zip(self.cylinders, self.counts)
+
+    @property
+    def run_count(self):
+        """Number of runs stored"""
+        return len(self.cylinders)
+
+    @property
+    def nbytes(self):
+        """Bytes used by the run arrays"""
+        return (len(self.cylinders) * self.cylinders.itemsize
+                + len(self.counts) * self.counts.itemsize)
+
+    def seek_count(self):
+        """Total distance between consecutive cylinders (repeats add nothing)"""
+        return int(np.abs(np.diff(np.asarray(self.cylinders, dtype=np.int64))).sum())
+
+    def run_offsets(self):
+        """
+        Position of the first entry of every run in the expanded sequence
+
+        Returns:
+            list: Offsets, one per run
+        """
+        if self._offsets is None:
+            offsets = []
+            position = 0
+            for count in self.counts:
+                offsets.append(position)
+                position += count
+            self._offsets = offsets
+        return self._offsets
+
+    def plot_points(self):
+        """
+        Line vertices that draw the expanded sequence from its runs
+
+        Each run contributes its first and last position at the run's
+        cylinder, so the plot has at most two points per run.
+
+        Returns:
+            tuple: (x_positions, cylinders) lists
+        """
+        x_positions = []
+        cylinders = []
+        for offset, cylinder, count in zip(self.run_offsets(), self.cylinders, self.counts):
+            x_positions.append(offset)
+            cylinders.append(cylinder)
+            if count > 1:
+                x_positions.append(offset + count - 1)
+                cylinders.append(cylinder)
+        return x_positions, cylinders
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for cylinder, count in self.runs():
+            yield from repeat(cylinder, count)
+
+    def __getitem__(self, index):
+        index = operator.index(index)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RunLengthSequence index out of range")
+        return self.cylinders[bisect_right(self.run_offsets(), index) - 1]
+
+    def __repr__(self):
+        return f"RunLengthSequence(runs={self.run_count}, length={self._length})"
@@ -0,0 +1,224 @@
+"""
+Online Disk Scheduling Simulation
+Event-driven simulation of timestamped requests arriving over time
+"""
+
+import heapq
+from collections import deque
+
+from algorithms import WAIT_PERCENTILES, wait_ranks
+from sorted_buckets import SortedBuckets
+
+ONLINE_POLICIES = ('FCFS', 'SCAN', 'C-SCAN', 'LOOK', 'C-LOOK')
+
+# Event kinds (arrivals sort before completions at the same timestamp)
+ARRIVAL = 0
+COMPLETION = 1
+
+
+class OnlineSimulator:
+    """Event-driven disk scheduler for requests with arrival timestamps
+
+    The head services one request at a time. Whenever it becomes idle the
+    policy picks the next request among those that have already arrived;
+    requests arriving while the head is moving wait for the next decision.
+
+    With every request arriving at time 0 the schedule follows the static
+    DiskScheduler methods, including their tie rule: before the head first
+    moves, requests at its position count as lying to its right. Three
+    differences remain by design: the head stops once the queue is empty
+    (DiskScheduler's SCAN and C-SCAN always finish their sweep to the disk
+    end), C-SCAN and C-LOOK moving left sweep the lower half downwards
+    (DiskScheduler.cscan/clook list it in ascending order), and C-LOOK
+    counts the travel from the head to the first request even when all
+    requests lie on one side.
+    """
+
+    def __init__(self, requests, arrival_times, head_start, disk_size, direction='right',
+                 seek_time_per_cylinder=1.0, service_time=0.0):
+        """
+        Initialize the online simulator
+
+        Args:
+            requests (list): Cylinder of each request
+            arrival_times (list): Arrival timestamp of each request
+            head_start (int): Initial head position
+            disk_size (int): Total number of cylinders
+            direction (str): Initial direction ('right' or 'left')
+            seek_time_per_cylinder (float): Time to move the head one cylinder
+            service_time (float): Fixed transfer time per request
+        """
+        if len(requests) != len(arrival_times):
+            raise ValueError("Each request needs exactly one arrival time")
+
+        self.requests = list(requests)
+        self.arrival_times = list(arrival_times)
+        self.head_start = head_start
+        self.disk_size = disk_size
+        self.direction = direction.lower()
+        self.seek_time_per_cylinder = seek_time_per_cylinder
+        self.service_time = service_time
+
+    def simulate(self, policy):
+        """
+        Run the event loop under one scheduling policy
+
+        Args:
+            policy (str): 'FCFS', 'SCAN', 'C-SCAN', 'LOOK' or 'C-LOOK'
+
+        Returns:
+            dict: sequence, seek_count, avg_seek_time, response_times (per
+                request, in input order), avg_response_time,
+                p50/p95/p99_response_time (nearest rank),
+                max_response_time, queue_depth ([(time, depth), ...]),
+                throughput (requests per time unit) and makespan
+        """
+        if policy not in ONLINE_POLICIES:
+            raise ValueError(f"Unknown online policy '{policy}'")
+
+        n = len(self.requests)
+        events = [(self.arrival_times[i], ARRIVAL, i) for i in range(n)]
+        heapq.heapify(events)
+
+        # FCFS keeps arrival order; elevator policies keep (cylinder, id)
+        # sorted, with O(log n) inserts and removals
+        pending = deque() if policy == 'FCFS' else SortedBuckets()
+        position = self.head_start
+        moving_right = self.direction == 'right'
+        busy = False
+        moved = False
+
+        sequence = [self.head_start]
+        seek_count = 0
+        response_times = [0.0] * n
+        queue_depth = [(0.0, 0)]
+        now = 0.0
+
+        while events:
+            now, kind, index = heapq.heappop(events)
+
+            if kind == ARRIVAL:
+                if policy == 'FCFS':
+                    pending.append(index)
+                else:
+                    pending.add((self.requests[index], index))
+            else:
+                response_times[index] = now - self.arrival_times[index]
+                busy = False
+
+            # Dispatch once every event sharing this timestamp has been seen
+            if not busy and pending and (not events or events[0][0] > now):
+                index, distance, stops, moving_right = self._next_request(
+                    policy, pending, position, moving_right, moved
+                )
+                moved = True
+                sequence.extend(stops)
+                position = self.requests[index]
+                seek_count += distance
+                busy = True
+                finish = now + distance * self.seek_time_per_cylinder + self.service_time
+                heapq.heappush(events, (finish, COMPLETION, index))
+
+            if queue_depth[-1][0] == now:
+                queue_depth[-1] = (now, len(pending))
+            else:
+                queue_depth.append((now, len(pending)))
+
+        first_arrival = min(self.arrival_times) if n else 0.0
+        makespan = now - first_arrival if n else 0.0
+
+        ordered = sorted(response_times)
+        ranks = wait_ranks(n)
+        percentiles = {
+            f'p{p}_response_time': ordered[ranks[f'wait_p{p}']] if n else 0
+            for p in WAIT_PERCENTILES
+        }
+
+        return {
+            'sequence': sequence,
+            'seek_count': seek_count,
+            'avg_seek_time': seek_count / n if n else 0,
+            'response_times': response_times,
+            'avg_response_time': sum(response_times) / n if n else 0,
+            **percentiles,
+            'max_response_time': max(response_times) if n else 0,
+            'queue_depth': queue_depth,
+            'throughput': n / makespan if makespan > 0 else 0,
+            'makespan': makespan
+        }
+
+    def simulate_all(self):
+        """
+        Run the simulation for every online policy
+
+        Returns:
+            dict: Simulation results keyed by policy name
+        """
+        return {policy: self.simulate(policy) for policy in ONLINE_POLICIES}
+
+    def _next_request(self, policy, pending, position, moving_right, moved=True):
+        """
+        Remove and return the next request to service
+
+        Args:
+            policy (str): Scheduling policy
+            pending (deque or SortedBuckets): Waiting requests (ids for
+                FCFS, sorted (cylinder, id) pairs otherwise)
+            position (int): Current head position
+            moving_right (bool): Current travel direction
+            moved (bool): Whether the head has serviced a request yet;
+                before that, requests at the head lie to its right
+
+        Returns:
+            tuple: (request_id, seek_distance, visited_cylinders, moving_right)
+        """
+        end = self.disk_size - 1
+
+        if policy == 'FCFS':
+            index = pending.popleft()
+            cylinder = self.requests[index]
+            return index, abs(cylinder - position), [cylinder], moving_right
+
+        # First entry at or above the head / last entry at (once moved) or below it
+        above = pending.first_at_or_above((position, -1))
+        below = pending.last_below((position + 1 if moved else position, -1))
+
+        if policy in ('SCAN', 'LOOK'):
+            if moving_right and above is not None:
+                return self._take(pending, above, above[0] - position, True)
+            if not moving_right and below is not None:
+                return self._take(pending, below, position - below[0], False)
+
+            # Nothing ahead: reverse (SCAN first travels to the disk end)
+            if moving_right:
+                cylinder = below[0]
+                if policy == 'SCAN':
+                    return self._take(pending, below, (end - position) + (end - cylinder), False, [end])
+                return self._take(pending, below, position - cylinder, False)
+            cylinder = above[0]
+            if policy == 'SCAN':
+                return self._take(pending, above, position + cylinder, True, [0])
+            return self._take(pending, above, cylinder - position, True)
+
+        # C-SCAN / C-LOOK service in one direction only and wrap around
+        if moving_right:
+            if above is not None:
+                return self._take(pending, above, above[0] - position, True)
+            lowest = pending[0]
+            if policy == 'C-SCAN':
+                return self._take(pending, lowest, (end - position) + end + lowest[0], True, [end, 0])
+            return self._take(pending, lowest, position - lowest[0], True)
+
+        if below is not None:
+            return self._take(pending, below, position - below[0], False)
+        highest = pending[-1]
+        if policy == 'C-SCAN':
+            return self._take(pending, highest, position + end + (end - highest[0]), False, [0, end])
+        return self._take(pending, highest, highest[0] - position, False)
+
+    @staticmethod
+    def _take(pending, key, distance, moving_right, waypoints=()):
+        """Remove a (cylinder, id) key and describe the move to it"""
+        pending.remove(key)
+        cylinder, index = key
+        return index, distance, list(waypoints) + [cylinder], moving_right
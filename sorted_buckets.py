@@ -0,0 +1,131 @@
+"""
+Bucketed Sorted List
+Sorted multiset (cylinders or (cylinder, id) keys) with O(log n) inserts and removals
+"""
+
+from bisect import bisect_left, insort
+from itertools import chain
+
+# Values per bucket after a split; buckets split once they exceed twice this
+BUCKET_LOAD = 512
+
+
+class SortedBuckets:
+    """Sorted multiset stored as consecutive short sorted buckets
+
+    The maximum of every bucket is kept in a separate list, so an insert
+    or removal bisects the maxima to find its bucket (O(log n)) and then
+    edits only that bucket, shifting at most 2 * BUCKET_LOAD values
+    instead of the whole index. Splitting a full bucket or dropping an
+    empty one only shifts the n / BUCKET_LOAD bucket references.
+    """
+
+    def __init__(self, values=(), load=BUCKET_LOAD):
+        """
+        Initialize the buckets
+
+        Args:
+            values (iterable): Initial values in ascending order
+            load (int): Values per bucket
+        """
+        values = list(values)
+        self._load = load
+        self._buckets = [values[start:start + load] for start in range(0, len(values), load)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._size = len(values)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return chain.from_iterable(self._buckets)
+
+    def __getitem__(self, index):
+        """Value at a position (O(1) for the ends, O(n / BUCKET_LOAD) otherwise)"""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("SortedBuckets index out of range")
+        if index == self._size - 1:
+            return self._maxes[-1]
+        for bucket in self._buckets:
+            if index < len(bucket):
+                return bucket[index]
+            index -= len(bucket)
+
+    def first_at_or_above(self, value):
+        """
+        Smallest stored value >= value
+
+        Returns:
+            object: The value, or None if every stored value is smaller
+        """
+        position = bisect_left(self._maxes, value)
+        if position == len(self._maxes):
+            return None
+        bucket = self._buckets[position]
+        return bucket[bisect_left(bucket, value)]
+
+    def last_below(self, value):
+        """
+        Largest stored value < value
+
+        Returns:
+            object: The value, or None if every stored value is at least as large
+        """
+        position = bisect_left(self._maxes, value)
+        if position < len(self._maxes):
+            bucket = self._buckets[position]
+            index = bisect_left(bucket, value)
+            if index:
+                return bucket[index - 1]
+        if position:
+            return self._buckets[position - 1][-1]
+        return None
+
+    def add(self, value):
+        """Insert one value"""
+        buckets, maxes = self._buckets, self._maxes
+        if not buckets:
+            buckets.append([value])
+            maxes.append(value)
+        else:
+            position = bisect_left(maxes, value)
+            if position == len(maxes):
+                position -= 1
+                buckets[position].append(value)
+                maxes[position] = value
+            else:
+                insort(buckets[position], value)
+
+            bucket = buckets[position]
+            if len(bucket) > 2 * self._load:
+                half = len(bucket) // 2
+                buckets[position:position + 1] = [bucket[:half], bucket[half:]]
+                maxes[position:position + 1] = [bucket[half - 1], bucket[-1]]
+        self._size += 1
+
+    def remove(self, value):
+        """
+        Remove one occurrence of a value
+
+        Raises:
+            ValueError: If the value is not present
+        """
+        buckets, maxes = self._buckets, self._maxes
+        # Earlier buckets only hold smaller values, so the first bucket
+        # whose maximum reaches the value holds its first occurrence
+        position = bisect_left(maxes, value)
+        if position < len(maxes):
+            bucket = buckets[position]
+            index = bisect_left(bucket, value)
+            if bucket[index] == value:
+                del bucket[index]
+                if bucket:
+                    maxes[position] = bucket[-1]
+                else:
+                    del buckets[position]
+                    del maxes[position]
+                self._size -= 1
+                return
+        raise ValueError(f"{value} is not in the index")
@@ -0,0 +1,151 @@
+"""
+Tests for the disk scheduling algorithms
+"""
+
+import random
+
+import pytest
+
+from algorithms import ALGORITHM_NAMES, DiskScheduler, create_scheduler, deadline_order
+
+
+def _random_queues(seed, count=40):
+    """Random (requests, head, disk_size) scenarios, duplicates included"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        disk_size = rng.randint(2, 80)
+        requests = [rng.randrange(disk_size) for _ in range(rng.randint(1, 30))]
+        yield requests, rng.randrange(disk_size), disk_size
+
+
+def test_sstf_textbook_order():
+    scheduler = DiskScheduler([98, 183, 37, 122, 14, 124, 65, 67], 53, 200)
+    result = scheduler.get_result('SSTF')
+    assert result['sequence'] == [53, 65, 67, 37, 14, 98, 122, 124, 183]
+    assert result['seek_count'] == 236
+
+
+@pytest.mark.parametrize('direction, expected', [
+    ('right', [50, 60, 40]),
+    ('left', [50, 40, 60]),
+])
+def test_sstf_breaks_ties_in_travel_direction(direction, expected):
+    scheduler = DiskScheduler([40, 60], 50, 100, direction)
+    assert scheduler.get_result('SSTF')['sequence'] == expected
+
+
+def test_sstf_always_takes_the_closest_request():
+    for requests, head, disk_size in _random_queues(4):
+        sequence = DiskScheduler(requests, head, disk_size).get_result('SSTF')['sequence']
+        pending = list(requests)
+        for position, target in zip(sequence, sequence[1:]):
+            assert abs(target - position) == min(abs(c - position) for c in pending)
+            pending.remove(target)
+
+
+@pytest.mark.parametrize('direction', ['right', 'left'])
+def test_numpy_engine_matches_python_engine(direction):
+    for requests, head, disk_size in _random_queues(1):
+        python = create_scheduler(requests, head, disk_size, direction, engine='python')
+        numpy = create_scheduler(requests, head, disk_size, direction, engine='numpy')
+        for name in ALGORITHM_NAMES:
+            expected = python.get_result(name)
+            result = numpy.get_result(name)
+            assert list(result['sequence']) == expected['sequence'], name
+            assert result['seek_count'] == expected['seek_count'], name
+            assert numpy.get_metrics(name)['seek_count'] == expected['seek_count'], name
+
+
+def _assert_same_schedule(scheduler, requests, head, disk_size, direction='right'):
+    fresh = DiskScheduler(requests, head, disk_size, direction)
+    assert list(scheduler.requests) == requests
+    for name in ALGORITHM_NAMES:
+        assert scheduler.get_metrics(name) == fresh.get_metrics(name), name
+        result, expected = scheduler.get_result(name), fresh.get_result(name)
+        assert list(result['sequence']) == expected['sequence'], name
+        assert result['seek_count'] == expected['seek_count'], name
+
+
+@pytest.mark.parametrize('engine', ['python', 'numpy'])
+def test_request_edits_match_a_fresh_scheduler(engine):
+    rng = random.Random(17)
+    requests = [rng.randrange(100) for _ in range(40)]
+    scheduler = create_scheduler(requests, 50, 100, engine=engine)
+    scheduler.get_all_results()
+
+    for _ in range(30):
+        if requests and rng.random() < 0.4:
+            cylinder = rng.choice(requests)
+            requests.remove(cylinder)
+            scheduler.remove_request(cylinder)
+        else:
+            cylinder = rng.randrange(100)
+            requests.append(cylinder)
+            scheduler.add_request(cylinder)
+    _assert_same_schedule(scheduler, requests, 50, 100)
+
+    assert scheduler.pop_request(3) == requests.pop(3)
+    assert scheduler.pop_request() == requests.pop()
+    _assert_same_schedule(scheduler, requests, 50, 100)
+
+
+@pytest.mark.parametrize('edit', [
+    lambda queue: queue + [1, 99, 50],
+    lambda queue: queue[:5] + queue[12:],
+    lambda queue: queue[:20] + [7, 7],
+    lambda queue: list(reversed(queue)),
+])
+def test_update_requests_matches_a_fresh_scheduler(edit):
+    rng = random.Random(3)
+    requests = [rng.randrange(100) for _ in range(30)]
+    scheduler = DiskScheduler(requests, 50, 100, 'left')
+    scheduler.get_all_results()
+
+    updated = edit(requests)
+    scheduler.update_requests(updated)
+    _assert_same_schedule(scheduler, updated, 50, 100, 'left')
+
+
+def test_large_update_resets_the_scheduler():
+    scheduler = DiskScheduler([1, 2, 3], 0, 10)
+    assert scheduler.update_requests([4, 5, 6, 7], max_edits=2) is False
+    assert scheduler.update_requests([4, 5, 6, 7, 8]) is True
+    _assert_same_schedule(scheduler, [4, 5, 6, 7, 8], 0, 10)
+
+
+def test_removing_a_missing_request_raises():
+    with pytest.raises(ValueError):
+        DiskScheduler([1, 2, 3], 0, 10).remove_request(9)
+
+
+def _deadline_sequence(requests, head, moving_right=True, **kwargs):
+    order = sorted(range(len(requests)), key=lambda i: (requests[i], i))
+    return list(deadline_order(requests, order, head, moving_right, **kwargs))
+
+
+@pytest.mark.parametrize('fifo_batch, expected', [
+    # The oldest request (cylinder 10) is overdue after the first seek and
+    # is taken at the next expiry check, then the sweep resumes from it
+    (1, [60, 10, 61, 62, 63, 64, 65]),
+    (4, [60, 61, 62, 63, 10, 64, 65]),
+])
+def test_deadline_serves_expired_request_at_next_check(fifo_batch, expected):
+    requests = [10, 60, 61, 62, 63, 64, 65]
+    assert _deadline_sequence(requests, 50, expire=5, fifo_batch=fifo_batch) == expected
+
+
+def test_deadline_expires_in_arrival_order():
+    requests = [20, 5, 60, 61, 62]
+    assert _deadline_sequence(requests, 50, expire=5, fifo_batch=1) == [60, 20, 5, 61, 62]
+
+
+def test_deadline_without_expiry_is_one_way_elevator():
+    requests = [10, 60, 30, 90, 55]
+    assert _deadline_sequence(requests, 50, expire=10 ** 6) == [55, 60, 90, 10, 30]
+    assert _deadline_sequence(requests, 50, False, expire=10 ** 6) == [30, 10, 90, 60, 55]
+
+
+def test_anticipatory_takes_close_request_behind_the_head():
+    requests = [48, 90]
+    assert _deadline_sequence(requests, 50, expire=10 ** 6, back_seek_max=5) == [48, 90]
+    assert _deadline_sequence(requests, 50, expire=10 ** 6) == [90, 48]
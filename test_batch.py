@@ -0,0 +1,34 @@
+"""
+Tests for the batch scenario evaluator
+"""
+
+import random
+
+import pytest
+
+from algorithms import ALGORITHM_NAMES, DiskScheduler
+from batch import LEFT, RIGHT, BatchScheduler, make_scenarios
+
+
+def test_evaluate_matches_per_scenario_metrics():
+    rng = random.Random(7)
+    requests = [rng.randrange(100) for _ in range(60)]
+    scenarios = make_scenarios(range(0, 100, 3), ['right', 'left'], [100, 150, 200])
+    results = BatchScheduler(requests).evaluate(scenarios, ALGORITHM_NAMES)
+
+    for row, (head, flag, disk_size) in enumerate(scenarios.tolist()):
+        direction = 'right' if flag == RIGHT else 'left'
+        scheduler = DiskScheduler(requests, head, disk_size, direction)
+        for name in ALGORITHM_NAMES:
+            assert results[name][row] == scheduler.get_metrics(name)['seek_count'], (name, head)
+
+
+def test_evaluate_rejects_head_outside_disk():
+    with pytest.raises(ValueError, match="Head position out of range"):
+        BatchScheduler([10, 20]).evaluate([[150, RIGHT, 100]])
+
+
+def test_make_scenarios_accepts_flags_and_rejects_unknown_directions():
+    assert make_scenarios([5], ['RIGHT', LEFT], [10]).tolist() == [[5, RIGHT, 10], [5, LEFT, 10]]
+    with pytest.raises(ValueError, match="Direction must be"):
+        make_scenarios([5], ['up'], [10])
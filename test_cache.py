@@ -0,0 +1,72 @@
+"""
+Tests for the result caches
+"""
+
+import json
+import os
+
+import numpy as np
+
+from algorithms import ALGORITHM_VERSION, DiskScheduler
+from cache import CACHE_META_FILE, DiskResultCache, ResultCache, scenario_key
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67, 67, 67]
+
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskResultCache(str(tmp_path))
+    results = DiskScheduler(REQUESTS, 53, 200).get_all_results()
+    key = scenario_key(REQUESTS, 53, 200, compact=True)
+    assert cache.get(key) is None
+
+    cache.put(key, results)
+    loaded = DiskResultCache(str(tmp_path)).get(key)
+    assert loaded.keys() == results.keys()
+    for name, result in results.items():
+        assert list(loaded[name]['sequence']) == result['sequence'], name
+        assert len(loaded[name]['sequence']) == len(result['sequence']), name
+        assert loaded[name]['seek_count'] == result['seek_count'], name
+
+
+def test_disk_cache_computes_each_scenario_once(tmp_path):
+    cache = DiskResultCache(str(tmp_path))
+    first = cache.get_all_results(REQUESTS, 53, 200, 'left')
+    second = cache.get_all_results(REQUESTS, 53, 200, 'left')
+    for name, result in first.items():
+        assert second[name]['seek_count'] == result['seek_count'], name
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['entries'] == 1
+
+
+def test_stale_entries_are_dropped_and_pruned(tmp_path):
+    cache = DiskResultCache(str(tmp_path))
+    key = scenario_key(REQUESTS, 53, 200, compact=True)
+    cache.put(key, DiskScheduler(REQUESTS, 53, 200).get_all_results())
+
+    # An entry whose metadata records another version is removed on read
+    meta_path = os.path.join(cache.version_directory, key, CACHE_META_FILE)
+    with open(meta_path) as f:
+        meta = json.load(f)
+    meta['version'] = ALGORITHM_VERSION - 1
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+    assert cache.get(key) is None
+    assert not os.path.exists(os.path.join(cache.version_directory, key))
+
+    # Whole directories of older versions go away on prune()
+    old_version = tmp_path / f"v{ALGORITHM_VERSION - 1}" / key
+    old_version.mkdir(parents=True)
+    assert cache.prune() == 1
+    assert not old_version.exists()
+    assert os.path.isdir(cache.version_directory)
+
+
+def test_memory_cache_accepts_arrays_with_the_python_engine():
+    cache = ResultCache()
+    results = cache.get_all_results(np.array(REQUESTS), 53, 200)
+    expected = DiskScheduler(REQUESTS, 53, 200).get_all_results()
+    for name, result in expected.items():
+        assert results[name]['sequence'] == result['sequence'], name
+        assert results[name]['seek_count'] == result['seek_count'], name
+    assert cache.get_all_results(REQUESTS, 53, 200) is results
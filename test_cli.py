@@ -0,0 +1,20 @@
+"""
+Tests for the headless command-line runner
+"""
+
+import pytest
+
+from cli import run_scenario
+
+
+@pytest.mark.parametrize('requests', [None, 53, {'cylinders': [1, 2]}])
+def test_requests_of_other_types_are_reported(requests):
+    output = run_scenario({'id': 'a', 'requests': requests, 'head_start': 0, 'disk_size': 10})
+    assert output == {'id': 'a', 'error': "Requests must be a string or list of integers"}
+
+
+@pytest.mark.parametrize('requests', ["1, 2 9", [1, 2, 9]])
+def test_requests_as_string_or_list(requests):
+    output = run_scenario({'requests': requests, 'head_start': 0, 'disk_size': 10},
+                          algorithms=('FCFS',))
+    assert output['results']['FCFS']['seek_count'] == 9
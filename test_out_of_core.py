@@ -0,0 +1,42 @@
+"""
+Tests for chunked out-of-core scheduling
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from algorithms import DiskScheduler
+from out_of_core import OUT_OF_CORE_ALGORITHMS, OutOfCoreScheduler
+
+
+@pytest.mark.parametrize('direction', ['right', 'left'])
+def test_matches_in_memory_scheduler(tmp_path, direction):
+    rng = random.Random(12)
+    for case in range(20):
+        disk_size = rng.randint(2, 60)
+        requests = [rng.randrange(disk_size) for _ in range(rng.randint(1, 50))]
+        head = rng.randrange(disk_size)
+
+        path = tmp_path / f'trace{case}.bin'
+        np.asarray(requests, dtype=np.int64).tofile(path)
+        trace = np.memmap(path, dtype=np.int64, mode='r')
+        scheduler = OutOfCoreScheduler(trace, head, disk_size, direction, chunk_size=7)
+        expected = DiskScheduler(requests, head, disk_size, direction)
+
+        for name in OUT_OF_CORE_ALGORITHMS:
+            result = expected.get_result(name)
+            assert list(scheduler.iter_sequence(name)) == result['sequence'], name
+            assert scheduler.get_metrics(name) == expected.get_metrics(name), name
+
+
+def test_rejects_requests_outside_disk():
+    scheduler = OutOfCoreScheduler(np.array([1, 5, 12]), 0, 10, chunk_size=2)
+    with pytest.raises(ValueError, match="Request 12 at index 2 is out of range"):
+        scheduler.get_metrics('LOOK')
+
+
+def test_unsupported_algorithm_is_rejected():
+    with pytest.raises(ValueError, match="not supported out of core"):
+        OutOfCoreScheduler(np.array([1]), 0, 10).get_metrics('SSTF')
@@ -0,0 +1,74 @@
+"""
+Tests for rotational-position-aware scheduling
+"""
+
+import random
+import threading
+
+from cost_models import DiskDriveModel
+from satf import SATFScheduler
+
+
+def _greedy_reference(scheduler):
+    """Service order from scanning every pending request at each step"""
+    table = scheduler.cost_model.lookup_table(scheduler.disk_size)
+    pending = list(range(len(scheduler.requests)))
+    position = scheduler.head_start
+    now = 0.0
+    order = []
+    while pending:
+        def access(request_id):
+            distance = abs(scheduler.requests[request_id] - position)
+            seek = table[distance]
+            return (scheduler._access_time(scheduler.sectors[request_id], seek, now),
+                    distance, request_id)
+        best = min(pending, key=access)
+        now += access(best)[0] + scheduler.transfer_ms
+        position = scheduler.requests[best]
+        pending.remove(best)
+        order.append(best)
+    return order
+
+
+def test_same_cylinder_follows_rotation():
+    scheduler = SATFScheduler([10, 10, 10], [40, 5, 20], 10, 100, start_sector=0)
+    assert scheduler.schedule()['sector_sequence'] == [5, 20, 40]
+
+
+def test_nearby_sector_beats_shorter_seek():
+    # Sector 63 just passed the head, so the request on the head's own
+    # cylinder waits almost a full revolution; the seek to cylinder 70
+    # (about 5.8ms) ends just before sector 48 comes round
+    model = DiskDriveModel(transfer_ms=0.0)
+    scheduler = SATFScheduler([50, 70], [63, 48], 50, 100, model, start_sector=0)
+    result = scheduler.schedule()
+    assert result['sequence'] == [50, 70, 50]
+
+
+def test_same_pass_tie_goes_to_the_shorter_seek():
+    # Both seeks end before sector 63 comes round, so both requests are
+    # reached on the same pass
+    scheduler = SATFScheduler([17, 29], [63, 63], 28, 100, start_sector=0)
+    assert scheduler.schedule()['sequence'] == [28, 29, 17]
+
+
+def test_matches_exhaustive_greedy_choice():
+    rng = random.Random(24)
+    for _ in range(10):
+        disk_size = rng.randint(10, 500)
+        count = rng.randint(1, 25)
+        requests = [rng.randrange(disk_size) for _ in range(count)]
+        sectors = [rng.randrange(16) for _ in range(count)]
+        scheduler = SATFScheduler(requests, sectors, rng.randrange(disk_size), disk_size,
+                                  sectors_per_track=16, start_sector=rng.randrange(16))
+        result = scheduler.schedule()
+        order = _greedy_reference(scheduler)
+        assert result['sequence'][1:] == [requests[i] for i in order]
+        assert result['sector_sequence'] == [sectors[i] for i in order]
+
+
+def test_cancelled_run_returns_none():
+    cancel = threading.Event()
+    cancel.set()
+    scheduler = SATFScheduler([1] * 5000, [0] * 5000, 0, 10)
+    assert scheduler.schedule(cancel) is None
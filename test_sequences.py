@@ -0,0 +1,38 @@
+"""
+Tests for run-length compressed sequences
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import ALGORITHM_NAMES, DiskScheduler
+from sequences import RunLengthSequence
+
+
+def test_chunks_merge_runs_across_boundaries():
+    values = [3, 3, 3, 7, 7, 1, 1, 1, 1, 3]
+    sequence = RunLengthSequence.from_chunks([values[:2], np.array(values[2:4]), values[4:]])
+    assert list(sequence.runs()) == [(3, 3), (7, 2), (1, 4), (3, 1)]
+    assert len(sequence) == len(values)
+    assert list(sequence) == values
+    assert [sequence[i] for i in range(-len(values), len(values))] == values * 2
+    with pytest.raises(IndexError):
+        sequence[len(values)]
+
+
+def test_from_runs_matches_from_iterable():
+    expected = RunLengthSequence.from_iterable([5, 5, 2, 9, 9, 9])
+    sequence = RunLengthSequence.from_runs(np.array([5, 2, 9]), np.array([2, 1, 3]))
+    assert len(sequence) == len(expected)
+    assert list(sequence) == list(expected)
+    assert sequence.seek_count() == expected.seek_count() == 10
+
+
+def test_compact_results_expand_to_full_results():
+    requests = [10, 10, 10, 40, 40, 5, 5, 90, 10, 40] * 20
+    scheduler = DiskScheduler(requests, 30, 100)
+    for name in ALGORITHM_NAMES:
+        expected = scheduler.get_result(name)
+        compact = scheduler.get_result(name, compact=True)
+        assert list(compact['sequence']) == expected['sequence'], name
+        assert compact['seek_count'] == expected['seek_count'], name
@@ -0,0 +1,60 @@
+"""
+Tests for the online simulation engine
+"""
+
+import random
+
+import pytest
+
+from algorithms import DiskScheduler
+from simulation import ONLINE_POLICIES, OnlineSimulator
+
+
+def _static_cases():
+    """Random scenarios with requests on both sides of the head, some at the head"""
+    rng = random.Random(5)
+    for _ in range(60):
+        disk_size = rng.randint(10, 60)
+        head = rng.randrange(1, disk_size)
+        requests = [rng.randrange(head), rng.randrange(head, disk_size), head]
+        requests += [rng.randrange(disk_size) for _ in range(rng.randint(0, 8))]
+        rng.shuffle(requests)
+        yield requests, head, disk_size
+
+
+@pytest.mark.parametrize('policy, direction', [
+    ('FCFS', 'right'), ('FCFS', 'left'),
+    ('SCAN', 'right'), ('SCAN', 'left'),
+    ('LOOK', 'right'), ('LOOK', 'left'),
+    ('C-SCAN', 'right'), ('C-LOOK', 'right'),
+])
+def test_arrivals_at_time_zero_match_static_schedule(policy, direction):
+    for requests, head, disk_size in _static_cases():
+        expected = DiskScheduler(requests, head, disk_size, direction).get_result(policy)
+        simulated = OnlineSimulator(requests, [0] * len(requests), head, disk_size,
+                                    direction).simulate(policy)
+        assert simulated['sequence'] == expected['sequence']
+        assert simulated['seek_count'] == expected['seek_count']
+
+
+def test_request_at_head_waits_for_the_return_sweep_when_moving_left():
+    result = OnlineSimulator([50, 40, 60], [0, 0, 0], 50, 100, 'left').simulate('LOOK')
+    assert result['sequence'] == [50, 40, 50, 60]
+
+
+def test_later_arrival_waits_for_the_next_decision():
+    # 90 arrives while the head travels to 10 and is picked up afterwards
+    result = OnlineSimulator([10, 90, 20], [0, 5, 0], 0, 100).simulate('LOOK')
+    assert result['sequence'] == [0, 10, 20, 90]
+    assert result['response_times'] == [10.0, 85.0, 20.0]
+
+
+@pytest.mark.parametrize('policy', ONLINE_POLICIES)
+def test_every_request_is_serviced_once(policy):
+    rng = random.Random(9)
+    requests = [rng.randrange(200) for _ in range(300)]
+    arrivals = sorted(rng.uniform(0, 3000) for _ in requests)
+    result = OnlineSimulator(requests, arrivals, 100, 200).simulate(policy)
+    assert len(result['response_times']) == len(requests)
+    assert all(time >= 0 for time in result['response_times'])
+    assert result['queue_depth'][-1][1] == 0
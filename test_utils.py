@@ -0,0 +1,26 @@
+"""
+Tests for request queue parsing
+"""
+
+import pytest
+
+from utils import parse_requests, validate_input
+
+
+@pytest.mark.parametrize('text, token', [
+    ("98, 183, -", '-'),
+    ("1,-,2", '-'),
+    ("1,+,2", '+'),
+])
+def test_lone_sign_is_rejected(text, token):
+    with pytest.raises(ValueError, match=rf"only integers \(invalid: \{token}\)"):
+        parse_requests(text)
+
+
+def test_lone_sign_fails_validation():
+    with pytest.raises(ValueError, match="only integers"):
+        validate_input("98, 183, -", "53", "200")
+
+
+def test_signed_integers_still_parse():
+    assert parse_requests("+5, -6,7").tolist() == [5, -6, 7]
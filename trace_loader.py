@@ -0,0 +1,234 @@
+"""
+Trace Loader for Disk Scheduler
+Memory-mapped loading of large binary request traces
+"""
+
+import os
+
+import numpy as np
+
+from utils import find_out_of_range
+from vectorized import VectorizedDiskScheduler
+
+# Default on-disk record layout (little-endian)
+DEFAULT_CYLINDER_DTYPE = '<u4'
+DEFAULT_TIMESTAMP_DTYPE = '<f8'
+
+# Lines converted per chunk by convert_csv_trace
+CSV_CHUNK_LINES = 1000000
+
+
+class Trace:
+    """Cylinder requests (and optional arrival timestamps) of a loaded trace
+
+    For memory-mapped traces both arrays are read-only views of the file;
+    nothing is read until the data is accessed.
+    """
+
+    def __init__(self, cylinders, timestamps=None):
+        """
+        Initialize the trace
+
+        Args:
+            cylinders (ndarray): Cylinder number of each request
+            timestamps (ndarray): Arrival time of each request, or None
+        """
+        self.cylinders = cylinders
+        self.timestamps = timestamps
+
+    def __len__(self):
+        return len(self.cylinders)
+
+    def validate(self, disk_size):
+        """
+        Check that every cylinder lies within the disk
+
+        Args:
+            disk_size (int): Disk size
+
+        Raises:
+            ValueError: If any request is out of range
+        """
+        bad = find_out_of_range(self.cylinders, disk_size)
+        if bad.size:
+            raise ValueError(
+                f"{bad.size} requests out of range (0-{disk_size - 1}), "
+                f"first at index {bad[0]}"
+            )
+
+    def scheduler(self, head_start, disk_size, direction='right'):
+        """
+        Create a vectorized scheduler over the trace without copying it
+
+        Args:
+            head_start (int): Initial head position
+            disk_size (int): Total number of cylinders
+            direction (str): Initial direction ('right' or 'left')
+
+        Returns:
+            VectorizedDiskScheduler: Scheduler reading the trace in place
+        """
+        return VectorizedDiskScheduler(self.cylinders, head_start, disk_size, direction, copy=False)
+
+
+def record_dtype(cylinder_dtype=DEFAULT_CYLINDER_DTYPE, timestamp_dtype=None):
+    """
+    Describe one fixed-width trace record
+
+    Args:
+        cylinder_dtype (str): Cylinder field dtype
+        timestamp_dtype (str): Timestamp field dtype, or None for
+            cylinder-only records
+
+    Returns:
+        numpy.dtype: Record dtype ((timestamp, cylinder) when timestamped)
+    """
+    if timestamp_dtype is None:
+        return np.dtype(cylinder_dtype)
+    return np.dtype([('timestamp', timestamp_dtype), ('cylinder', cylinder_dtype)])
+
+
+def load_binary_trace(path, cylinder_dtype=DEFAULT_CYLINDER_DTYPE, timestamp_dtype=None, offset=0):
+    """
+    Memory-map a binary trace of fixed-width records
+
+    Args:
+        path (str): Trace file path
+        cylinder_dtype (str): Cylinder field dtype (default little-endian uint32)
+        timestamp_dtype (str): Timestamp field dtype when each record is a
+            (timestamp, cylinder) pair, or None for bare cylinder records
+        offset (int): Bytes to skip at the start of the file (header)
+
+    Returns:
+        Trace: Zero-copy read-only views of the records
+
+    Raises:
+        ValueError: If the file size is not a whole number of records
+    """
+    dtype = record_dtype(cylinder_dtype, timestamp_dtype)
+    payload = os.path.getsize(path) - offset
+    if payload % dtype.itemsize:
+        raise ValueError(
+            f"Trace size ({payload} bytes after offset) is not a multiple "
+            f"of the {dtype.itemsize}-byte record size"
+        )
+
+    if payload == 0:
+        # mmap cannot map an empty file
+        records = np.zeros(0, dtype=dtype)
+    else:
+        records = np.memmap(path, dtype=dtype, mode='r', offset=offset)
+
+    if timestamp_dtype is None:
+        return Trace(records)
+    return Trace(records['cylinder'], records['timestamp'])
+
+
+def save_binary_trace(path, cylinders, timestamps=None,
+                      cylinder_dtype=DEFAULT_CYLINDER_DTYPE, timestamp_dtype=DEFAULT_TIMESTAMP_DTYPE):
+    """
+    Write requests as a binary trace readable by load_binary_trace()
+
+    Args:
+        path (str): Output file path
+        cylinders (array-like): Cylinder number of each request
+        timestamps (array-like): Arrival times, or None for a cylinder-only trace
+        cylinder_dtype (str): Cylinder field dtype
+        timestamp_dtype (str): Timestamp field dtype (used with timestamps)
+
+    Raises:
+        ValueError: If a cylinder does not fit in cylinder_dtype
+    """
+    with open(path, 'wb') as f:
+        _write_records(f, cylinders, timestamps, cylinder_dtype, timestamp_dtype)
+
+
+def convert_csv_trace(csv_path, binary_path, cylinder_column=0, timestamp_column=None,
+                      delimiter=',', skip_header=False,
+                      cylinder_dtype=DEFAULT_CYLINDER_DTYPE, timestamp_dtype=DEFAULT_TIMESTAMP_DTYPE):
+    """
+    Convert a CSV trace to a binary trace in bounded memory
+
+    The CSV is read CSV_CHUNK_LINES lines at a time, so dumps larger than
+    RAM can be converted once and then memory-mapped on every later run.
+
+    Args:
+        csv_path (str): Input CSV file
+        binary_path (str): Output binary trace file
+        cylinder_column (int): Column holding the cylinder number
+        timestamp_column (int): Column holding the arrival time, or None
+        delimiter (str): Field delimiter
+        skip_header (bool): Skip the first line
+        cylinder_dtype (str): Output cylinder dtype
+        timestamp_dtype (str): Output timestamp dtype (used with timestamp_column)
+
+    Returns:
+        int: Number of records written
+
+    Raises:
+        ValueError: If a cylinder does not fit in cylinder_dtype
+    """
+    written = 0
+    line_number = 1
+    with open(csv_path, 'r') as src, open(binary_path, 'wb') as dst:
+        if skip_header:
+            next(src, None)
+            line_number += 1
+
+        while True:
+            chunk = _read_lines(src, CSV_CHUNK_LINES)
+            if not chunk:
+                break
+            numbers = [line_number + k for k, line in enumerate(chunk) if line.strip()]
+            lines = [line for line in chunk if line.strip()]
+            line_number += len(chunk)
+            if not lines:
+                continue
+
+            rows = [line.split(delimiter) for line in lines]
+            cylinders = np.array([row[cylinder_column] for row in rows], dtype=np.int64)
+            bad = _first_out_of_dtype(cylinders, cylinder_dtype)
+            if bad is not None:
+                raise ValueError(
+                    f"Line {numbers[bad]}: cylinder {cylinders[bad]} does not fit in {cylinder_dtype}")
+            timestamps = None
+            if timestamp_column is not None:
+                timestamps = np.array([row[timestamp_column] for row in rows], dtype=np.float64)
+
+            _write_records(dst, cylinders, timestamps, cylinder_dtype, timestamp_dtype)
+            written += len(lines)
+
+    return written
+
+
+def _read_lines(f, count):
+    """Read up to count lines from an open text file"""
+    lines = []
+    for line in f:
+        lines.append(line)
+        if len(lines) >= count:
+            break
+    return lines
+
+
+def _first_out_of_dtype(values, dtype):
+    """Index of the first value an integer dtype cannot hold, or None"""
+    info = np.iinfo(dtype)
+    bad = np.flatnonzero((values < info.min) | (values > info.max))
+    return int(bad[0]) if bad.size else None
+
+
+def _write_records(f, cylinders, timestamps, cylinder_dtype, timestamp_dtype):
+    """Append records to an open binary file, refusing cylinders the dtype would wrap"""
+    cylinders = np.asarray(cylinders)
+    bad = _first_out_of_dtype(cylinders, cylinder_dtype)
+    if bad is not None:
+        raise ValueError(f"Cylinder {cylinders[bad]} at record {bad} does not fit in {cylinder_dtype}")
+    if timestamps is None:
+        f.write(cylinders.astype(cylinder_dtype).tobytes())
+        return
+
+    records = np.empty(len(cylinders), dtype=record_dtype(cylinder_dtype, timestamp_dtype))
+    records['cylinder'] = cylinders
+    records['timestamp'] = timestamps
+    f.write(records.tobytes())
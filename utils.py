@@ -3,28 +3,124 @@ Utility Functions for Disk Scheduler
 Validation, formatting, and helper functions
 """
 
-def validate_input(requests_str, head_str, disk_size_str):
+import re
+import warnings
+from itertools import islice
+
+import numpy as np
+
+from profiling import instrument
+from sequences import RunLengthSequence
+
+
+MAX_REPORTED_INDICES = 20
+
+# Entries (or runs) of a sequence shown before the rest is summarized
+MAX_DISPLAYED_STEPS = 1000
+
+
+def parse_requests(requests_str):
+    """
+    Parse a request queue straight into a compact integer array
+
+    Accepts integers separated by commas, whitespace or newlines (pasted
+    traces and file contents alike). Parsing happens in a single C-level
+    pass with no intermediate Python int objects.
+
+    Args:
+        requests_str (str): Request queue text
+
+    Returns:
+        ndarray: int64 array of requests in input order
+
+    Raises:
+        ValueError: If any token is not an integer or does not fit in int64
+    """
+    text = requests_str.replace(',', ' ')
+    if not text or text.isspace():
+        # The C parser reads a bare separator as one zero
+        return np.zeros(0, dtype=np.int64)
+    if _LONE_SIGN.search(text):
+        # The C parser reads a lone '-' as zero and folds '+' or '-' into
+        # the next token instead of rejecting them
+        _raise_invalid_tokens(text)
+    try:
+        # Older NumPy versions warn (instead of raising) on unparsable data
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            requests = np.fromstring(text, dtype=np.int64, sep=' ')
+    except (ValueError, DeprecationWarning):
+        _raise_invalid_tokens(text)
+
+    # Out-of-range values are saturated to the int64 limits, so only
+    # queues containing a limit need their tokens checked
+    limits = np.iinfo(np.int64)
+    if requests.size and (requests.max() == limits.max or requests.min() == limits.min):
+        overflow = [token for token in text.split() if not limits.min <= int(token) <= limits.max]
+        if overflow:
+            shown = ', '.join(overflow[:MAX_REPORTED_INDICES])
+            raise ValueError(f"Requests must fit in a 64-bit integer (invalid: {shown})")
+    return requests
+
+
+# Tokens accepted by NumPy's integer text parser: optional sign, ASCII digits
+_INTEGER_TOKEN = re.compile(r'[+-]?[0-9]+', re.ASCII)
+
+# A sign standing alone between separators
+_LONE_SIGN = re.compile(r'(?<!\S)[+-](?!\S)')
+
+
+def _is_integer(token):
+    """Check whether a token parses as an integer (same rules as parse_requests)"""
+    return _INTEGER_TOKEN.fullmatch(token) is not None
+
+
+def _raise_invalid_tokens(text):
+    """Raise the parse_requests error listing the non-integer tokens of a queue"""
+    invalid = [token for token in text.split() if not _is_integer(token)]
+    shown = ', '.join(invalid[:MAX_REPORTED_INDICES])
+    raise ValueError(f"Request queue must contain only integers (invalid: {shown})")
+
+
+def find_out_of_range(requests, disk_size):
+    """
+    Locate every request outside 0..disk_size-1 with one vectorized pass
+
+    Args:
+        requests (ndarray): Request array
+        disk_size (int): Disk size
+
+    Returns:
+        ndarray: Indices of all offending requests
+    """
+    requests = np.asarray(requests)
+    return np.flatnonzero((requests < 0) | (requests >= disk_size))
+
+
+@instrument()
+def validate_input(requests_str, head_str, disk_size_str, as_array=False):
     """
     Validate user inputs
 
     Args:
-        requests_str (str): Comma-separated request queue
+        requests_str (str): Request queue (comma-, whitespace- or newline-separated)
         head_str (str): Initial head position
         disk_size_str (str): Disk size
+        as_array (bool): Return requests as an int64 ndarray instead of a list
 
     Returns:
-        tuple: (requests_list, head_position, disk_size) or raises ValueError
+        tuple: (requests, head_position, disk_size) or raises ValueError
     """
     errors = []
 
     # Validate request queue
     try:
-        requests = [int(x.strip()) for x in requests_str.split(',') if x.strip()]
-        if not requests:
+        requests = parse_requests(requests_str)
+        if not requests.size:
             errors.append("Request queue cannot be empty")
-    except ValueError:
-        errors.append("Request queue must contain only integers")
-        requests = []
+    except ValueError as e:
+        errors.append(str(e))
+        requests = np.zeros(0, dtype=np.int64)
 
     # Validate head position
     try:
@@ -47,35 +143,138 @@ def validate_input(requests_str, head_str, disk_size_str):
         if head_start < 0 or head_start >= disk_size:
             errors.append(f"Head position must be between 0 and {disk_size - 1}")
 
-        for req in requests:
-            if req < 0 or req >= disk_size:
-                errors.append(f"Request {req} is out of range (0-{disk_size - 1})")
-                break
+        bad = find_out_of_range(requests, disk_size)
+        if bad.size:
+            errors.append(f"Request {requests[bad[0]]} is out of range (0-{disk_size - 1})")
+            if bad.size > 1:
+                shown = ', '.join(str(i) for i in bad[:MAX_REPORTED_INDICES])
+                more = f" and {bad.size - MAX_REPORTED_INDICES} more" if bad.size > MAX_REPORTED_INDICES else ""
+                errors.append(f"{bad.size} requests out of range at indices {shown}{more}")
 
     if errors:
         raise ValueError("\n".join(errors))
 
+    if not as_array:
+        requests = requests.tolist()
     return requests, head_start, disk_size
 
 
-def format_sequence(sequence, max_per_line=10):
+def validate_sectors(sectors_str, request_count, sectors_per_track):
+    """
+    Validate the optional per-request sector list
+
+    Args:
+        sectors_str (str): Sectors (comma-, whitespace- or newline-separated)
+        request_count (int): Number of requests the sectors belong to
+        sectors_per_track (int): Sectors per revolution
+
+    Returns:
+        list: Sectors, or None when the field is blank
+
+    Raises:
+        ValueError: If the sectors are not integers, do not match the
+            request count or are out of range
+    """
+    if not sectors_str.strip():
+        return None
+    try:
+        sectors = parse_requests(sectors_str)
+    except ValueError:
+        raise ValueError("Sectors must contain only integers")
+
+    if sectors.size != request_count:
+        raise ValueError(f"Expected {request_count} sectors (one per request), got {sectors.size}")
+    bad = find_out_of_range(sectors, sectors_per_track)
+    if bad.size:
+        raise ValueError(f"Sector {sectors[bad[0]]} is out of range (0-{sectors_per_track - 1})")
+    return sectors.tolist()
+
+
+def format_sequence(sequence, max_per_line=10, max_items=None):
     """
     Format sequence for display
 
+    Run-length encoded sequences are shown run by run ("82×3" for three
+    consecutive visits) without being expanded.
+
     Args:
-        sequence (list): List of cylinder numbers
-        max_per_line (int): Maximum numbers per line
+        sequence (list, ndarray or RunLengthSequence): Cylinder numbers
+        max_per_line (int): Maximum numbers (or runs) per line
+        max_items (int): Show at most this many numbers (or runs) and
+            summarize the rest as "… N more", or None to show all
 
     Returns:
         str: Formatted sequence string
     """
+    if isinstance(sequence, RunLengthSequence):
+        total = sequence.run_count
+        shown = [f"{cylinder}×{count}" if count > 1 else str(cylinder)
+                 for cylinder, count in islice(sequence.runs(), max_items)]
+    else:
+        total = len(sequence)
+        shown = sequence[:max_items]
+
     result = []
-    for i in range(0, len(sequence), max_per_line):
-        chunk = sequence[i:i + max_per_line]
+    for i in range(0, len(shown), max_per_line):
+        chunk = shown[i:i + max_per_line]
         result.append(" → ".join(map(str, chunk)))
+    if total > len(shown):
+        result.append(f"… {total - len(shown)} more")
     return "\n".join(result)
 
 
+def decimate_minmax(x, y, columns, x_min=None, x_max=None):
+    """
+    Reduce a line to the points that can differ on screen
+
+    The x range is split into one bin per pixel column and each bin keeps
+    only its first, lowest, highest and last point, in their original
+    order. The drawn line then covers exactly the same pixels as the full
+    data while using at most 4 points per column.
+
+    Args:
+        x (array-like): Non-decreasing x positions
+        y (array-like): Values at those positions
+        columns (int): Pixel columns available for the x range
+        x_min (float): Left edge of the visible range (default: first x)
+        x_max (float): Right edge of the visible range (default: last x)
+
+    Returns:
+        tuple: (x, y) ndarrays of the retained points, including one point
+            beyond each edge of the range so the line reaches the borders
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if not x.size:
+        return x, y
+
+    # Visible slice plus one neighbour on each side
+    start = 0 if x_min is None else max(int(np.searchsorted(x, x_min, side='left')) - 1, 0)
+    stop = x.size if x_max is None else min(int(np.searchsorted(x, x_max, side='right')) + 1, x.size)
+    x, y = x[start:stop], y[start:stop]
+    if x.size <= 4 * columns:
+        return x, y
+
+    low, high = float(x[0]), float(x[-1])
+    width = (high - low) or 1.0
+    bins = np.minimum(((x - low) * (columns / width)).astype(np.int64), columns - 1)
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bins)) + 1))
+    ends = np.append(starts[1:], x.size) - 1
+    lengths = ends - starts + 1
+
+    # First position holding each bin's minimum / maximum
+    bin_of = np.repeat(np.arange(starts.size), lengths)
+    keep = [starts, ends]
+    for reduce in (np.minimum, np.maximum):
+        extreme = np.repeat(reduce.reduceat(y, starts), lengths)
+        hits = np.flatnonzero(y == extreme)
+        keep.append(hits[np.unique(bin_of[hits], return_index=True)[1]])
+
+    retained = np.unique(np.concatenate(keep))
+    return x[retained], y[retained]
+
+
 def calculate_statistics(results):
     """
     Calculate statistical summary of results
@@ -108,15 +307,20 @@ def get_algorithm_description(algo_name):
     """
     descriptions = {
         'FCFS': 'Services requests in the order they arrive (simple but inefficient)',
+        'SSTF': 'Always services the closest pending request (may starve far requests)',
         'SCAN': 'Moves head in one direction to disk end, then reverses (Elevator)',
         'C-SCAN': 'Moves to disk end, jumps to start, continues (Circular)',
         'LOOK': 'Like SCAN but reverses at last request (more efficient)',
-        'C-LOOK': 'Like C-SCAN but jumps between requests (most efficient)'
+        'C-LOOK': 'Like C-SCAN but jumps between requests (most efficient)',
+        'DEADLINE': 'One-way elevator in batches; overdue requests go first (no starvation)',
+        'ANTICIPATORY': 'Deadline scheduling that also takes short backward seeks',
+        'SATF': 'Services the request with the shortest seek plus rotational delay'
     }
     return descriptions.get(algo_name, 'Unknown algorithm')
 
 
-def format_result_text(algo_name, result, is_best=False):
+@instrument()
+def format_result_text(algo_name, result, is_best=False, max_steps=MAX_DISPLAYED_STEPS):
     """
     Format algorithm result for text display
 
@@ -124,6 +328,8 @@ def format_result_text(algo_name, result, is_best=False):
         algo_name (str): Algorithm name
         result (dict): Algorithm result
         is_best (bool): Whether this is the best algorithm
+        max_steps (int): Sequence entries shown before summarizing the
+            rest, or None to show the whole sequence
 
     Returns:
         str: Formatted result text
@@ -135,9 +341,16 @@ def format_result_text(algo_name, result, is_best=False):
     text += f"\n{'=' * 60}\n\n"
 
     text += f"Description: {get_algorithm_description(algo_name)}\n\n"
-    text += f"Seek Sequence:\n{format_sequence(result['sequence'])}\n\n"
+    text += f"Seek Sequence:\n{format_sequence(result['sequence'], max_items=max_steps)}\n\n"
     text += f"Total Seek Count: {result['seek_count']} cylinders\n"
     text += f"Average Seek Time: {result['avg_seek_time']:.2f} cylinders/request\n"
+    if 'service_time_ms' in result:
+        text += (f"Est. Service Time: {result['service_time_ms']:.2f} ms "
+                 f"({result['avg_service_time_ms']:.2f} ms/request)\n")
+        text += f"Est. Throughput: {result['iops']:.1f} IOPS\n"
+    if 'wait_max' in result:
+        text += (f"Wait (cylinders travelled): p50 {result['wait_p50']}, p95 {result['wait_p95']}, "
+                 f"p99 {result['wait_p99']}, max {result['wait_max']}\n")
     text += f"Number of Movements: {len(result['sequence']) - 1}\n\n"
 
     return text
@@ -155,12 +368,55 @@ def export_results_to_csv(results, filename='results.csv'):
 
     with open(filename, 'w', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow(['Algorithm', 'Total Seek Count', 'Average Seek Time', 'Sequence Length'])
+        with_cost = all('service_time_ms' in result for result in results.values())
+        header = ['Algorithm', 'Total Seek Count', 'Average Seek Time', 'Sequence Length']
+        with_wait = all('wait_max' in result for result in results.values())
+        if with_cost:
+            header += ['Service Time (ms)', 'IOPS']
+        if with_wait:
+            header += ['Wait p50', 'Wait p95', 'Wait p99', 'Wait Max']
+        writer.writerow(header)
 
         for algo_name, result in results.items():
-            writer.writerow([
+            row = [
                 algo_name,
                 result['seek_count'],
                 f"{result['avg_seek_time']:.2f}",
                 len(result['sequence'])
-            ])
\ No newline at end of file
+            ]
+            if with_cost:
+                row += [f"{result['service_time_ms']:.2f}", f"{result['iops']:.1f}"]
+            if with_wait:
+                row += [result['wait_p50'], result['wait_p95'], result['wait_p99'], result['wait_max']]
+            writer.writerow(row)
+
+
+def export_sequence_to_csv(cylinders, filename='sequence.csv'):
+    """
+    Stream a seek sequence to a CSV file one row at a time
+
+    Accepts any iterable (for example DiskScheduler.iter_sequence()), so
+    long schedules are written without holding them in memory.
+
+    Args:
+        cylinders (iterable): Cylinder numbers in service order
+        filename (str): Output filename
+
+    Returns:
+        int: Total seek distance written
+    """
+    import csv
+
+    from algorithms import SeekAccumulator
+
+    stream = SeekAccumulator(cylinders)
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Step', 'Cylinder', 'Seek Distance', 'Cumulative Seek'])
+
+        previous_total = 0
+        for step, cylinder in enumerate(stream):
+            writer.writerow([step, cylinder, stream.seek_count - previous_total, stream.seek_count])
+            previous_total = stream.seek_count
+
+    return stream.seek_count
@@ -0,0 +1,465 @@
+"""
+Vectorized Disk Scheduling Engine
+NumPy array-backed implementation of FCFS, SSTF, SCAN, C-SCAN, LOOK, C-LOOK,
+DEADLINE and ANTICIPATORY
+"""
+
+from itertools import islice
+
+import numpy as np
+
+from algorithms import DiskScheduler, WAIT_PERCENTILES, validate_sort_backend, wait_ranks
+
+# Elements per block when reducing large arrays piecewise (differences of
+# arrays that are not int64, side extremes before the index is built)
+BLOCK_SIZE = 1 << 20
+
+# 'auto' counting-sort threshold of this engine: bincount + repeat is still
+# slower than np.sort at 2 requests per cylinder (2M on 1M: 0.030s vs
+# 0.024s) and faster from 4 (4M on 1M: 0.043s vs 0.051s)
+NUMPY_COUNTING_SORT_MIN_RATIO = 4
+
+
+def _abs_diff_sum(values):
+    """
+    Sum of absolute differences between consecutive values
+
+    Non-int64 inputs (such as unsigned memory-mapped traces) are widened
+    block by block, so the whole array is never copied at once.
+    """
+    if values.dtype == np.int64:
+        return int(np.abs(np.diff(values)).sum())
+
+    total = 0
+    for start in range(0, values.size - 1, BLOCK_SIZE):
+        block = values[start:start + BLOCK_SIZE + 1].astype(np.int64)
+        total += int(np.abs(np.diff(block)).sum())
+    return total
+
+
+class VectorizedDiskScheduler(DiskScheduler):
+    """Array-backed engine producing the same results as DiskScheduler
+
+    Sequences are returned as int64 ndarrays instead of lists. Seek counts
+    are plain Python ints so results compare and format exactly like the
+    pure-Python engine.
+    """
+
+    counting_sort_min_ratio = NUMPY_COUNTING_SORT_MIN_RATIO
+
+    def __init__(self, requests, head_start, disk_size, direction='right', copy=True,
+                 sort_backend='auto', cost_model=None):
+        """
+        Initialize the vectorized disk scheduler
+
+        Args:
+            requests (array-like): Cylinder requests (list or ndarray)
+            head_start (int): Initial head position
+            disk_size (int): Total number of cylinders
+            direction (str): Initial direction ('right' or 'left')
+            copy (bool): Copy requests into a private int64 array. With
+                copy=False an integer ndarray (e.g. a read-only memory-mapped
+                trace) is used as-is, in its own dtype, without copying
+            sort_backend (str): 'comparison', 'counting', or 'auto' to pick
+                counting sort when requests outnumber cylinders by
+                counting_sort_min_ratio
+            cost_model (CostModel): Optional service time model (see cost_models)
+        """
+        if copy:
+            self.requests = np.array(requests, dtype=np.int64)
+        else:
+            self.requests = np.asarray(requests)
+            if self.requests.dtype.kind not in 'iu':
+                raise ValueError("Requests must be an integer array")
+        self.head_start = int(head_start)
+        self.disk_size = int(disk_size)
+        self.direction = direction.lower()
+        self.sort_backend = validate_sort_backend(sort_backend)
+        self.cost_model = cost_model
+        self._sorted_index = None
+        self._sorted_buckets = None
+        self._fcfs_total = None
+        self._walk_orders = {}
+        # Growable array behind self.requests after add_request()
+        self._buffer = None
+
+    def _build_index(self):
+        """
+        Sort the requests into (left, right) halves
+
+        Returns:
+            tuple: (left, right) ascending array views of requests below /
+                at-or-above head
+        """
+        if self._use_counting_sort():
+            # O(n + disk_size): count per cylinder, expand the runs
+            counts = np.bincount(self.requests, minlength=self.disk_size)
+            ordered = np.repeat(np.arange(counts.size, dtype=np.int64), counts)
+        else:
+            # Sorting needs a copy anyway; make it int64 so seek arithmetic
+            # on narrow or unsigned trace dtypes cannot wrap around
+            ordered = self.requests.astype(np.int64)
+            ordered.sort()
+        split = int(np.searchsorted(ordered, self.head_start, side='left'))
+        return ordered[:split], ordered[split:]
+
+    def _flatten(self, half):
+        """Flat sorted half as an int64 array"""
+        return np.fromiter(half, dtype=np.int64, count=len(half))
+
+    def _bucket_values(self, half):
+        """Values of a flat sorted half as Python ints"""
+        return half.tolist()
+
+    def _extremes(self):
+        """
+        Find the smallest and largest request on each side of the head
+
+        Without a sorted index the requests are reduced block by block with
+        masked min/max, so only one block-sized mask is allocated and a
+        memory-mapped trace is read but never copied.
+
+        Returns:
+            tuple: (left_min, left_max, right_min, right_max); None for an empty side
+        """
+        if self._sorted_index is None and self._sorted_buckets is not None:
+            return super()._extremes()
+        if self._sorted_index is not None:
+            left, right = self._sorted_index
+            return (int(left[0]) if left.size else None, int(left[-1]) if left.size else None,
+                    int(right[0]) if right.size else None, int(right[-1]) if right.size else None)
+
+        info = np.iinfo(self.requests.dtype)
+        extremes = [None, None, None, None]
+        for start in range(0, self.requests.size, BLOCK_SIZE):
+            block = self.requests[start:start + BLOCK_SIZE]
+            below = block < self.head_start
+            for offset, mask in ((0, below), (2, ~below)):
+                if not mask.any():
+                    continue
+                low = int(block.min(where=mask, initial=info.max))
+                high = int(block.max(where=mask, initial=info.min))
+                if extremes[offset] is None:
+                    extremes[offset:offset + 2] = low, high
+                else:
+                    extremes[offset] = min(extremes[offset], low)
+                    extremes[offset + 1] = max(extremes[offset + 1], high)
+        return tuple(extremes)
+
+    def _walk_seek(self, cylinders):
+        """Total seek distance from the head over an array of serviced cylinders"""
+        if not cylinders.size:
+            return 0
+        return abs(int(cylinders[0]) - self.head_start) + _abs_diff_sum(cylinders)
+
+    def _materialize(self, cylinders):
+        """Store an iterable of serviced cylinders as an int64 array"""
+        return np.fromiter(cylinders, dtype=np.int64, count=self.requests.size)
+
+    def _append_request(self, cylinder):
+        """Append in amortized O(1) by doubling a private int64 buffer"""
+        size = self.requests.size
+        if self._buffer is None or size == self._buffer.size:
+            buffer = np.empty(max(2 * size, 16), dtype=np.int64)
+            buffer[:size] = self.requests
+            self._buffer = buffer
+        self._buffer[size] = cylinder
+        self.requests = self._buffer[:size + 1]
+
+    def _delete_request(self, index):
+        if index == self.requests.size - 1:
+            # Dropping the tail is a view and keeps the append buffer valid
+            self.requests = self.requests[:-1]
+        else:
+            self.requests = np.delete(self.requests, index)
+            self._buffer = None
+
+    def _reset_requests(self, requests):
+        self.requests = np.array(requests, dtype=np.int64)
+        self._buffer = None
+
+    def _request_index(self, cylinder):
+        matches = np.flatnonzero(self.requests == cylinder)
+        if not matches.size:
+            raise ValueError(f"{cylinder} is not in the request queue")
+        return int(matches[0])
+
+    def _common_prefix_length(self, requests):
+        """Number of leading requests shared with another queue"""
+        requests = np.asarray(requests)
+        length = min(self.requests.size, requests.size)
+        mismatches = np.flatnonzero(self.requests[:length] != requests[:length])
+        return int(mismatches[0]) if mismatches.size else length
+
+    def _same_requests(self, a, b):
+        return np.array_equal(a, b)
+
+    def _splice_requests(self, start, stop, values):
+        self.requests = np.concatenate([self.requests[:start].astype(np.int64, copy=False),
+                                        np.asarray(values, dtype=np.int64).reshape(-1),
+                                        self.requests[stop:].astype(np.int64, copy=False)])
+        self._buffer = None
+
+    def _reversed(self, half):
+        """Descending view of a sorted half (no copy)"""
+        return half[::-1]
+
+    def iter_sequence(self, algo_name):
+        """
+        Lazily yield the seek sequence of one algorithm as Python ints
+
+        Args:
+            algo_name (str): Algorithm name (see ALGORITHM_NAMES)
+
+        Yields:
+            int: Cylinder numbers, starting with the head position
+        """
+        for chunk in self.iter_sequence_chunks(algo_name):
+            yield from chunk.tolist()
+
+    def iter_sequence_chunks(self, algo_name, chunk_size=65536):
+        """
+        Lazily yield the seek sequence of one algorithm in array chunks
+
+        Chunks of the sorted index are views, so no part of the sequence is
+        copied. Chunks never span two parts of the schedule and may
+        therefore be shorter than chunk_size.
+
+        Args:
+            algo_name (str): Algorithm name (see ALGORITHM_NAMES)
+            chunk_size (int): Maximum number of cylinders per chunk
+
+        Yields:
+            ndarray: Consecutive integer slices of the sequence
+        """
+        for part in self._sequence_parts(algo_name):
+            if isinstance(part, np.ndarray):
+                for start in range(0, part.size, chunk_size):
+                    yield part[start:start + chunk_size]
+            elif isinstance(part, list):
+                yield np.array(part, dtype=np.int64)
+            else:
+                while True:
+                    chunk = np.fromiter(islice(part, chunk_size), dtype=np.int64)
+                    if not chunk.size:
+                        break
+                    yield chunk
+
+    def _sequence(self, *parts):
+        """Concatenate head position and cylinder parts into one sequence array"""
+        pieces = [np.array([self.head_start], dtype=np.int64)]
+        for part in parts:
+            pieces.append(np.asarray(part, dtype=np.int64).reshape(-1))
+        return np.concatenate(pieces)
+
+    def _result(self, sequence, seek_count):
+        """Build a result dict in the same format as DiskScheduler"""
+        n = self.requests.size
+        seek_count = int(seek_count)
+        return {
+            'sequence': sequence,
+            'seek_count': seek_count,
+            'avg_seek_time': seek_count / n if n else 0
+        }
+
+    def fcfs(self):
+        """
+        First Come First Serve (FCFS) Algorithm
+        Services requests in the order they arrive
+
+        Returns:
+            dict: Contains sequence (ndarray), seek_count, and avg_seek_time
+        """
+        sequence = self._sequence(self.requests)
+        seek_count = np.abs(np.diff(sequence)).sum()
+        return self._result(sequence, seek_count)
+
+    def _sstf_halves(self):
+        """Sorted halves as Python lists; the SSTF walk is inherently sequential"""
+        left, right = self._partition()
+        return left.tolist(), right.tolist()
+
+    def sstf(self):
+        """
+        Shortest Seek Time First (SSTF) Algorithm
+        Always services the pending request closest to the head
+
+        Returns:
+            dict: Contains sequence (ndarray), seek_count, and avg_seek_time
+        """
+        sequence = self._sequence(self._walk_order('SSTF'))
+        seek_count = np.abs(np.diff(sequence)).sum()
+        return self._result(sequence, seek_count)
+
+    def _deadline_inputs(self):
+        """Arrival-order list and stable cylinder order (the walk itself is sequential)"""
+        return self.requests.tolist(), np.argsort(self.requests, kind='stable').tolist()
+
+    def deadline(self):
+        """
+        Deadline Algorithm
+        One-way elevator in batches; overdue requests are serviced first
+
+        Returns:
+            dict: Contains sequence (ndarray), seek_count, and avg_seek_time
+        """
+        sequence = self._sequence(self._walk_order('DEADLINE'))
+        return self._result(sequence, np.abs(np.diff(sequence)).sum())
+
+    def anticipatory(self):
+        """
+        Anticipatory Algorithm
+        Deadline scheduling that also takes short backward seeks
+
+        Returns:
+            dict: Contains sequence (ndarray), seek_count, and avg_seek_time
+        """
+        sequence = self._sequence(self._walk_order('ANTICIPATORY'))
+        return self._result(sequence, np.abs(np.diff(sequence)).sum())
+
+    def get_latency(self, algo_name, result=None):
+        """
+        Tail latency of one algorithm's schedule (see algorithms.wait_metrics)
+
+        Args:
+            algo_name (str): Algorithm name (see ALGORITHM_NAMES)
+            result (dict): Result whose ndarray sequence is used instead of
+                building the schedule again
+
+        Returns:
+            dict: wait_p50, wait_p95, wait_p99 and wait_max in cylinders travelled
+        """
+        sequence = None if result is None else result.get('sequence')
+        if not isinstance(sequence, np.ndarray):
+            sequence = np.concatenate(list(self.iter_sequence_chunks(algo_name)))
+        visits = sequence[1:]
+        travelled = np.cumsum(np.abs(np.diff(sequence.astype(np.int64))))
+
+        if visits.size != self.requests.size:
+            # Only the first k visits to a cylinder with k requests are services
+            left, right = self._partition()
+            ordered = np.concatenate([left, right])
+            order = np.argsort(visits, kind='stable')
+            values = visits[order]
+            occurrence = np.arange(values.size) - np.searchsorted(values, values, side='left')
+            requested = (np.searchsorted(ordered, values, side='right')
+                         - np.searchsorted(ordered, values, side='left'))
+            serviced = np.empty(visits.size, dtype=bool)
+            serviced[order] = occurrence < requested
+            travelled = travelled[serviced]
+
+        if not travelled.size:
+            waits = {f'wait_p{p}': 0 for p in WAIT_PERCENTILES}
+            waits['wait_max'] = 0
+            return waits
+        waits = {name: int(travelled[rank]) for name, rank in wait_ranks(travelled.size).items()}
+        waits['wait_max'] = int(travelled[-1])
+        return waits
+
+    def scan(self):
+        """
+        SCAN (Elevator) Algorithm
+        Moves in one direction to disk end, then reverses
+
+        Returns:
+            dict: Contains sequence (ndarray), seek_count, and avg_seek_time
+        """
+        left, right = self._partition()
+        end = self.disk_size - 1
+
+        if self.direction == 'right':
+            sequence = self._sequence(right, end, left[::-1])
+            seek_count = end - self.head_start
+            if left.size:
+                seek_count += end - left[0]
+        else:
+            sequence = self._sequence(left[::-1], 0, right)
+            seek_count = self.head_start
+            if right.size:
+                seek_count += right[-1]
+
+        return self._result(sequence, seek_count)
+
+    def cscan(self):
+        """
+        C-SCAN (Circular SCAN) Algorithm
+        Moves in one direction to end, jumps to start, continues
+
+        Returns:
+            dict: Contains sequence (ndarray), seek_count, and avg_seek_time
+        """
+        left, right = self._partition()
+        end = self.disk_size - 1
+
+        if self.direction == 'right':
+            sequence = self._sequence(right, end, 0, left)
+            seek_count = (end - self.head_start) + end
+            if left.size:
+                seek_count += left[-1]
+        else:
+            sequence = self._sequence(left, 0, end, right)
+            seek_count = self.head_start + end
+            if right.size:
+                seek_count += end - right[0]
+
+        return self._result(sequence, seek_count)
+
+    def look(self):
+        """
+        LOOK Algorithm
+        Like SCAN but reverses at last request (not disk end)
+
+        Returns:
+            dict: Contains sequence (ndarray), seek_count, and avg_seek_time
+        """
+        left, right = self._partition()
+        seek_count = 0
+
+        if self.direction == 'right':
+            sequence = self._sequence(right, left[::-1])
+            if right.size:
+                seek_count = right[-1] - self.head_start
+                if left.size:
+                    seek_count += right[-1] - left[0]
+            elif left.size:
+                seek_count = self.head_start - left[0]
+        else:
+            sequence = self._sequence(left[::-1], right)
+            if left.size:
+                seek_count = self.head_start - left[0]
+                if right.size:
+                    seek_count += right[-1] - left[0]
+            elif right.size:
+                seek_count = right[-1] - self.head_start
+
+        return self._result(sequence, seek_count)
+
+    def clook(self):
+        """
+        C-LOOK Algorithm
+        Like C-SCAN but jumps from last request to first (not disk ends)
+
+        Returns:
+            dict: Contains sequence (ndarray), seek_count, and avg_seek_time
+        """
+        left, right = self._partition()
+        seek_count = 0
+
+        if self.direction == 'right':
+            sequence = self._sequence(right, left)
+            if right.size:
+                seek_count = right[-1] - self.head_start
+                if left.size:
+                    seek_count += (right[-1] - left[0]) + (left[-1] - left[0])
+            elif left.size:
+                seek_count = left[-1] - left[0]
+        else:
+            sequence = self._sequence(left, right)
+            if left.size:
+                seek_count = self.head_start - left[-1]
+                if right.size:
+                    seek_count += (right[-1] - left[-1]) + (right[-1] - right[0])
+            elif right.size:
+                seek_count = right[-1] - right[0]
+
+        return self._result(sequence, seek_count)